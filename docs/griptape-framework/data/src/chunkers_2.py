@@ -0,0 +1,9 @@
+import io
+
+from griptape.chunkers import TextChunker
+
+# any text stream or iterable of lines works, e.g. a file opened with `open()`
+stream = io.StringIO("A long line of logs.\n" * 10_000)
+
+for chunk in TextChunker(max_tokens=100).chunk_iter(stream):
+    print(chunk.value)
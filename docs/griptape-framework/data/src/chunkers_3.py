@@ -0,0 +1,12 @@
+from pathlib import Path
+
+from griptape.chunkers import ChunkingPool, TextChunker
+from griptape.loaders import TextLoader
+
+if __name__ == "__main__":
+    paths = list(Path("docs").rglob("*.md"))
+
+    with ChunkingPool(chunker=TextChunker(max_tokens=500)) as pool:
+        chunks = pool.chunk_collection(TextLoader().load_collection(paths))
+
+    print(sum(len(c) for c in chunks.values()))
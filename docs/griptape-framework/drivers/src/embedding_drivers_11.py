@@ -0,0 +1,9 @@
+from griptape.drivers.embedding.cached import CachedEmbeddingDriver
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+
+embedding_driver = CachedEmbeddingDriver(embedding_driver=OpenAiEmbeddingDriver(), persist_file="embeddings.db")
+
+embedding_driver.embed_string("Hello Griptape!")
+embedding_driver.embed_string("Hello Griptape!")
+
+print(f"hits: {embedding_driver.hits}, misses: {embedding_driver.misses}")
@@ -0,0 +1,11 @@
+from concurrent import futures
+
+from griptape.drivers.embedding.coalescing import CoalescingEmbeddingDriver
+from griptape.drivers.embedding.openai import OpenAiEmbeddingDriver
+
+embedding_driver = CoalescingEmbeddingDriver(embedding_driver=OpenAiEmbeddingDriver(), batch_window=0.05)
+
+with futures.ThreadPoolExecutor() as executor:
+    embeddings = list(executor.map(embedding_driver.embed_string, ["Hello", "Griptape", "!"]))
+
+print(len(embeddings))
@@ -0,0 +1,9 @@
+from griptape.tokenizers import AnthropicTokenizer
+
+tokenizer = AnthropicTokenizer(model="claude-3-opus-20240229", count_mode="local")
+
+# Estimated offline, without calling Anthropic's token counting API.
+print(tokenizer.count_tokens("Hello world!"))
+
+# Exact count from the API for this call only.
+print(tokenizer.count_tokens("Hello world!", count_mode="remote"))
@@ -3,6 +3,7 @@ from .base_chunker import BaseChunker
 from .text_chunker import TextChunker
 from .pdf_chunker import PdfChunker
 from .markdown_chunker import MarkdownChunker
+from .chunking_pool import ChunkingPool
 
 
-__all__ = ["ChunkSeparator", "BaseChunker", "TextChunker", "PdfChunker", "MarkdownChunker"]
+__all__ = ["ChunkSeparator", "BaseChunker", "TextChunker", "PdfChunker", "MarkdownChunker", "ChunkingPool"]
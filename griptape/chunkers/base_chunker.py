@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import bisect
 from abc import ABC
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from attrs import Attribute, Factory, define, field
 
@@ -9,10 +10,14 @@ from griptape.artifacts import ListArtifact, TextArtifact
 from griptape.chunkers import ChunkSeparator
 from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
 
 @define
 class BaseChunker(ABC):
     DEFAULT_SEPARATORS = [ChunkSeparator(" ")]
+    DEFAULT_BUFFER_SIZE = 64 * 1024
 
     separators: list[ChunkSeparator] = field(
         default=Factory(lambda self: self.DEFAULT_SEPARATORS, takes_self=True),
@@ -36,78 +41,270 @@ class BaseChunker(ABC):
         text_to_chunk = text if isinstance(text, str) else text.to_text()
         reference = None if isinstance(text, str) else text.reference
 
-        return [TextArtifact(c, reference=reference) for c in self._chunk_recursively(text_to_chunk)]
+        return [TextArtifact(c, reference=reference) for c in self._chunk_text(text_to_chunk)]
+
+    def chunk_many(self, texts: Sequence[TextArtifact | ListArtifact | str]) -> list[list[TextArtifact]]:
+        return [self.chunk(text) for text in texts]
+
+    def chunk_iter(
+        self,
+        source: TextArtifact | ListArtifact | str | Iterable[str],
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> Iterator[TextArtifact]:
+        """Lazily chunks text that is read incrementally from `source`.
 
-    def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
-        token_count = self.tokenizer.count_tokens(chunk)
-        half_token_count = token_count // 2
+        Text is buffered until it reaches `buffer_size` characters. The buffer is then chunked, every chunk but the
+        last is yielded, and the last chunk is carried over to the next buffer so that chunks don't end at buffer
+        boundaries. If the whole source fits in one buffer, the chunks are the same as the ones from `chunk`.
 
-        if token_count <= self.max_tokens:
-            return [chunk]
+        Args:
+            source: Text to chunk. Can be a string, an Artifact, a text stream, or an iterable of lines.
+            buffer_size: Number of characters buffered before chunks are yielded.
+
+        Yields:
+            Chunks in the order they appear in `source`.
+        """
+        if isinstance(source, (TextArtifact, ListArtifact)):
+            reference = source.reference
+            source = source.to_text()
         else:
-            # If a separator is provided, only use separators after it.
-            separators = (
-                self.separators[self.separators.index(current_separator) :] if current_separator else self.separators
-            )
-
-            # Loop through available separators to find the best split.
-            for separator in separators:
-                # Split the chunk into subchunks using the current separator.
-                subchunks = chunk.strip().split(separator.value)
-
-                # We should not operate on the filtered, non-empty subchunks because the joins will be incorrect.
-                # However, we only want to process chunks that have multiple non-empty subchunks.
-                # Therefore, we use the non-empty subchunks to decide if we should proceed, but we operate on the original subchunks.
-                non_empty_subchunks = list(filter(None, subchunks))
-
-                if len(non_empty_subchunks) > 1:
-                    # Find what combination of subchunks results in the most balanced split of the chunk.
-                    midpoint_index = self.__find_midpoint_index(subchunks, half_token_count)
-
-                    # Create the two subchunks based on the best separator.
-                    first_subchunk, second_subchunk = self.__get_subchunks(separator, subchunks, midpoint_index)
-
-                    # Continue recursively chunking the subchunks.
-                    first_subchunk_rec = self._chunk_recursively(first_subchunk.strip(), separator)
-                    second_subchunk_rec = self._chunk_recursively(second_subchunk.strip(), separator)
-
-                    # Return the concatenated results of the subchunks if both are non-empty.
-                    if first_subchunk_rec and second_subchunk_rec:
-                        return first_subchunk_rec + second_subchunk_rec
-                    # If only one subchunk is non-empty, return it.
-                    elif first_subchunk_rec:
-                        return first_subchunk_rec
-                    elif second_subchunk_rec:
-                        return second_subchunk_rec
-                    else:
-                        return []
-            # If none of the separators result in a balanced split, split the chunk in half.
-            midpoint = len(chunk) // 2
-            return self._chunk_recursively(chunk[:midpoint]) + self._chunk_recursively(chunk[midpoint:])
-
-    def __get_subchunks(self, separator: ChunkSeparator, subchunks: list[str], balance_index: int) -> tuple[str, str]:
-        # Create the two subchunks based on the best separator
-        if separator.is_prefix:
-            first_subchunk = separator.value.join(subchunks[: balance_index + 1])
-            # We need to manually prepend the separator since join doesn't add it to the first element.
-            second_subchunk = separator.value + separator.value.join(subchunks[balance_index + 1 :])
+            reference = None
+
+        if isinstance(source, str):
+            pieces = (source[i : i + buffer_size] for i in range(0, len(source), buffer_size))
+        elif hasattr(source, "read"):
+            pieces = iter(lambda: source.read(buffer_size), "")  # pyright: ignore[reportAttributeAccessIssue]
         else:
-            # We need to manually append the separator since join doesn't add it to the last element.
-            first_subchunk = separator.value.join(subchunks[: balance_index + 1]) + separator.value
-            second_subchunk = separator.value.join(subchunks[balance_index + 1 :])
+            pieces = source
+
+        buffer = []
+        buffer_length = 0
+        next_buffer_length = buffer_size
+
+        for piece in pieces:
+            buffer.append(piece)
+            buffer_length += len(piece)
+
+            if buffer_length >= next_buffer_length:
+                text = "".join(buffer)
+                spans = self._chunk_spans(text)
+
+                for start, end in spans[:-1]:
+                    yield TextArtifact(text[start:end], reference=reference)
+
+                buffer = [text[spans[-1][0] :]] if spans else []
+                buffer_length = len(buffer[0]) if buffer else 0
+                next_buffer_length = buffer_length + buffer_size
+
+        text = "".join(buffer)
+
+        if text:
+            for start, end in self._chunk_spans(text):
+                yield TextArtifact(text[start:end], reference=reference)
+
+    def _chunk_text(self, text: str) -> list[str]:
+        return [text[start:end] for start, end in self._chunk_spans(text)]
+
+    def _chunk_spans(self, text: str) -> list[tuple[int, int]]:
+        """Splits text into chunks of at most `max_tokens` tokens and returns their start and end indices.
+
+        The text is tokenized once and every candidate split point is mapped to a token offset. Segments are then
+        packed into evenly sized chunks without re-tokenizing prefixes, using the first separator that splits a span
+        into multiple non-empty parts and falling back to later separators for segments that don't fit on their own.
+        Every chunk is counted once more to verify it fits, since token offsets are estimates at chunk boundaries.
+        """
+        offsets = self.tokenizer.token_offsets(text)
+
+        if offsets is None:
+            # Without token offsets, assume the tokens are spread evenly over the text and verify every chunk.
+            token_count = self.tokenizer.count_tokens(text)
+            offsets = [i * len(text) // token_count for i in range(token_count)]
+
+        if len(offsets) <= self.max_tokens:
+            return [(0, len(text))]
+
+        chunks = []
+
+        self.__chunk_span(text, offsets, 0, len(text), 0, chunks)
+
+        return chunks
+
+    def __chunk_span(
+        self, text: str, offsets: list[int], start: int, end: int, separator_index: int, chunks: list[tuple[int, int]]
+    ) -> None:
+        start, end = self.__strip_span(text, start, end)
+
+        for index in range(separator_index, len(self.separators)):
+            cuts = self.__find_cuts(text, start, end, self.separators[index])
+
+            # Only use separators that split the span into multiple non-empty parts.
+            if cuts is not None:
+                self.__pack_segments(text, offsets, cuts, index, chunks)
+
+                return
+
+        # If none of the separators split the span, split it by tokens.
+        self.__split_tokens(text, offsets, start, end, chunks)
+
+    def __pack_segments(
+        self, text: str, offsets: list[int], cuts: list[int], separator_index: int, chunks: list[tuple[int, int]]
+    ) -> None:
+        first = 0
+
+        while first < len(cuts) - 1:
+            if self.__count_span(offsets, cuts[first], cuts[first + 1]) > self.max_tokens:
+                # The segment doesn't fit on its own, so it's chunked with the next separators.
+                self.__chunk_span(text, offsets, cuts[first], cuts[first + 1], separator_index, chunks)
+
+                first += 1
+            else:
+                last = first + 1
+
+                while (
+                    last < len(cuts) - 1 and self.__count_span(offsets, cuts[last], cuts[last + 1]) <= self.max_tokens
+                ):
+                    last += 1
+
+                self.__pack_run(text, offsets, cuts[first : last + 1], separator_index, chunks)
+
+                first = last
+
+    def __pack_run(
+        self, text: str, offsets: list[int], cuts: list[int], separator_index: int, chunks: list[tuple[int, int]]
+    ) -> None:
+        """Packs consecutive segments that each fit in `max_tokens` into as few, evenly sized chunks as possible."""
+        # A first greedy pass only counts the chunks, so that the second pass can aim for equally sized chunks.
+        chunk_count = 0
+        first = 0
+
+        while first < len(cuts) - 1:
+            first = self.__extend_chunk(offsets, cuts, first, self.max_tokens)
+            chunk_count += 1
+
+        first = 0
+
+        while first < len(cuts) - 1:
+            remaining_tokens = self.__count_span(offsets, cuts[first], cuts[-1])
+            target_tokens = -(-remaining_tokens // max(chunk_count, 1))
+            last = self.__fit_segments(text, cuts, first, self.__extend_chunk(offsets, cuts, first, target_tokens))
+
+            if last == first:
+                # The estimate was off and the segment doesn't fit on its own after all.
+                self.__chunk_span(text, offsets, cuts[first], cuts[first + 1], separator_index, chunks)
+
+                last = first + 1
+            else:
+                start, end = self.__strip_span(text, cuts[first], cuts[last])
+
+                if end > start:
+                    chunks.append((start, end))
+
+            chunk_count -= 1
+            first = last
+
+    def __extend_chunk(self, offsets: list[int], cuts: list[int], first: int, target_tokens: int) -> int:
+        """Returns the cut that ends a chunk starting at `first` with the token count closest to `target_tokens`.
+
+        The chunk always has at least one segment and never exceeds `max_tokens` by its estimated token count.
+        """
+        last = first + 1
+        tokens = self.__count_span(offsets, cuts[first], cuts[last])
+
+        while last < len(cuts) - 1 and tokens < target_tokens:
+            next_tokens = self.__count_span(offsets, cuts[first], cuts[last + 1])
+
+            if next_tokens > self.max_tokens or next_tokens - target_tokens > target_tokens - tokens:
+                break
+
+            last += 1
+            tokens = next_tokens
+
+        return last
+
+    def __fit_segments(self, text: str, cuts: list[int], first: int, last: int) -> int:
+        """Returns the last cut, at most `last`, whose chunk fits in `max_tokens` according to the tokenizer.
+
+        Token offsets are computed on the whole text, so estimates can be off by a token or two at chunk boundaries.
+        """
+        if self.tokenizer.count_tokens(text[cuts[first] : cuts[last]].strip()) <= self.max_tokens:
+            return last
+
+        low = first
+        high = last - 1
+
+        while low < high:
+            middle = (low + high + 1) // 2
+
+            if self.tokenizer.count_tokens(text[cuts[first] : cuts[middle]].strip()) <= self.max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+
+        return low
+
+    def __split_tokens(
+        self, text: str, offsets: list[int], start: int, end: int, chunks: list[tuple[int, int]]
+    ) -> None:
+        position = start
+
+        while position < end:
+            next_index = bisect.bisect_left(offsets, position) + self.max_tokens
+            next_position = min(offsets[next_index], end) if next_index < len(offsets) else end
+            next_position = max(next_position, position + 1)
+
+            while (
+                next_position - position > 1
+                and self.tokenizer.count_tokens(text[position:next_position]) > self.max_tokens
+            ):
+                next_position = position + (next_position - position) // 2
+
+            chunks.append((position, next_position))
+
+            position = next_position
+
+    def __find_cuts(self, text: str, start: int, end: int, separator: ChunkSeparator) -> Optional[list[int]]:
+        """Returns the positions the span is cut at by `separator`, or `None` if it has fewer than two non-empty parts.
+
+        Suffix separators stay at the end of the preceding segment and prefix separators at the start of the
+        following segment.
+        """
+        value = separator.value
+        cuts = [start]
+        non_empty_parts = 0
+        part_start = start
+        position = text.find(value, start, end) if value else -1
+
+        while position != -1:
+            if position > part_start:
+                non_empty_parts += 1
+
+            cut = position if separator.is_prefix else position + len(value)
+
+            if start < cut < end:
+                cuts.append(cut)
+
+            part_start = position + len(value)
+            position = text.find(value, part_start, end)
+
+        if end > part_start:
+            non_empty_parts += 1
+
+        if non_empty_parts < 2:
+            return None
+
+        cuts.append(end)
 
-        return first_subchunk, second_subchunk
+        return cuts
 
-    def __find_midpoint_index(self, subchunks: list[str], half_token_count: int) -> int:
-        midpoint_index = -1
-        best_midpoint_distance = float("inf")
+    def __count_span(self, offsets: list[int], start: int, end: int) -> int:
+        return bisect.bisect_left(offsets, end) - bisect.bisect_left(offsets, start)
 
-        for index, _ in enumerate(subchunks):
-            subchunk_tokens_count = self.tokenizer.count_tokens("".join(subchunks[: index + 1]))
+    def __strip_span(self, text: str, start: int, end: int) -> tuple[int, int]:
+        while start < end and text[start].isspace():
+            start += 1
 
-            midpoint_distance = abs(subchunk_tokens_count - half_token_count)
-            if midpoint_distance < best_midpoint_distance:
-                midpoint_index = index
-                best_midpoint_distance = midpoint_distance
+        while end > start and text[end - 1].isspace():
+            end -= 1
 
-        return midpoint_index
+        return start, end
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+from concurrent import futures
+from typing import TYPE_CHECKING, Optional
+
+from attrs import define, field
+
+from griptape.artifacts import ListArtifact, TextArtifact
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from griptape.chunkers import BaseChunker
+
+_worker_chunker: Optional[BaseChunker] = None
+
+
+def _initialize_worker(chunker: BaseChunker) -> None:
+    global _worker_chunker
+
+    _worker_chunker = chunker
+
+    # Load the tokenizer up front so that the first text doesn't pay for it.
+    chunker.tokenizer.count_tokens("")
+
+
+def _chunk_spans(text: str) -> list[tuple[int, int]]:
+    if _worker_chunker is None:
+        raise RuntimeError("Chunking Pool worker wasn't initialized.")
+
+    return _worker_chunker._chunk_spans(text)
+
+
+@define
+class ChunkingPool:
+    """Chunks many texts in parallel worker processes.
+
+    Chunking is CPU bound, so chunking a large collection of documents with threads doesn't scale past one core. A
+    Chunking Pool sends `chunker` to each worker process once, warms up its tokenizer, and distributes texts across
+    the workers. Workers only send back the start and end indices of each chunk, and the Artifacts are built in the
+    calling process.
+
+    Inside a `with` block, the worker processes are started on first use and are reused by every call until the
+    block exits. Outside a `with` block, every call starts its own workers and shuts them down before returning, so
+    a pool that is passed to a function, e.g. `BaseVectorStoreDriver.upsert_text_artifacts`, never leaves worker
+    processes behind. `chunker` and its tokenizer must be picklable.
+
+    Attributes:
+        chunker: Chunker that the workers chunk texts with.
+        max_workers: Number of worker processes. Defaults to the number of CPUs.
+        batch_size: Number of texts sent to a worker at a time.
+    """
+
+    DEFAULT_BATCH_SIZE = 8
+
+    chunker: BaseChunker = field(kw_only=True)
+    max_workers: Optional[int] = field(default=None, kw_only=True)
+    batch_size: int = field(default=DEFAULT_BATCH_SIZE, kw_only=True)
+    _executor: Optional[futures.ProcessPoolExecutor] = field(default=None, init=False, eq=False, repr=False)
+    _entered: bool = field(default=False, init=False, eq=False, repr=False)
+
+    @property
+    def executor(self) -> futures.ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = futures.ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_initialize_worker, initargs=(self.chunker,)
+            )
+
+        return self._executor
+
+    def __enter__(self) -> ChunkingPool:
+        self._entered = True
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._entered = False
+
+        self.shutdown()
+
+    def chunk(self, text: TextArtifact | ListArtifact | str) -> list[TextArtifact]:
+        return self.chunk_many([text])[0]
+
+    def chunk_many(self, texts: Sequence[TextArtifact | ListArtifact | str]) -> list[list[TextArtifact]]:
+        """Chunks texts in the worker processes.
+
+        Args:
+            texts: Texts to chunk.
+
+        Returns:
+            The chunks of each text, in the same order as `texts`.
+        """
+        strings = [text if isinstance(text, str) else text.to_text() for text in texts]
+
+        if len(strings) < 2 or self.max_workers == 1 or (self.max_workers is None and os.cpu_count() == 1):
+            # A single process can't chunk faster than this one.
+            spans = [self.chunker._chunk_spans(string) for string in strings]
+        else:
+            try:
+                spans = list(self.executor.map(_chunk_spans, strings, chunksize=self.batch_size))
+            finally:
+                if not self._entered:
+                    self.shutdown()
+
+        return [
+            [
+                TextArtifact(string[start:end], reference=None if isinstance(text, str) else text.reference)
+                for start, end in text_spans
+            ]
+            for text, string, text_spans in zip(texts, strings, spans)
+        ]
+
+    def chunk_collection(self, texts: Mapping[str, TextArtifact | ListArtifact | str]) -> dict[str, list[TextArtifact]]:
+        """Chunks a collection of texts, such as the one returned by `BaseLoader.load_collection`, in the workers.
+
+        Args:
+            texts: Texts to chunk by key.
+
+        Returns:
+            The chunks of each text by key.
+        """
+        return dict(zip(texts.keys(), self.chunk_many(list(texts.values()))))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+
+            self._executor = None
@@ -33,6 +33,8 @@ from .embedding.google import GoogleEmbeddingDriver
 from .embedding.dummy import DummyEmbeddingDriver
 from .embedding.cohere import CohereEmbeddingDriver
 from .embedding.ollama import OllamaEmbeddingDriver
+from .embedding.cached import CachedEmbeddingDriver
+from .embedding.coalescing import CoalescingEmbeddingDriver
 
 from .vector import BaseVectorStoreDriver
 from .vector.local import LocalVectorStoreDriver
@@ -160,6 +162,8 @@ __all__ = [
     "DummyEmbeddingDriver",
     "CohereEmbeddingDriver",
     "OllamaEmbeddingDriver",
+    "CachedEmbeddingDriver",
+    "CoalescingEmbeddingDriver",
     "BaseVectorStoreDriver",
     "LocalVectorStoreDriver",
     "PineconeVectorStoreDriver",
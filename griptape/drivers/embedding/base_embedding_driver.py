@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 from attrs import define, field
 
 from griptape.chunkers import BaseChunker, TextChunker
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils import execute_futures_list, with_contextvars
 
 if TYPE_CHECKING:
     from griptape.artifacts import TextArtifact
@@ -16,16 +19,20 @@ if TYPE_CHECKING:
 
 
 @define
-class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
+class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, FuturesExecutorMixin, ABC):
     """Base Embedding Driver.
 
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        max_batch_size: Maximum number of strings to send to the provider in a single request.
+        max_batch_tokens: Maximum number of tokens to send to the provider in a single request.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    max_batch_size: int = field(default=1, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
     chunker: Optional[BaseChunker] = field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -35,31 +42,199 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         return self.embed_string(artifact.to_text())
 
     def embed_string(self, string: str) -> list[float]:
+        if self.tokenizer is not None and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
+            # Chunks of long strings are retried individually, so a transient failure doesn't re-embed every chunk.
+            return self._embed_long_string(string)
+
         for attempt in self.retrying():
             with attempt:
-                if self.tokenizer is not None and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
-                    return self._embed_long_string(string)
-                else:
-                    return self.try_embed_chunk(string)
-
+                return self.try_embed_chunk(string)
         else:
             raise RuntimeError("Failed to embed string.")
 
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds a list of strings using as few provider requests as possible.
+
+        Strings are grouped into batches of at most `max_batch_size` strings and `max_batch_tokens` tokens,
+        and each batch is embedded concurrently with `try_embed_chunks`. Strings that exceed the tokenizer's
+        `max_input_tokens` are embedded on their own with `embed_string`.
+
+        Args:
+            strings: Strings to embed.
+
+        Returns:
+            Embeddings in the same order as `strings`.
+        """
+        embeddings: list[list[float]] = [[] for _ in strings]
+
+        with self.create_futures_executor() as futures_executor:
+            batches = self._batch_strings(strings, split_long_strings=True)
+            batch_futures = [
+                futures_executor.submit(
+                    with_contextvars(self.embed_string if is_long else self._embed_chunks),
+                    strings[indices[0]] if is_long else [strings[i] for i in indices],
+                )
+                for indices, is_long in batches
+            ]
+
+            for (indices, is_long), result in zip(batches, execute_futures_list(batch_futures)):
+                if is_long:
+                    embeddings[indices[0]] = result
+                else:
+                    for i, embedding in zip(indices, result):
+                        embeddings[i] = embedding
+
+        return embeddings
+
+    async def aembed_string(self, string: str) -> list[float]:
+        """Asynchronously embeds a string.
+
+        By default, `embed_string` runs in a worker thread. Drivers with an async client override
+        `atry_embed_chunks` so that strings are embedded without blocking a thread.
+        """
+        if not self._has_async_client():
+            return await asyncio.to_thread(self.embed_string, string)
+
+        return (await self.aembed_strings([string]))[0]
+
+    async def aembed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Asynchronously embeds a list of strings, batching them like `embed_strings`.
+
+        By default, `embed_strings` runs in a worker thread. Drivers with an async client override
+        `atry_embed_chunks` so that batches are embedded concurrently without blocking threads.
+
+        Args:
+            strings: Strings to embed.
+
+        Returns:
+            Embeddings in the same order as `strings`.
+        """
+        if not self._has_async_client():
+            return await asyncio.to_thread(self.embed_strings, strings)
+
+        embeddings: list[list[float]] = [[] for _ in strings]
+        batches = self._batch_strings(strings, split_long_strings=True)
+        results: list[Any] = await asyncio.gather(
+            *(
+                # Long strings are chunked and averaged, which async clients have no special support for.
+                asyncio.to_thread(self.embed_string, strings[indices[0]])
+                if is_long
+                else self._aembed_chunks([strings[i] for i in indices])
+                for indices, is_long in batches
+            )
+        )
+
+        for (indices, is_long), result in zip(batches, results):
+            if is_long:
+                embeddings[indices[0]] = result
+            else:
+                for i, embedding in zip(indices, result):
+                    embeddings[i] = embedding
+
+        return embeddings
+
     @abstractmethod
     def try_embed_chunk(self, chunk: str) -> list[float]: ...
 
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds a batch of chunks in a single provider request.
+
+        Drivers whose provider accepts batched inputs should override this method and `max_batch_size`.
+        """
+        return [self.try_embed_chunk(chunk) for chunk in chunks]
+
+    async def atry_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Asynchronously embeds a batch of chunks in a single provider request.
+
+        Drivers whose provider has an async client should override this method.
+        """
+        return await asyncio.to_thread(self.try_embed_chunks, chunks)
+
+    def _has_async_client(self) -> bool:
+        return type(self).atry_embed_chunks is not BaseEmbeddingDriver.atry_embed_chunks
+
+    async def _aembed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        async for attempt in self.aretrying():
+            with attempt:
+                embeddings = await self.atry_embed_chunks(chunks)
+
+                if len(embeddings) != len(chunks):
+                    raise ValueError(f"Expected {len(chunks)} embeddings, got {len(embeddings)}.")
+
+                return embeddings
+        raise RuntimeError("Failed to embed chunks.")
+
+    def _embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        for attempt in self.retrying():
+            with attempt:
+                embeddings = self.try_embed_chunks(chunks)
+
+                if len(embeddings) != len(chunks):
+                    raise ValueError(f"Expected {len(chunks)} embeddings, got {len(embeddings)}.")
+
+                return embeddings
+        else:
+            raise RuntimeError("Failed to embed chunks.")
+
+    def _batch_strings(self, strings: list[str], *, split_long_strings: bool) -> list[tuple[list[int], bool]]:
+        """Groups string indices into batches that respect `max_batch_size` and `max_batch_tokens`.
+
+        Args:
+            strings: Strings to batch.
+            split_long_strings: Whether strings that exceed the tokenizer's `max_input_tokens` go in their own batch.
+
+        Returns:
+            A list of `(indices, is_long)` tuples where `is_long` marks a single string that needs to be chunked.
+        """
+        batches = []
+        batch = []
+        batch_tokens = 0
+
+        token_counts = self.tokenizer.count_tokens_batch(strings) if self.tokenizer is not None else [0] * len(strings)
+
+        for i, tokens in enumerate(token_counts):
+            if split_long_strings and self.tokenizer is not None and tokens > self.tokenizer.max_input_tokens:
+                batches.append(([i], True))
+
+                continue
+
+            if batch and (
+                len(batch) >= self.max_batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                batches.append((batch, False))
+                batch = []
+                batch_tokens = 0
+
+            batch.append(i)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append((batch, False))
+
+        return batches
+
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
+        Chunks are embedded concurrently in batches, and each batch is retried on its own.
+
         Adapted from: https://github.com/openai/openai-cookbook/blob/683e5f5a71bc7a1b0e5b7a35e087f53cc55fceea/examples/Embedding_long_inputs.ipynb
         """
-        chunks = self.chunker.chunk(string)  # pyright: ignore[reportOptionalMemberAccess] In practice this is never None
+        chunks = [chunk.value for chunk in self.chunker.chunk(string)]  # pyright: ignore[reportOptionalMemberAccess] In practice this is never None
 
         embedding_chunks = []
-        length_chunks = []
-        for chunk in chunks:
-            embedding_chunks.append(self.try_embed_chunk(chunk.value))
-            length_chunks.append(len(chunk))
+        length_chunks = [len(chunk) for chunk in chunks]
+
+        with self.create_futures_executor() as futures_executor:
+            batches = self._batch_strings(chunks, split_long_strings=False)
+            batch_futures = [
+                futures_executor.submit(with_contextvars(self._embed_chunks), [chunks[i] for i in indices])
+                for indices, _ in batches
+            ]
+
+            for result in execute_futures_list(batch_futures):
+                embedding_chunks.extend(result)
 
         # generate weighted averages
         embedding_chunks = np.average(embedding_chunks, axis=0, weights=length_chunks)
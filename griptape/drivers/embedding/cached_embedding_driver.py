@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+from attrs import Factory, define, field
+
+from griptape import utils
+from griptape.drivers.embedding import BaseEmbeddingDriver
+
+
+@define
+class CachedEmbeddingDriver(BaseEmbeddingDriver):
+    """Embedding Driver that caches the embeddings of another Embedding Driver.
+
+    Embeddings are keyed by the wrapped Driver's model and the sha256 hash of the embedded string. Recently used
+    embeddings are kept in an in-process LRU cache bounded by `max_cache_bytes`. If `persist_file` is set,
+    embeddings are also stored in a SQLite database so that they survive restarts.
+
+    Attributes:
+        embedding_driver: Embedding Driver whose embeddings are cached.
+        model: Model used in cache keys. Defaults to the wrapped Driver's model.
+        max_cache_bytes: Maximum size of the embeddings held in memory.
+        persist_file: Optional path to a SQLite database used as a persistent cache.
+        hits: Number of strings whose embedding was found in the cache.
+        misses: Number of strings that had to be embedded by the wrapped Driver.
+    """
+
+    DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+    embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    model: str = field(
+        default=Factory(lambda self: str(self.embedding_driver.model), takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    max_cache_bytes: int = field(default=DEFAULT_MAX_CACHE_BYTES, kw_only=True, metadata={"serializable": True})
+    persist_file: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    hits: int = field(default=0, init=False, eq=False)
+    misses: int = field(default=0, init=False, eq=False)
+    _cache: OrderedDict[str, np.ndarray] = field(factory=OrderedDict, init=False, eq=False, repr=False)
+    _cache_bytes: int = field(default=0, init=False, eq=False, repr=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False, eq=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False, repr=False)
+
+    @property
+    def cache_bytes(self) -> int:
+        return self._cache_bytes
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        if self.persist_file is not None and self._connection is None:
+            directory = os.path.dirname(self.persist_file)
+
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            self._connection = sqlite3.connect(self.persist_file, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(model TEXT NOT NULL, hash TEXT NOT NULL, embedding BLOB NOT NULL, PRIMARY KEY (model, hash))"
+            )
+            self._connection.commit()
+
+        return self._connection
+
+    def embed_string(self, string: str) -> list[float]:
+        key = utils.str_to_hash(string)
+        embedding = self._get(key)
+
+        if embedding is None:
+            embedding = self.embedding_driver.embed_string(string)
+
+            self._put({key: embedding})
+
+        return embedding
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        keys = [utils.str_to_hash(string) for string in strings]
+        embeddings = {}
+        missing = {}
+
+        for key, string in zip(keys, strings):
+            if key in embeddings or key in missing:
+                continue
+
+            embedding = self._get(key)
+
+            if embedding is None:
+                missing[key] = string
+            else:
+                embeddings[key] = embedding
+
+        if missing:
+            new_embeddings = dict(zip(missing.keys(), self.embedding_driver.embed_strings(list(missing.values()))))
+
+            self._put(new_embeddings)
+            embeddings.update(new_embeddings)
+
+        return [embeddings[key] for key in keys]
+
+    def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.embedding_driver.try_embed_chunk(chunk)
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.embedding_driver.try_embed_chunks(chunks)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+            if self.connection is not None:
+                self.connection.execute("DELETE FROM embeddings WHERE model = ?", (self.model,))
+                self.connection.commit()
+
+    def _get(self, key: str) -> Optional[list[float]]:
+        with self._lock:
+            embedding = self._cache.get(key)
+
+            if embedding is not None:
+                self._cache.move_to_end(key)
+            elif self.connection is not None:
+                row = self.connection.execute(
+                    "SELECT embedding FROM embeddings WHERE model = ? AND hash = ?", (self.model, key)
+                ).fetchone()
+
+                if row is not None:
+                    embedding = np.frombuffer(row[0], dtype=np.float64)
+
+                    self.__cache(key, embedding)
+
+            if embedding is None:
+                self.misses += 1
+
+                return None
+            else:
+                self.hits += 1
+
+                return embedding.tolist()
+
+    def _put(self, embeddings: dict[str, list[float]]) -> None:
+        with self._lock:
+            arrays = {key: np.asarray(embedding, dtype=np.float64) for key, embedding in embeddings.items()}
+
+            for key, array in arrays.items():
+                self.__cache(key, array)
+
+            if self.connection is not None:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, hash, embedding) VALUES (?, ?, ?)",
+                    [(self.model, key, array.tobytes()) for key, array in arrays.items()],
+                )
+                self.connection.commit()
+
+    def __cache(self, key: str, embedding: np.ndarray) -> None:
+        previous = self._cache.pop(key, None)
+
+        if previous is not None:
+            self._cache_bytes -= previous.nbytes
+
+        if embedding.nbytes > self.max_cache_bytes:
+            return
+
+        self._cache[key] = embedding
+        self._cache_bytes += embedding.nbytes
+
+        while self._cache_bytes > self.max_cache_bytes:
+            _, evicted = self._cache.popitem(last=False)
+
+            self._cache_bytes -= evicted.nbytes
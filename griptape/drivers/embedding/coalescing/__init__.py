@@ -0,0 +1,3 @@
+from griptape.drivers.embedding.coalescing_embedding_driver import CoalescingEmbeddingDriver
+
+__all__ = ["CoalescingEmbeddingDriver"]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+from concurrent import futures
+
+from attrs import Factory, define, field
+
+from griptape.drivers.embedding import BaseEmbeddingDriver
+
+
+@define
+class CoalescingEmbeddingDriver(BaseEmbeddingDriver):
+    """Embedding Driver that coalesces concurrent `embed_string` calls into batched requests.
+
+    The first `embed_string` call of a batch waits up to `batch_window` seconds for calls from other threads.
+    The batch is then embedded with a single `embed_strings` call on the wrapped Driver, or as soon as it
+    reaches `max_batch_size` strings, and every caller receives its own embedding.
+
+    Attributes:
+        embedding_driver: Embedding Driver used to embed the coalesced batches.
+        model: Model of the wrapped Driver.
+        batch_window: Seconds to wait for concurrent calls before a batch is embedded.
+        max_batch_size: Number of strings that triggers embedding a batch before `batch_window` elapses.
+            Defaults to the wrapped Driver's `max_batch_size`.
+    """
+
+    DEFAULT_BATCH_WINDOW = 0.01
+
+    embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    model: str = field(
+        default=Factory(lambda self: self.embedding_driver.model, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    batch_window: float = field(default=DEFAULT_BATCH_WINDOW, kw_only=True, metadata={"serializable": True})
+    max_batch_size: int = field(
+        default=Factory(lambda self: self.embedding_driver.max_batch_size, takes_self=True), kw_only=True
+    )
+    _batch: list[tuple[str, futures.Future]] = field(factory=list, init=False, eq=False, repr=False)
+    _condition: threading.Condition = field(factory=threading.Condition, init=False, eq=False, repr=False)
+
+    def embed_string(self, string: str) -> list[float]:
+        future = futures.Future()
+
+        with self._condition:
+            batch = self._batch
+            batch.append((string, future))
+
+            if len(batch) >= self.max_batch_size:
+                # The batch is full, so whoever filled it embeds it.
+                self._batch = []
+                self._condition.notify_all()
+
+                should_embed = True
+            elif len(batch) == 1:
+                # The first caller waits for the window to elapse or for another caller to fill the batch.
+                self._condition.wait_for(lambda: self._batch is not batch, timeout=self.batch_window)
+
+                should_embed = self._batch is batch
+
+                if should_embed:
+                    self._batch = []
+            else:
+                should_embed = False
+
+        if should_embed:
+            self.__embed_batch(batch)
+
+        return future.result()
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        return self.embedding_driver.embed_strings(strings)
+
+    def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.embedding_driver.try_embed_chunk(chunk)
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.embedding_driver.try_embed_chunks(chunks)
+
+    def __embed_batch(self, batch: list[tuple[str, futures.Future]]) -> None:
+        try:
+            embeddings = self.embedding_driver.embed_strings([string for string, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
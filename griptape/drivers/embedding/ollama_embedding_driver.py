@@ -22,8 +22,11 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         client: Ollama `Client`.
     """
 
+    MAX_BATCH_SIZE = 128
+
     model: str = field(kw_only=True, metadata={"serializable": True})
     host: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    max_batch_size: int = field(default=MAX_BATCH_SIZE, kw_only=True)
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -31,4 +34,7 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         return import_optional_dependency("ollama").Client(host=self.host)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        return list(self.client.embeddings(model=self.model, prompt=chunk)["embedding"])
+        return list(self.client.embed(model=self.model, input=chunk)["embeddings"][0])
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return [list(embedding) for embedding in self.client.embed(model=self.model, input=chunks)["embeddings"]]
@@ -21,6 +21,7 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         organization: OpenAI organization. Defaults to 'OPENAI_ORGANIZATION' environment variable.
         tokenizer: Optionally provide custom `OpenAiTokenizer`.
         client: Optionally provide custom `openai.OpenAI` client.
+        async_client: Optionally provide custom `openai.AsyncOpenAI` client.
         azure_deployment: An Azure OpenAi deployment id.
         azure_endpoint: An Azure OpenAi endpoint.
         azure_ad_token: An optional Azure Active Directory token.
@@ -29,6 +30,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "text-embedding-3-small"
+    MAX_BATCH_SIZE = 2048
+    MAX_BATCH_TOKENS = 300_000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     base_url: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
@@ -38,12 +41,21 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
         kw_only=True,
     )
+    max_batch_size: int = field(default=MAX_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=MAX_BATCH_TOKENS, kw_only=True)
     _client: openai.OpenAI = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: openai.AsyncOpenAI = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
         return openai.OpenAI(api_key=self.api_key, base_url=self.base_url, organization=self.organization)
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, organization=self.organization)
+
     def try_embed_chunk(self, chunk: str) -> list[float]:
         # Address a performance issue in older ada models
         # https://github.com/openai/openai-python/issues/418#issuecomment-1525939500
@@ -51,5 +63,19 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
             chunk = chunk.replace("\n", " ")
         return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
 
-    def _params(self, chunk: str) -> dict:
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        if self.model.endswith("001"):
+            chunks = [chunk.replace("\n", " ") for chunk in chunks]
+        data = self.client.embeddings.create(**self._params(chunks)).data
+
+        return [embedding.embedding for embedding in sorted(data, key=lambda e: e.index)]
+
+    async def atry_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        if self.model.endswith("001"):
+            chunks = [chunk.replace("\n", " ") for chunk in chunks]
+        data = (await self.async_client.embeddings.create(**self._params(chunks))).data
+
+        return [embedding.embedding for embedding in sorted(data, key=lambda e: e.index)]
+
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
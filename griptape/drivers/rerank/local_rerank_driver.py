@@ -10,7 +10,6 @@ from numpy.linalg import norm
 from griptape.configs.defaults_config import Defaults
 from griptape.drivers.rerank import BaseRerankDriver
 from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
-from griptape.utils import execute_futures_list, with_contextvars
 
 if TYPE_CHECKING:
     from griptape.artifacts import TextArtifact
@@ -26,14 +25,7 @@ class LocalRerankDriver(BaseRerankDriver, FuturesExecutorMixin):
 
     def run(self, query: str, artifacts: list[TextArtifact]) -> list[TextArtifact]:
         query_embedding = self.embedding_driver.embed_string(query)
-
-        with self.create_futures_executor() as futures_executor:
-            artifact_embeddings = execute_futures_list(
-                [
-                    futures_executor.submit(with_contextvars(self.embedding_driver.embed_text_artifact), a)
-                    for a in artifacts
-                ],
-            )
+        artifact_embeddings = self.embedding_driver.embed_strings([a.to_text() for a in artifacts])
 
         artifacts_and_relatednesses = [
             (artifact, self.calculate_relatedness(query_embedding, artifact_embedding))
@@ -57,4 +57,13 @@ class AmazonOpenSearchVectorStoreDriver(OpenSearchVectorStoreDriver):
         else:
             response = self.client.index(index=self.index_name, id=vector_id, body=doc)
 
+        self._invalidate_query_cache(namespace)
+
         return response["_id"]
+
+    def _bulk_index_action(self, vector_id: str) -> dict:
+        # OpenSearch Serverless doesn't support custom document ids.
+        if self.service == "aoss":
+            return {"_index": self.index_name}
+        else:
+            return super()._bulk_index_action(vector_id)
@@ -68,6 +68,7 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
             vector_id: ID of the vector to delete.
         """
         self.collection.delete_one({"_id": vector_id})
+        self._invalidate_query_cache()
 
     def upsert_vector(
         self,
@@ -99,10 +100,13 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
         }
         if vector_id is not None:
             self.collection.find_one_and_replace({"_id": vector_id}, document, upsert=True)
-            return vector_id
         else:
             insert_result = self.collection.insert_one(document)
-            return insert_result.inserted_id
+            vector_id = insert_result.inserted_id
+
+        self._invalidate_query_cache(namespace)
+
+        return vector_id  # pyright: ignore[reportReturnType]
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a single vector entry from the Astra DB store given its ID.
@@ -123,6 +127,49 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
         else:
             return None
 
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        """Load several vector entries from the Astra DB store with a single `$in` query.
+
+        Args:
+            vector_ids: the IDs of the required vectors.
+            namespace: a namespace, within the vector store, to constrain the search.
+
+        Returns:
+            The vector entries (`BaseVectorStoreDriver.Entry`), in order, with None for IDs that weren't found.
+        """
+        matches = {
+            match["_id"]: match
+            for match in self.collection.find(filter=self._ids_filter(vector_ids, namespace), projection={"*": 1})
+        }
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=match["_id"], vector=match.get("$vector"), meta=match.get("meta"), namespace=match.get("namespace")
+            )
+            if (match := matches.get(vector_id)) is not None
+            else None
+            for vector_id in vector_ids
+        ]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Check which vector IDs exist in the Astra DB store with a single `$in` query that only projects IDs.
+
+        Args:
+            vector_ids: the IDs of the vectors to check.
+            namespace: a namespace, within the vector store, to constrain the search.
+
+        Returns:
+            Whether each ID exists, in order.
+        """
+        existing_ids = {
+            match["_id"]
+            for match in self.collection.find(filter=self._ids_filter(vector_ids, namespace), projection={"_id": 1})
+        }
+
+        return [vector_id in existing_ids for vector_id in vector_ids]
+
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
         """Load entries from the Astra DB store.
 
@@ -140,6 +187,9 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
             for match in self.collection.find(filter=find_filter, projection={"*": 1})
         ]
 
+    def _ids_filter(self, vector_ids: list[str], namespace: Optional[str]) -> dict:
+        return {k: v for k, v in {"_id": {"$in": vector_ids}, "namespace": namespace}.items() if v is not None}
+
     def query_vector(
         self,
         vector: list[float],
@@ -12,9 +12,9 @@ from griptape.drivers.vector.mongodb_atlas import MongoDbAtlasVectorStoreDriver
 class AzureMongoDbVectorStoreDriver(MongoDbAtlasVectorStoreDriver):
     """A Vector Store Driver for CosmosDB with MongoDB vCore API."""
 
-    def query_vector(
+    def query(
         self,
-        vector: list[float],
+        query: str,
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
@@ -22,15 +22,15 @@ class AzureMongoDbVectorStoreDriver(MongoDbAtlasVectorStoreDriver):
         offset: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Queries the MongoDB collection for documents that match the provided vector list.
+        """Queries the MongoDB collection for documents that match the provided query string.
 
         Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
         """
-        collection = self.get_collection()
-
-        count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
-        offset = offset or 0
+        return super().query(
+            query, count=count, namespace=namespace, include_vectors=include_vectors, offset=offset, **kwargs
+        )
 
+    def _build_query_pipeline(self, vector: list[float], *, count: int, namespace: Optional[str]) -> list[dict]:
         pipeline = []
 
         pipeline.append(
@@ -51,33 +51,15 @@ class AzureMongoDbVectorStoreDriver(MongoDbAtlasVectorStoreDriver):
 
         pipeline.append({"$project": {"similarityScore": {"$meta": "searchScore"}, "document": "$$ROOT"}})
 
-        return [
-            BaseVectorStoreDriver.Entry(
-                id=str(doc["_id"]),
-                vector=doc[self.vector_path] if include_vectors else [],
-                score=doc["similarityScore"],
-                meta=doc["document"]["meta"],
-                namespace=namespace,
-            )
-            for doc in collection.aggregate(pipeline)
-        ]
+        return pipeline
 
-    def query(
-        self,
-        query: str,
-        *,
-        count: Optional[int] = None,
-        namespace: Optional[str] = None,
-        include_vectors: bool = False,
-        offset: Optional[int] = None,
-        **kwargs,
-    ) -> list[BaseVectorStoreDriver.Entry]:
-        """Queries the MongoDB collection for documents that match the provided query string.
-
-        Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
-        """
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-        return self.query_vector(
-            vector, count=count, namespace=namespace, include_vectors=include_vectors, offset=offset, **kwargs
+    def _parse_query_document(
+        self, doc: dict, *, namespace: Optional[str], include_vectors: bool
+    ) -> BaseVectorStoreDriver.Entry:
+        return BaseVectorStoreDriver.Entry(
+            id=str(doc["_id"]),
+            vector=doc[self.vector_path] if include_vectors else [],
+            score=doc["similarityScore"],
+            meta=doc["document"]["meta"],
+            namespace=namespace,
         )
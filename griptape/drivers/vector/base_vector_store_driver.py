@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import os
+import struct
+import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
 from attrs import define, field
 
 from griptape import utils
@@ -14,62 +23,121 @@ from griptape.mixins.serializable_mixin import SerializableMixin
 from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from griptape.chunkers import BaseChunker, ChunkingPool
     from griptape.drivers.embedding import BaseEmbeddingDriver
 
 
 @define
 class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
+    """Base Vector Store Driver.
+
+    Attributes:
+        embedding_driver: Embedding Driver used to embed Artifacts and queries.
+        upsert_batch_size: Maximum number of vectors `upsert_text_artifacts` checks with a single `entries_exist` call
+            and passes to a single `upsert_vectors` call.
+        query_cache_size: Maximum number of query embeddings and query results cached by `query`. `0` disables the
+            cache. Cached results are invalidated by writes made through this Driver, so set `query_cache_ttl` when
+            other clients write to the same store.
+        query_cache_ttl: Optional number of seconds after which cached query embeddings and results expire.
+    """
+
     DEFAULT_QUERY_COUNT = 5
+    DEFAULT_UPSERT_BATCH_SIZE = 100
+    DEFAULT_EXPORT_BATCH_SIZE = 1000
+    EXPORT_VECTORS_FILE = "vectors.npy"
+    EXPORT_ENTRIES_FILE = "entries.jsonl"
+    # Size of the .npy header, which is reserved up front and written once the number of exported vectors is known.
+    NPY_HEADER_SIZE = 128
 
-    @dataclass
+    @define
     class Entry:
+        """A vector store entry.
+
+        Entries are slotted so that large query results and exports stay compact. The Artifact stored in `meta` is
+        only decoded when `to_artifact` is called, and the decoded Artifact is memoized.
+        """
+
         id: str
         vector: Optional[list[float]] = None
         score: Optional[float] = None
         meta: Optional[dict] = None
         namespace: Optional[str] = None
+        _artifact: Optional[tuple[str, BaseArtifact]] = field(default=None, init=False, eq=False, repr=False)
 
         @staticmethod
         def from_dict(data: dict[str, Any]) -> BaseVectorStoreDriver.Entry:
             return BaseVectorStoreDriver.Entry(**data)
 
+        def to_dict(self) -> dict[str, Any]:
+            return {
+                "id": self.id,
+                "vector": self.vector,
+                "score": self.score,
+                "meta": self.meta,
+                "namespace": self.namespace,
+            }
+
         def to_artifact(self) -> BaseArtifact:
-            return BaseArtifact.from_json(self.meta["artifact"])  # pyright: ignore[reportOptionalSubscript]
+            artifact_json = self.meta["artifact"]  # pyright: ignore[reportOptionalSubscript]
+
+            # The memoized Artifact is decoded again if the Artifact in `meta` was replaced.
+            if self._artifact is None or self._artifact[0] is not artifact_json:
+                self._artifact = (artifact_json, BaseArtifact.from_json(artifact_json))
+
+            return self._artifact[1]
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    upsert_batch_size: int = field(default=DEFAULT_UPSERT_BATCH_SIZE, kw_only=True)
+    query_cache_size: int = field(default=0, kw_only=True)
+    query_cache_ttl: Optional[float] = field(default=None, kw_only=True)
+    _query_cache: OrderedDict[tuple, tuple[float, tuple[int, int], list[BaseVectorStoreDriver.Entry]]] = field(
+        factory=OrderedDict, init=False, eq=False, repr=False
+    )
+    _query_embedding_cache: OrderedDict[str, tuple[float, list[float]]] = field(
+        factory=OrderedDict, init=False, eq=False, repr=False
+    )
+    _query_cache_generations: dict[Optional[str], int] = field(factory=dict, init=False, eq=False, repr=False)
+    _query_cache_epoch: int = field(default=0, init=False, eq=False, repr=False)
+    _query_cache_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False, repr=False)
 
     def upsert_text_artifacts(
         self,
         artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
         *,
         meta: Optional[dict] = None,
+        chunker: Optional[BaseChunker | ChunkingPool] = None,
         **kwargs,
     ) -> list[str] | dict[str, list[str]]:
-        with self.create_futures_executor() as futures_executor:
-            if isinstance(artifacts, list):
-                return utils.execute_futures_list(
-                    [
-                        futures_executor.submit(
-                            with_contextvars(self.upsert_text_artifact), a, namespace=None, meta=meta, **kwargs
-                        )
-                        for a in artifacts
-                    ],
-                )
-            else:
-                futures_dict = {}
+        """Upserts Text Artifacts, embedding the ones that aren't in the store yet with a single batched call.
 
-                for namespace, artifact_list in artifacts.items():
-                    for a in artifact_list:
-                        if not futures_dict.get(namespace):
-                            futures_dict[namespace] = []
+        Args:
+            artifacts: Artifacts to upsert, optionally grouped by namespace.
+            meta: Metadata to store with every Artifact.
+            chunker: Optional Chunker or Chunking Pool that splits the Artifacts into chunks before they are upserted.
+                A Chunking Pool that isn't in a `with` block shuts its workers down when chunking is done.
+            kwargs: Additional arguments passed to `upsert_vectors`.
 
-                        futures_dict[namespace].append(
-                            futures_executor.submit(
-                                with_contextvars(self.upsert_text_artifact), a, namespace=namespace, meta=meta, **kwargs
-                            )
-                        )
+        Returns:
+            Vector ids of the Artifacts, or of their chunks if `chunker` is set, grouped by namespace if `artifacts` was.
+        """
+        if chunker is not None:
+            artifacts = self._chunk_text_artifacts(artifacts, chunker)
+
+        if isinstance(artifacts, list):
+            return self._upsert_namespaced_text_artifacts([(None, a) for a in artifacts], meta=meta, **kwargs)
+        else:
+            namespaced_artifacts: list[tuple[Optional[str], TextArtifact]] = [
+                (namespace, a) for namespace, artifact_list in artifacts.items() for a in artifact_list
+            ]
+            vector_ids = self._upsert_namespaced_text_artifacts(namespaced_artifacts, meta=meta, **kwargs)
+            result = {}
 
-                return utils.execute_futures_list_dict(futures_dict)
+            for (namespace, _), vector_id in zip(namespaced_artifacts, vector_ids):
+                result.setdefault(namespace, []).append(vector_id)
+
+            return result
 
     def upsert_text_artifact(
         self,
@@ -83,8 +151,7 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta = {} if meta is None else meta
 
         if vector_id is None:
-            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
-            vector_id = self._get_default_vector_id(value)
+            vector_id = self._get_artifact_vector_id(artifact)
 
         if self.does_entry_exist(vector_id, namespace=namespace):
             return vector_id
@@ -108,12 +175,103 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             TextArtifact(string), vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
         )
 
+    async def aupsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        chunker: Optional[BaseChunker | ChunkingPool] = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        """Asynchronously upserts Text Artifacts like `upsert_text_artifacts`.
+
+        New Artifacts are embedded with `aembed_strings` and upserted with `aupsert_vectors`.
+        """
+        if chunker is not None:
+            artifacts = await asyncio.to_thread(self._chunk_text_artifacts, artifacts, chunker)
+
+        if isinstance(artifacts, list):
+            return await self._aupsert_namespaced_text_artifacts([(None, a) for a in artifacts], meta=meta, **kwargs)
+        else:
+            namespaced_artifacts: list[tuple[Optional[str], TextArtifact]] = [
+                (namespace, a) for namespace, artifact_list in artifacts.items() for a in artifact_list
+            ]
+            vector_ids = await self._aupsert_namespaced_text_artifacts(namespaced_artifacts, meta=meta, **kwargs)
+            result = {}
+
+            for (namespace, _), vector_id in zip(namespaced_artifacts, vector_ids):
+                result.setdefault(namespace, []).append(vector_id)
+
+            return result
+
+    async def aupsert_text_artifact(
+        self,
+        artifact: TextArtifact,
+        *,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        vector_id: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """Asynchronously upserts a Text Artifact like `upsert_text_artifact`."""
+        meta = {} if meta is None else meta
+
+        if vector_id is None:
+            vector_id = self._get_artifact_vector_id(artifact)
+
+        if await asyncio.to_thread(self.does_entry_exist, vector_id, namespace=namespace):
+            return vector_id
+        else:
+            meta["artifact"] = artifact.to_json()
+
+            if not artifact.embedding:
+                artifact.embedding = await self.embedding_driver.aembed_string(str(artifact.value))
+
+            return await self.aupsert_vector(
+                artifact.embedding, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
+            )
+
+    async def aupsert_text(
+        self,
+        string: str,
+        *,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        vector_id: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """Asynchronously upserts a string like `upsert_text`."""
+        return await self.aupsert_text_artifact(
+            TextArtifact(string), vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
+        )
+
     def does_entry_exist(self, vector_id: str, *, namespace: Optional[str] = None) -> bool:
         try:
             return self.load_entry(vector_id, namespace=namespace) is not None
         except Exception:
             return False
 
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which of several vector ids exist in the store.
+
+        By default, ids are checked concurrently with `does_entry_exist`. Drivers whose store supports bulk lookups
+        should override this method to check all ids in a single request, ideally without loading the vectors.
+
+        Args:
+            vector_ids: Vector ids to check.
+            namespace: Namespace the ids belong to.
+
+        Returns:
+            Whether each id exists, in order.
+        """
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(with_contextvars(self.does_entry_exist), vector_id, namespace=namespace)
+                    for vector_id in vector_ids
+                ]
+            )
+
     def load_artifacts(self, *, namespace: Optional[str] = None) -> ListArtifact:
         result = self.load_entries(namespace=namespace)
         artifacts = [r.to_artifact() for r in result]
@@ -134,12 +292,198 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         **kwargs,
     ) -> str: ...
 
+    def upsert_vectors(self, entries: list[Entry], **kwargs) -> list[str]:
+        """Upserts several vectors.
+
+        By default, entries are upserted concurrently with `upsert_vector`. Drivers whose store supports bulk writes
+        should override this method to upsert the entries in as few requests as possible.
+
+        Args:
+            entries: Entries to upsert. Entries with an empty `id` get an id generated like in `upsert_vector`.
+            kwargs: Additional arguments passed to `upsert_vector`.
+
+        Returns:
+            Vector ids of the entries, in order.
+        """
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.upsert_vector),
+                        entry.vector,
+                        vector_id=entry.id or None,
+                        namespace=entry.namespace,
+                        meta=entry.meta,
+                        **kwargs,
+                    )
+                    for entry in entries
+                ]
+            )
+
+    async def aupsert_vector(
+        self,
+        vector: list[float],
+        *,
+        vector_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> str:
+        """Asynchronously upserts a vector.
+
+        By default, `upsert_vector` runs in a worker thread. Drivers with an async client should override this method.
+        """
+        return await asyncio.to_thread(
+            self.upsert_vector, vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
+        )
+
+    async def aupsert_vectors(self, entries: list[Entry], **kwargs) -> list[str]:
+        """Asynchronously upserts several vectors.
+
+        By default, `upsert_vectors` runs in a worker thread. Drivers with an async client should override this method.
+        """
+        return await asyncio.to_thread(self.upsert_vectors, entries, **kwargs)
+
     @abstractmethod
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[Entry]: ...
 
+    def load_entries_by_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[Optional[Entry]]:
+        """Loads several entries by their vector ids.
+
+        By default, entries are loaded concurrently with `load_entry`. Drivers whose store supports bulk lookups
+        should override this method to load all entries in a single request.
+
+        Args:
+            vector_ids: Vector ids of the entries to load.
+            namespace: Namespace the ids belong to.
+
+        Returns:
+            The entries, in order, with `None` for ids that weren't found.
+        """
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(with_contextvars(self.load_entry), vector_id, namespace=namespace)
+                    for vector_id in vector_ids
+                ]
+            )
+
     @abstractmethod
     def load_entries(self, *, namespace: Optional[str] = None) -> list[Entry]: ...
 
+    def export_entries(self, *, namespace: Optional[str] = None, batch_size: Optional[int] = None) -> Iterator[Entry]:
+        """Streams entries, including their vectors, out of the store.
+
+        By default, all entries are loaded with `load_entries`. Drivers that can page through their store override
+        this method so that memory use is bounded by `batch_size`.
+
+        Args:
+            namespace: Optional namespace of the entries to export.
+            batch_size: Number of entries fetched per request. Defaults to `DEFAULT_EXPORT_BATCH_SIZE`.
+
+        Returns:
+            An iterator of entries.
+        """
+        yield from self.load_entries(namespace=namespace)
+
+    def import_entries(self, entries: Iterable[Entry], *, batch_size: Optional[int] = None) -> int:
+        """Upserts entries, such as the ones exported by another Driver, with one `upsert_vectors` call per batch.
+
+        Entries keep their ids, namespaces, metadata, and vectors, so nothing is re-embedded.
+
+        Args:
+            entries: Entries to import. Iterators are consumed one batch at a time.
+            batch_size: Number of entries per `upsert_vectors` call. Defaults to `upsert_batch_size`.
+
+        Returns:
+            Number of imported entries.
+        """
+        batch_size = batch_size or self.upsert_batch_size
+        iterator = iter(entries)
+        count = 0
+
+        while batch := list(islice(iterator, batch_size)):
+            self.upsert_vectors(batch)
+
+            count += len(batch)
+
+        return count
+
+    def export_to_directory(
+        self, directory: str, *, namespace: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> int:
+        """Exports entries to `EXPORT_VECTORS_FILE` and `EXPORT_ENTRIES_FILE` in a directory.
+
+        Vectors are written as the rows of a float32 `.npy` array and the id, namespace, and metadata of each entry as
+        a line of a JSONL file, in the same order. Entries are streamed from `export_entries`.
+
+        Args:
+            directory: Directory to export to. Created if it doesn't exist.
+            namespace: Optional namespace of the entries to export.
+            batch_size: Number of entries fetched per request.
+
+        Returns:
+            Number of exported entries.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        count = 0
+        dimensions = None
+
+        with contextlib.ExitStack() as stack:
+            vectors_file = stack.enter_context(open(os.path.join(directory, self.EXPORT_VECTORS_FILE), "wb"))
+            entries_file = stack.enter_context(open(os.path.join(directory, self.EXPORT_ENTRIES_FILE), "w"))
+
+            vectors_file.write(b"\x00" * self.NPY_HEADER_SIZE)
+
+            for entry in self.export_entries(namespace=namespace, batch_size=batch_size):
+                if entry.vector is None:
+                    raise ValueError(f"Entry {entry.id} has no vector.")
+
+                vector = np.asarray(entry.vector, dtype="<f4")
+
+                if dimensions is None:
+                    dimensions = len(vector)
+                elif len(vector) != dimensions:
+                    raise ValueError(f"Entry {entry.id} has {len(vector)} dimensions, expected {dimensions}.")
+
+                vectors_file.write(vector.tobytes())
+                entries_file.write(json.dumps({"id": str(entry.id), "namespace": entry.namespace, "meta": entry.meta}))
+                entries_file.write("\n")
+
+                count += 1
+
+            vectors_file.seek(0)
+            vectors_file.write(self.__npy_header((count, dimensions or 0)))
+
+        return count
+
+    def import_from_directory(self, directory: str, *, batch_size: Optional[int] = None) -> int:
+        """Imports entries exported with `export_to_directory`.
+
+        The vectors file is memory-mapped and entries are upserted with `import_entries`, so memory use is bounded by
+        `batch_size`.
+
+        Args:
+            directory: Directory to import from.
+            batch_size: Number of entries per `upsert_vectors` call. Defaults to `upsert_batch_size`.
+
+        Returns:
+            Number of imported entries.
+        """
+        vectors = np.load(os.path.join(directory, self.EXPORT_VECTORS_FILE), mmap_mode="r")
+
+        if len(vectors) == 0:
+            return 0
+
+        with open(os.path.join(directory, self.EXPORT_ENTRIES_FILE)) as entries_file:
+            entries = (
+                BaseVectorStoreDriver.Entry(vector=vector.tolist(), **json.loads(line))
+                for vector, line in zip(vectors, entries_file)
+            )
+
+            return self.import_entries(entries, batch_size=batch_size)
+
     def query_vector(
         self,
         vector: list[float],
@@ -161,8 +505,393 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         include_vectors: bool = False,
         **kwargs,
     ) -> list[Entry]:
-        vector = self.embedding_driver.embed_string(query)
-        return self.query_vector(vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+        if self.query_cache_size <= 0:
+            vector = self.embedding_driver.embed_string(query)
+
+            return self.query_vector(
+                vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+        key = self.__query_cache_key(query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+        # Read before querying so that results of a query that races with a write are never served.
+        generation = self.__query_cache_generation(namespace)
+        entries = self.__get_cached_query(key, generation)
+
+        if entries is None:
+            vector = self.__get_cached_query_embedding(query)
+
+            if vector is None:
+                vector = self.embedding_driver.embed_string(query)
+
+                self.__cache_query_embedding(query, vector)
+
+            entries = self.query_vector(
+                vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+            self.__cache_query(key, generation, entries)
+
+        return list(entries)
+
+    async def aquery_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[Entry]:
+        """Asynchronously queries a vector.
+
+        By default, `query_vector` runs in a worker thread. Drivers with an async client should override this method.
+        """
+        return await asyncio.to_thread(
+            self.query_vector, vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+        )
+
+    async def aquery(
+        self,
+        query: str,
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[Entry]:
+        """Asynchronously queries a string.
+
+        If the Driver overrides `aquery_vector`, the query is embedded with `aembed_string` and searched with
+        `aquery_vector`, using the same cache as `query`. Otherwise, `query` runs in a worker thread.
+        """
+        if type(self).aquery_vector is BaseVectorStoreDriver.aquery_vector:
+            return await asyncio.to_thread(
+                self.query, query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+        if self.query_cache_size <= 0:
+            vector = await self.embedding_driver.aembed_string(query)
+
+            return await self.aquery_vector(
+                vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+        key = self.__query_cache_key(query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+        generation = self.__query_cache_generation(namespace)
+        entries = self.__get_cached_query(key, generation)
+
+        if entries is None:
+            vector = self.__get_cached_query_embedding(query)
+
+            if vector is None:
+                vector = await self.embedding_driver.aembed_string(query)
+
+                self.__cache_query_embedding(query, vector)
+
+            entries = await self.aquery_vector(
+                vector, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+            )
+
+            self.__cache_query(key, generation, entries)
+
+        return list(entries)
+
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[Entry]]:
+        """Queries several vectors at once.
+
+        By default, vectors are queried concurrently with `query_vector`. Drivers whose store supports batch searches
+        should override this method to query all vectors in as few requests as possible.
+
+        Args:
+            vectors: Vectors to query.
+            count: Maximum number of entries to return per vector.
+            namespace: Namespace to query.
+            include_vectors: Whether to include vectors in the entries.
+            kwargs: Additional arguments passed to `query_vector`.
+
+        Returns:
+            The entries of each vector, in order.
+        """
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.query_vector),
+                        vector,
+                        count=count,
+                        namespace=namespace,
+                        include_vectors=include_vectors,
+                        **kwargs,
+                    )
+                    for vector in vectors
+                ]
+            )
+
+    def query_many(
+        self,
+        queries: list[str],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[Entry]]:
+        """Queries several strings at once, embedding them with a single `embed_strings` call.
+
+        Args:
+            queries: Strings to query.
+            count: Maximum number of entries to return per query.
+            namespace: Namespace to query.
+            include_vectors: Whether to include vectors in the entries.
+            kwargs: Additional arguments passed to `query_vectors`.
+
+        Returns:
+            The entries of each query, in order.
+        """
+        vectors = self.embedding_driver.embed_strings(queries)
+
+        return self.query_vectors(vectors, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs)
+
+    def clear_query_cache(self) -> None:
+        """Clears cached query embeddings and results, e.g., after the store was modified by another client."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+            self._query_embedding_cache.clear()
+            self._query_cache_epoch += 1
+
+    def _invalidate_query_cache(self, *namespaces: Optional[str]) -> None:
+        """Invalidates the cached query results of namespaces, or of every namespace if none are given.
+
+        Drivers call this method after every write so that `query` never serves stale results.
+        """
+        with self._query_cache_lock:
+            if namespaces:
+                # Queries without a namespace search every namespace.
+                for namespace in {None, *namespaces}:
+                    self._query_cache_generations[namespace] = self._query_cache_generations.get(namespace, 0) + 1
+            else:
+                self._query_cache.clear()
+                self._query_cache_epoch += 1
+
+    def _chunk_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        chunker: BaseChunker | ChunkingPool,
+    ) -> list[TextArtifact] | dict[str, list[TextArtifact]]:
+        """Replaces every Artifact with its chunks, chunking all Artifacts with a single `chunk_many` call."""
+        if isinstance(artifacts, list):
+            return [chunk for chunks in chunker.chunk_many(artifacts) for chunk in chunks]
+        else:
+            chunks = iter(chunker.chunk_many([a for artifact_list in artifacts.values() for a in artifact_list]))
+
+            return {
+                namespace: [chunk for _ in artifact_list for chunk in next(chunks)]
+                for namespace, artifact_list in artifacts.items()
+            }
+
+    def _upsert_namespaced_text_artifacts(
+        self, namespaced_artifacts: list[tuple[Optional[str], TextArtifact]], *, meta: Optional[dict] = None, **kwargs
+    ) -> list[str]:
+        vector_ids = [self._get_artifact_vector_id(a) for _, a in namespaced_artifacts]
+        new_indices = self._find_new_artifact_indices(namespaced_artifacts, vector_ids)
+        unembedded_artifacts = [
+            namespaced_artifacts[i][1] for i in new_indices if not namespaced_artifacts[i][1].embedding
+        ]
+
+        if unembedded_artifacts:
+            embeddings = self.embedding_driver.embed_strings([str(a.value) for a in unembedded_artifacts])
+
+            for artifact, embedding in zip(unembedded_artifacts, embeddings):
+                artifact.embedding = embedding
+
+        entries = self._build_artifact_entries(namespaced_artifacts, vector_ids, new_indices, meta=meta)
+        upserted_ids = []
+
+        for start in range(0, len(entries), self.upsert_batch_size):
+            upserted_ids.extend(self.upsert_vectors(entries[start : start + self.upsert_batch_size], **kwargs))
+
+        self._assign_upserted_ids(namespaced_artifacts, vector_ids, new_indices, upserted_ids)
+
+        return vector_ids
+
+    async def _aupsert_namespaced_text_artifacts(
+        self, namespaced_artifacts: list[tuple[Optional[str], TextArtifact]], *, meta: Optional[dict] = None, **kwargs
+    ) -> list[str]:
+        vector_ids = [self._get_artifact_vector_id(a) for _, a in namespaced_artifacts]
+        new_indices = await asyncio.to_thread(self._find_new_artifact_indices, namespaced_artifacts, vector_ids)
+        unembedded_artifacts = [
+            namespaced_artifacts[i][1] for i in new_indices if not namespaced_artifacts[i][1].embedding
+        ]
+
+        if unembedded_artifacts:
+            embeddings = await self.embedding_driver.aembed_strings([str(a.value) for a in unembedded_artifacts])
+
+            for artifact, embedding in zip(unembedded_artifacts, embeddings):
+                artifact.embedding = embedding
+
+        entries = self._build_artifact_entries(namespaced_artifacts, vector_ids, new_indices, meta=meta)
+        batch_ids = await asyncio.gather(
+            *(
+                self.aupsert_vectors(entries[start : start + self.upsert_batch_size], **kwargs)
+                for start in range(0, len(entries), self.upsert_batch_size)
+            )
+        )
+
+        self._assign_upserted_ids(
+            namespaced_artifacts, vector_ids, new_indices, [vector_id for ids in batch_ids for vector_id in ids]
+        )
+
+        return vector_ids
+
+    def _find_new_artifact_indices(
+        self, namespaced_artifacts: list[tuple[Optional[str], TextArtifact]], vector_ids: list[str]
+    ) -> list[int]:
+        """Returns the indices of the Artifacts that aren't in the store yet, with one `entries_exist` call per batch.
+
+        Artifacts with the same vector id in the same namespace, e.g. repeated chunks, are only returned once, so that
+        they are embedded once and never upserted twice in a batch. The last one wins.
+        """
+        batches = self._batch_namespaced_indices([namespace for namespace, _ in namespaced_artifacts])
+
+        with self.create_futures_executor() as futures_executor:
+            batch_exists = utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.entries_exist), [vector_ids[i] for i in batch], namespace=namespace
+                    )
+                    for namespace, batch in batches
+                ]
+            )
+
+        new_indices = {
+            (namespaced_artifacts[i][0], vector_ids[i]): i
+            for (_, batch), exists in zip(batches, batch_exists)
+            for i, e in zip(batch, exists)
+            if not e
+        }
+
+        return sorted(new_indices.values())
+
+    def _assign_upserted_ids(
+        self,
+        namespaced_artifacts: list[tuple[Optional[str], TextArtifact]],
+        vector_ids: list[str],
+        indices: list[int],
+        upserted_ids: list[str],
+    ) -> None:
+        """Replaces the vector ids of the upserted Artifacts, and of their duplicates, with the ids returned by the store."""
+        upserted = {
+            (namespaced_artifacts[i][0], vector_ids[i]): upserted_id for i, upserted_id in zip(indices, upserted_ids)
+        }
+
+        for i, (namespace, _) in enumerate(namespaced_artifacts):
+            vector_ids[i] = upserted.get((namespace, vector_ids[i]), vector_ids[i])
+
+    def _build_artifact_entries(
+        self,
+        namespaced_artifacts: list[tuple[Optional[str], TextArtifact]],
+        vector_ids: list[str],
+        indices: list[int],
+        *,
+        meta: Optional[dict],
+    ) -> list[Entry]:
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=vector_ids[i],
+                vector=namespaced_artifacts[i][1].embedding,
+                namespace=namespaced_artifacts[i][0],
+                meta={**(meta or {}), "artifact": namespaced_artifacts[i][1].to_json()},
+            )
+            for i in indices
+        ]
+
+    def _batch_namespaced_indices(self, namespaces: list[Optional[str]]) -> list[tuple[Optional[str], list[int]]]:
+        indices_by_namespace: dict[Optional[str], list[int]] = {}
+
+        for i, namespace in enumerate(namespaces):
+            indices_by_namespace.setdefault(namespace, []).append(i)
+
+        return [
+            (namespace, indices[start : start + self.upsert_batch_size])
+            for namespace, indices in indices_by_namespace.items()
+            for start in range(0, len(indices), self.upsert_batch_size)
+        ]
+
+    def _get_artifact_vector_id(self, artifact: TextArtifact) -> str:
+        value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+
+        return self._get_default_vector_id(value)
 
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
+
+    def __npy_header(self, shape: tuple[int, int]) -> bytes:
+        header = repr({"descr": "<f4", "fortran_order": False, "shape": shape}).encode("latin1")
+        # Magic string, format version 1.0, and header length, followed by the header padded with spaces.
+        prefix = b"\x93NUMPY\x01\x00" + struct.pack("<H", self.NPY_HEADER_SIZE - 10)
+
+        return prefix + header.ljust(self.NPY_HEADER_SIZE - len(prefix) - 1) + b"\n"
+
+    def __query_cache_key(
+        self, query: str, *, count: Optional[int], namespace: Optional[str], include_vectors: bool, **kwargs
+    ) -> tuple:
+        return query, count, namespace, include_vectors, json.dumps(kwargs, sort_keys=True, default=repr)
+
+    def __query_cache_generation(self, namespace: Optional[str]) -> tuple[int, int]:
+        with self._query_cache_lock:
+            return self._query_cache_epoch, self._query_cache_generations.get(namespace, 0)
+
+    def __get_cached_query(self, key: tuple, generation: tuple[int, int]) -> Optional[list[Entry]]:
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+
+            if cached is None:
+                return None
+
+            cached_at, cached_generation, entries = cached
+
+            if cached_generation != generation or self.__is_expired(cached_at):
+                del self._query_cache[key]
+
+                return None
+
+            self._query_cache.move_to_end(key)
+
+            return entries
+
+    def __get_cached_query_embedding(self, query: str) -> Optional[list[float]]:
+        with self._query_cache_lock:
+            cached = self._query_embedding_cache.get(query)
+
+            if cached is None or self.__is_expired(cached[0]):
+                return None
+
+            self._query_embedding_cache.move_to_end(query)
+
+            return cached[1]
+
+    def __cache_query_embedding(self, query: str, vector: list[float]) -> None:
+        with self._query_cache_lock:
+            self.__cache(self._query_embedding_cache, query, (time.monotonic(), vector))
+
+    def __cache_query(self, key: tuple, generation: tuple[int, int], entries: list[Entry]) -> None:
+        with self._query_cache_lock:
+            self.__cache(self._query_cache, key, (time.monotonic(), generation, entries))
+
+    def __is_expired(self, cached_at: float) -> bool:
+        return self.query_cache_ttl is not None and time.monotonic() - cached_at > self.query_cache_ttl
+
+    def __cache(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+
+        while len(cache) > self.query_cache_size:
+            cache.popitem(last=False)
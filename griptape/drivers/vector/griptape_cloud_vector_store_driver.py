@@ -7,8 +7,10 @@ from urllib.parse import urljoin
 import requests
 from attrs import Factory, define, field
 
+from griptape import utils
 from griptape.drivers.embedding.dummy import DummyEmbeddingDriver
 from griptape.drivers.vector import BaseVectorStoreDriver
+from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
     from griptape.artifacts import ListArtifact, TextArtifact
@@ -52,6 +54,15 @@ class GriptapeCloudVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         raise NotImplementedError(f"{self.__class__.__name__} does not support vector upsert.")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support text artifact upsert.")
+
     def upsert_text_artifact(
         self,
         artifact: TextArtifact,
@@ -116,5 +127,30 @@ class GriptapeCloudVectorStoreDriver(BaseVectorStoreDriver):
         entries = response.get("entries", [])
         return [BaseVectorStoreDriver.Entry.from_dict(entry) for entry in entries]
 
+    def query_many(
+        self,
+        queries: list[str],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: Optional[bool] = None,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Performs several queries on the Knowledge Base concurrently."""
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.query),
+                        query,
+                        count=count,
+                        namespace=namespace,
+                        include_vectors=include_vectors,
+                        **kwargs,
+                    )
+                    for query in queries
+                ]
+            )
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
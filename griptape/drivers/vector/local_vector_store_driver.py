@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import contextlib
+import heapq
+import itertools
 import json
-import operator
 import os
 import threading
-from dataclasses import asdict
-from typing import Callable, NoReturn, Optional, TextIO
+import zlib
+from typing import IO, TYPE_CHECKING, Any, Callable, Literal, NoReturn, Optional, TextIO
 
+import numpy as np
 from attrs import Factory, define, field
 from numpy import dot
 from numpy.linalg import norm
@@ -14,21 +17,192 @@ from numpy.linalg import norm
 from griptape import utils
 from griptape.drivers.vector import BaseVectorStoreDriver
 
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+
+def cosine_relatedness(x: list[float], y: list[float]) -> float:
+    return dot(x, y) / (norm(x) * norm(y))
+
+
+@define
+class _VectorShard:
+    """Vectors of the entries assigned to one shard of a sharded `LocalVectorStoreDriver`."""
+
+    lock: threading.Lock = field(factory=threading.Lock)
+    matrix: Optional[np.ndarray] = field(default=None)
+    norms: Optional[np.ndarray] = field(default=None)
+    sequences: Optional[np.ndarray] = field(default=None)
+    row_keys: list[str] = field(factory=list)
+    key_rows: dict[str, int] = field(factory=dict)
+    key_versions: dict[str, int] = field(factory=dict)
+
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
+    """Local Vector Store Driver.
+
+    Vectors are kept in a contiguous float32 matrix alongside their norms so that queries using the default
+    cosine relatedness are scored with a single matrix-vector product. A custom `calculate_relatedness`
+    is still supported, but is evaluated entry by entry. Entry keys are also indexed by namespace, so namespaced
+    queries and loads only touch the entries in that namespace.
+
+    With `index_type="ivf"`, stores with at least `ivf_min_rows` vectors are searched approximately with an
+    inverted file index: vectors are clustered into `ivf_list_count` lists with spherical k-means, and a query
+    only scores the vectors in the `ivf_probe_count` lists whose centroids are closest to it. Candidates are
+    scored exactly, and more lists are probed until there are at least `count` candidates. New vectors are
+    added to the closest list, and the lists are retrained by upserts as the store grows. Training doesn't hold
+    the store lock, and queries use exact search until the first index is trained. In binary mode, the index is
+    persisted to `<persist_file>.ivf.npz`.
+
+    With `vector_dtype` set to `float16` or `int8`, queries first scan a compressed in-memory copy of the vectors
+    (`int8` vectors are scaled per vector) and then re-rank the best `count * rerank_factor` candidates with the
+    float32 vectors. Quantized vectors require `persist_format="binary"`, so that the float32 vectors stay in the
+    memory-mapped file and only the rows being re-ranked are read from it.
+
+    Queries can be filtered on `meta` with a `filter` dict that maps `meta` keys to a value, or to a dict of
+    `$eq`, `$in`, `$gt`, `$gte`, `$lt`, and `$lte` operators, e.g. `{"source": {"$in": ["a", "b"]}, "page":
+    {"$gte": 10}}`. Filtered keys are indexed the first time they are used, and matching entries are looked up
+    in the index before scoring.
+
+    With `shard_count` greater than 1, vectors are split across `shard_count` matrices by a hash of their key. Each
+    shard has its own lock, so upserts only lock the shards they write to, and queries score the shards in parallel
+    on a thread pool (numpy releases the GIL during matrix products) before merging the per-shard top `count`
+    entries with a heap. Sharding supports exact `float32` search and isn't supported with `persist_format="binary"`,
+    `index_type="ivf"`, or a quantized `vector_dtype`.
+
+    With `persist_format="json"` the whole store is rewritten to `persist_file` on every upsert. With
+    `persist_format="binary"`, `persist_file` is an append-only JSONL metadata log and vectors are written
+    in place to a memory-mapped float32 file next to it (`<persist_file>.vectors`). Upserts only append to
+    the log, startup only reads the log, and the vector file doesn't need to fit in memory. Superseded log
+    records are dropped by `compact()`. In binary mode, `entries` don't hold vectors; they are read from the
+    vector file when entries are loaded or queried.
+
+    Attributes:
+        entries: Entries in the store, keyed by their namespaced id.
+        persist_file: Optional path used to persist the entries.
+        persist_format: Format used to persist the entries, either `json` or `binary`.
+        calculate_relatedness: Function used to score a query vector against a stored vector.
+        thread_lock: Lock guarding writes to the store.
+        index_type: Index used by queries, either exact `flat` search or approximate `ivf` search.
+        ivf_list_count: Number of IVF lists. Defaults to four times the square root of the number of vectors.
+        ivf_probe_count: Minimum number of IVF lists scored per query. Higher values trade latency for recall.
+        ivf_min_rows: Number of vectors below which queries use exact search even with `index_type="ivf"`.
+        vector_dtype: Data type of the vectors scanned by queries, either `float32`, `float16`, or `int8`.
+        rerank_factor: Multiple of `count` that is re-ranked at full precision when `vector_dtype` isn't `float32`.
+        shard_count: Number of shards the vectors are split across.
+    """
+
+    INITIAL_INDEX_CAPACITY = 1024
+    __MISSING = object()
+    VECTORS_FILE_SUFFIX = ".vectors"
+    IVF_FILE_SUFFIX = ".ivf.npz"
+    IVF_TRAINING_ITERATIONS = 10
+    IVF_TRAINING_ROWS_PER_LIST = 64
+    IVF_MAX_TRAINING_ROWS = 65536
+    IVF_RETRAINING_GROWTH = 4
+    IVF_ASSIGNMENT_BATCH_SIZE = 8192
+    QUANTIZED_SCAN_BATCH_SIZE = 65536
+    QUERY_BATCH_SIZE = 16
+    RANGE_FILTER_OPERATORS = ("$gt", "$gte", "$lt", "$lte")
+
     entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
     persist_file: Optional[str] = field(default=None)
-    calculate_relatedness: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    persist_format: Literal["json", "binary"] = field(default="json")
+    calculate_relatedness: Callable = field(default=cosine_relatedness)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    index_type: Literal["flat", "ivf"] = field(default="flat")
+    ivf_list_count: Optional[int] = field(default=None)
+    ivf_probe_count: int = field(default=8)
+    ivf_min_rows: int = field(default=10_000)
+    vector_dtype: Literal["float32", "float16", "int8"] = field(default="float32")
+    rerank_factor: int = field(default=4)
+    shard_count: int = field(default=1)
+    _matrix: Optional[np.ndarray] = field(default=None, init=False, eq=False, repr=False)
+    _norms: Optional[np.ndarray] = field(default=None, init=False, eq=False, repr=False)
+    _row_keys: list[str] = field(factory=list, init=False, eq=False, repr=False)
+    _key_rows: dict[str, int] = field(factory=dict, init=False, eq=False, repr=False)
+    _key_namespaces: dict[str, Optional[str]] = field(factory=dict, init=False, eq=False, repr=False)
+    _namespace_keys: dict[Optional[str], dict[str, None]] = field(factory=dict, init=False, eq=False, repr=False)
+    _log_file: Optional[IO] = field(default=None, init=False, eq=False, repr=False)
+    _ivf_centroids: Optional[np.ndarray] = field(default=None, init=False, eq=False, repr=False)
+    _ivf_assignments: Optional[np.ndarray] = field(default=None, init=False, eq=False, repr=False)
+    _ivf_lists: list[list[int]] = field(factory=list, init=False, eq=False, repr=False)
+    _ivf_trained_rows: int = field(default=0, init=False, eq=False, repr=False)
+    _ivf_training_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False, repr=False)
+    _ivf_dirty_rows: Optional[set[int]] = field(default=None, init=False, eq=False, repr=False)
+    _quantized: Optional[np.ndarray] = field(default=None, init=False, eq=False, repr=False)
+    _scales: Optional[np.ndarray] = field(default=None, init=False, eq=False, repr=False)
+    _meta_indexes: dict[str, dict[Any, set[str]]] = field(factory=dict, init=False, eq=False, repr=False)
+    _meta_range_indexes: dict[str, tuple[np.ndarray, list[str]]] = field(factory=dict, init=False, eq=False, repr=False)
+    _shards: list[_VectorShard] = field(factory=list, init=False, eq=False, repr=False)
+    _shard_keys: dict[str, tuple[int, int]] = field(factory=dict, init=False, eq=False, repr=False)
+    _shard_dimensions: Optional[int] = field(default=None, init=False, eq=False, repr=False)
+
+    @persist_format.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_persist_format(self, _: str, persist_format: str) -> None:
+        if persist_format not in ("json", "binary"):
+            raise ValueError(f"Unsupported persist format: {persist_format}")
+
+    @index_type.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_index_type(self, _: str, index_type: str) -> None:
+        if index_type not in ("flat", "ivf"):
+            raise ValueError(f"Unsupported index type: {index_type}")
+
+    @vector_dtype.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_vector_dtype(self, _: str, vector_dtype: str) -> None:
+        if vector_dtype not in ("float32", "float16", "int8"):
+            raise ValueError(f"Unsupported vector dtype: {vector_dtype}")
+
+    @shard_count.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_shard_count(self, _: str, shard_count: int) -> None:
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1.")
+
+    @property
+    def sharded(self) -> bool:
+        return self.shard_count > 1
+
+    @property
+    def vectors_file(self) -> Optional[str]:
+        if self.persist_file is None or self.persist_format != "binary":
+            return None
+        else:
+            return f"{self.persist_file}{self.VECTORS_FILE_SUFFIX}"
+
+    @property
+    def ivf_file(self) -> Optional[str]:
+        if self.vectors_file is None or self.index_type != "ivf":
+            return None
+        else:
+            return f"{self.persist_file}{self.IVF_FILE_SUFFIX}"
 
     def __attrs_post_init__(self) -> None:
+        if self.sharded and (
+            self.persist_format == "binary" or self.index_type != "flat" or self.vector_dtype != "float32"
+        ):
+            raise ValueError('Sharding requires persist_format="json", index_type="flat", and vector_dtype="float32".')
+
+        if self.vector_dtype != "float32" and self.vectors_file is None:
+            # In memory, the compressed vectors would be kept on top of the float32 vectors rather than instead of them.
+            raise ValueError(
+                f'vector_dtype="{self.vector_dtype}" requires a persist_file with persist_format="binary".'
+            )
+
         if self.persist_file is not None:
             directory = os.path.dirname(self.persist_file)
 
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
 
+            if self.persist_format == "binary":
+                with self.thread_lock:
+                    self.__load_binary_store()
+
+                self.__train_stale_ivf_index()
+
+                return
+
             if not os.path.isfile(self.persist_file):
                 with open(self.persist_file, "w") as file:
                     self.__save_entries_to_file(file)
@@ -39,6 +213,11 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
                 else:
                     self.__save_entries_to_file(file)
 
+        with self.thread_lock:
+            self.__rebuild_index()
+
+        self.__train_stale_ivf_index()
+
     def load_entries_from_file(self, json_file: TextIO) -> dict[str, BaseVectorStoreDriver.Entry]:
         with self.thread_lock:
             data = json.load(json_file)
@@ -54,29 +233,85 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         meta: Optional[dict] = None,
         **kwargs,
     ) -> str:
-        vector_id = vector_id or utils.str_to_hash(str(vector))
+        return self.upsert_vectors(
+            [BaseVectorStoreDriver.Entry(id=vector_id or "", vector=vector, namespace=namespace, meta=meta)]
+        )[0]
+
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        if self.sharded:
+            return self.__upsert_sharded_vectors(entries)
+
+        binary = self.vectors_file is not None
+        vector_ids = []
 
         with self.thread_lock:
-            self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
-                id=vector_id,
-                vector=vector,
-                meta=meta,
-                namespace=namespace,
-            )
+            for entry in entries:
+                vector_id = entry.id or utils.str_to_hash(str(entry.vector))
+                key = self.__namespaced_vector_id(vector_id, namespace=entry.namespace)
+                previous = self.entries.get(key)
+                self.entries[key] = self.Entry(
+                    id=vector_id,
+                    vector=None if binary else entry.vector,
+                    meta=entry.meta,
+                    namespace=entry.namespace,
+                )
+                row = self.__index_vector(key, entry.vector)  # pyright: ignore[reportArgumentType]
 
-        if self.persist_file is not None:
-            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
+                self.__index_namespace(key, entry.namespace)
+                self.__index_meta(key, previous.meta if previous is not None else None, entry.meta)
+
+                if binary:
+                    self.__append_log_record(key, row)
+
+                vector_ids.append(vector_id)
+
+        if self.persist_file is not None and not binary:
+            # Rewrites the whole store on every upsert; use persist_format="binary" for append-only persistence.
             with open(self.persist_file, "w") as file:
                 self.__save_entries_to_file(file)
 
-        return vector_id
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+        self.__train_stale_ivf_index()
+
+        return vector_ids
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+        key = self.__namespaced_vector_id(vector_id, namespace=namespace)
+        entry = self.entries.get(key, None)
+
+        return None if entry is None else self.__entry_with_vector(key, entry)
+
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        return [self.load_entry(vector_id, namespace=namespace) for vector_id in vector_ids]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        return [self.__namespaced_vector_id(vector_id, namespace=namespace) in self.entries for vector_id in vector_ids]
 
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        if namespace is None:
+            return [self.__entry_with_vector(key, entry) for key, entry in self.entries.items()]
+        else:
+            return [self.__entry_with_vector(key, self.entries[key]) for key in self.__namespace_keys(namespace)]
+
+    def export_entries(
+        self, *, namespace: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Streams entries out of the store, reading the vectors of a binary store one entry at a time."""
+        keys = list(self.entries.keys()) if namespace is None else self.__namespace_keys(namespace)
+
+        for key in keys:
+            entry = self.entries.get(key)
+
+            if entry is not None:
+                yield self.__entry_with_vector(key, entry)
+
+    def count_entries(self, *, namespace: Optional[str] = None) -> int:
+        if namespace is None:
+            return len(self.entries)
+        else:
+            return len(self.__namespace_keys(namespace))
 
     def query_vector(
         self,
@@ -85,40 +320,1100 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        filter: Optional[dict] = None,  # noqa: A002
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
+        keys = self.__query_keys(namespace, filter)
+
+        if self.calculate_relatedness is cosine_relatedness and self.sharded:
+            keys_and_scores = self.__score_with_shards([vector], count=count, keys=keys)[0]
+        elif self.calculate_relatedness is cosine_relatedness:
+            keys_and_scores = self.__score_with_index(vector, count=count, keys=keys)
+        else:
+            keys_and_scores = self.__score_with_callable(vector, count=count, keys=keys)
+
+        return self.__query_entries(keys_and_scores, include_vectors=include_vectors)
+
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        filter: Optional[dict] = None,  # noqa: A002
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Queries several vectors at once.
+
+        Exact searches score all vectors with a single matrix-matrix product and select each query's top `count`
+        entries in one batched pass.
+        """
+        keys = self.__query_keys(namespace, filter)
+
+        if self.calculate_relatedness is cosine_relatedness and self.sharded:
+            keys_and_scores_list = self.__score_with_shards(vectors, count=count, keys=keys)
+        elif self.calculate_relatedness is cosine_relatedness:
+            keys_and_scores_list = self.__score_many_with_index(vectors, count=count, keys=keys)
         else:
-            entries = self.entries
+            keys_and_scores_list = [self.__score_with_callable(vector, count=count, keys=keys) for vector in vectors]
 
-        entries_and_relatednesses = [
-            (entry, self.calculate_relatedness(vector, entry.vector)) for entry in list(entries.values())
+        return [
+            self.__query_entries(keys_and_scores, include_vectors=include_vectors)
+            for keys_and_scores in keys_and_scores_list
         ]
 
-        entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+    def delete_vector(self, vector_id: str) -> NoReturn:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+
+    def compact(self) -> None:
+        """Compacts the persisted store.
+
+        In binary mode, flushes the vector file to disk and rewrites the metadata log with a single record per
+        entry. In JSON mode, rewrites the JSON file.
+        """
+        if self.persist_file is None:
+            return
+
+        if self.vectors_file is None:
+            with open(self.persist_file, "w") as file:
+                self.__save_entries_to_file(file)
+
+            return
+
+        with self.thread_lock:
+            self.__close_log_file()
+
+            if self._matrix is None:
+                return
+
+            dimensions = self._matrix.shape[1]
+            temp_file = f"{self.persist_file}.tmp"
+
+            with open(temp_file, "w") as file:
+                file.write(json.dumps({"dimensions": dimensions}) + "\n")
+
+                for row, key in enumerate(self._row_keys):
+                    file.write(json.dumps(self.__log_record(key, row)) + "\n")
+
+            self._matrix.flush()  # pyright: ignore[reportAttributeAccessIssue]
+
+            os.replace(temp_file, self.persist_file)
+
+            self.__save_ivf_index()
+
+    def __upsert_sharded_vectors(self, entries: list[BaseVectorStoreDriver.Entry]) -> list[str]:
+        vector_ids = []
+        shard_vectors: dict[int, list[tuple[str, np.ndarray, int, int]]] = {}
+
+        # Entries and the namespace and meta indexes are updated under the store lock, which is only held briefly.
+        with self.thread_lock:
+            vectors = [np.asarray(entry.vector, dtype=np.float32) for entry in entries]
+
+            for vector in vectors:
+                self.__check_shard_dimensions(len(vector))
+
+            for entry, vector in zip(entries, vectors):
+                vector_id = entry.id or utils.str_to_hash(str(entry.vector))
+                key = self.__namespaced_vector_id(vector_id, namespace=entry.namespace)
+                previous = self.entries.get(key)
+                self.entries[key] = self.Entry(
+                    id=vector_id, vector=entry.vector, meta=entry.meta, namespace=entry.namespace
+                )
+
+                self.__index_namespace(key, entry.namespace)
+                self.__index_meta(key, previous.meta if previous is not None else None, entry.meta)
+
+                # New keys get the next sequence number, which breaks ties between shards in insertion order. Every
+                # upsert of a key bumps its version, so that a concurrent upsert with an older vector can't overwrite
+                # the shard row after a newer one was written.
+                sequence, version = self._shard_keys.get(key, (len(self._shard_keys), -1))
+                self._shard_keys[key] = (sequence, version + 1)
+
+                shard_vectors.setdefault(self.__shard_index(key), []).append((key, vector, sequence, version + 1))
+                vector_ids.append(vector_id)
 
-        result = [
-            BaseVectorStoreDriver.Entry(
-                id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta, namespace=er[0].namespace
+            shards = self._shards
+
+        # Vectors are written under the locks of their shards only.
+        for shard_index, key_vectors in shard_vectors.items():
+            shard = shards[shard_index]
+
+            with shard.lock:
+                for key, vector, sequence, version in key_vectors:
+                    self.__index_shard_vector(shard, key, vector, sequence, version)
+
+        if self.persist_file is not None:
+            with open(self.persist_file, "w") as file:
+                self.__save_entries_to_file(file)
+
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+        return vector_ids
+
+    def __check_shard_dimensions(self, dimensions: int) -> None:
+        if self._shard_dimensions is None:
+            self._shard_dimensions = dimensions
+        elif self._shard_dimensions != dimensions:
+            raise ValueError(
+                f"Vector dimension {dimensions} does not match the store dimension {self._shard_dimensions}."
             )
-            for er in entries_and_relatednesses
-        ][:count]
 
-        if include_vectors:
-            return result
+    def __index_shard_vector(
+        self, shard: _VectorShard, key: str, vector: np.ndarray, sequence: int, version: int
+    ) -> None:
+        if shard.key_versions.get(key, -1) > version:
+            # A newer vector for the key was already written.
+            return
+
+        if shard.matrix is None or shard.norms is None or shard.sequences is None:
+            shard.matrix = np.empty((self.INITIAL_INDEX_CAPACITY, len(vector)), dtype=np.float32)
+            shard.norms = np.empty(self.INITIAL_INDEX_CAPACITY, dtype=np.float32)
+            shard.sequences = np.empty(self.INITIAL_INDEX_CAPACITY, dtype=np.int64)
+
+        row = shard.key_rows.get(key)
+
+        if row is None:
+            row = len(shard.row_keys)
+
+            if row >= len(shard.matrix):
+                # Queries may still be reading the previous arrays, so they're copied rather than resized in place.
+                shard.matrix = self.__grow_matrix(shard.matrix, row)
+                shard.norms = np.concatenate([shard.norms, np.empty(len(shard.norms), dtype=np.float32)])
+                shard.sequences = np.concatenate([shard.sequences, np.empty(len(shard.sequences), dtype=np.int64)])
+
+            shard.sequences[row] = sequence
+            shard.row_keys.append(key)
+            shard.key_rows[key] = row
+
+        shard.matrix[row] = vector
+        shard.norms[row] = np.linalg.norm(vector)
+        shard.key_versions[key] = version
+
+    def __score_with_shards(
+        self, vectors: list[list[float]], *, count: Optional[int], keys: Optional[list[str]]
+    ) -> list[list[tuple[str, float]]]:
+        with self.thread_lock:
+            if len(self._shard_keys) != len(self.entries):
+                # Entries were modified without going through upsert_vector.
+                self.__rebuild_index()
+
+            shards = self._shards
+
+        if not vectors:
+            return []
+
+        if keys is None:
+            shard_keys: list[Optional[list[str]]] = [None] * len(shards)
         else:
-            return [
-                BaseVectorStoreDriver.Entry(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-                for r in result
+            shard_keys = [[] for _ in shards]
+
+            for key in keys:
+                shard_keys[self.__shard_index(key)].append(key)  # pyright: ignore[reportOptionalMemberAccess]
+
+        queries = np.asarray(vectors, dtype=np.float32)
+
+        with self.create_futures_executor() as futures_executor:
+            shard_results = utils.execute_futures_list(
+                [
+                    futures_executor.submit(self.__score_shard, shard, queries, count=count, keys=shard_key_list)
+                    for shard, shard_key_list in zip(shards, shard_keys)
+                ]
+            )
+
+        # Every shard's results are sorted by descending score, so they're merged lazily up to `count`.
+        return [
+            [
+                (key, score)
+                for key, score, _ in itertools.islice(
+                    heapq.merge(*(results[i] for results in shard_results), key=lambda kss: (-kss[1], kss[2])),
+                    count,
+                )
             ]
+            for i in range(len(queries))
+        ]
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
-        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+    def __score_shard(
+        self, shard: _VectorShard, queries: np.ndarray, *, count: Optional[int], keys: Optional[list[str]]
+    ) -> list[list[tuple[str, float, int]]]:
+        with shard.lock:
+            row_count = len(shard.row_keys)
+            matrix = shard.matrix[:row_count] if shard.matrix is not None else None
+            norms = shard.norms[:row_count] if shard.norms is not None else None
+            sequences = shard.sequences[:row_count] if shard.sequences is not None else None
+            row_keys = shard.row_keys
+
+        if matrix is None or norms is None or sequences is None or row_count == 0 or keys == []:
+            return [[] for _ in queries]
+
+        if keys is None:
+            rows = np.arange(row_count)
+            candidates = matrix
+            candidate_norms = norms
+        else:
+            key_rows = shard.key_rows
+            rows = np.sort(
+                np.fromiter(
+                    (row for row in (key_rows.get(key) for key in keys) if row is not None and row < row_count),
+                    dtype=np.intp,
+                )
+            )
+            candidates = matrix[rows]
+            candidate_norms = norms[rows]
+
+        query_norms = np.linalg.norm(queries, axis=1)
+        result = []
+
+        for start in range(0, len(queries), self.QUERY_BATCH_SIZE):
+            end = start + self.QUERY_BATCH_SIZE
+            denominators = candidate_norms[:, None] * query_norms[None, start:end]
+            scores = np.divide(
+                candidates @ queries[start:end].T,
+                denominators,
+                out=np.zeros(denominators.shape, dtype=np.float32),
+                where=denominators > 0,
+            )
+            top = self.__top_k_columns(scores, count)
+
+            for column in range(scores.shape[1]):
+                result.append(
+                    [(row_keys[rows[i]], float(scores[i, column]), int(sequences[rows[i]])) for i in top[:, column]]
+                )
+
+        return result
+
+    def __shard_index(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % self.shard_count
+
+    def __score_with_index(
+        self, vector: list[float], *, count: Optional[int], keys: Optional[list[str]]
+    ) -> list[tuple[str, float]]:
+        row_keys, matrix, norms, quantized, scales = self.__index_snapshot()
+
+        if matrix is None or norms is None or not row_keys:
+            return []
+
+        query = np.asarray(vector, dtype=np.float32)
+        rows = self.__key_rows_array(keys, len(row_keys))
+
+        if self.index_type == "ivf" and count is not None and len(row_keys) >= self.ivf_min_rows:
+            rows = self.__ivf_candidate_rows(query, count=count, rows=rows, row_count=len(row_keys))
+
+        candidate_count = len(rows) if rows is not None else len(row_keys)
+
+        if candidate_count == 0:
+            return []
+
+        if (
+            quantized is not None
+            and scales is not None
+            and count is not None
+            and count * self.rerank_factor < candidate_count
+        ):
+            # Shortlist candidates with the compressed vectors and re-rank the shortlist at full precision below.
+            denominators = (norms[rows] if rows is not None else norms) * np.linalg.norm(query)
+            approximate_scores = np.divide(
+                self.__quantized_dot(quantized, scales, rows, query),
+                denominators,
+                out=np.zeros(candidate_count, dtype=np.float32),
+                where=denominators > 0,
+            )
+            shortlist = self.__top_k(approximate_scores, count * self.rerank_factor)
+            rows = shortlist if rows is None else rows[shortlist]
+
+        if rows is not None:
+            candidates = matrix[rows]
+            candidate_norms = norms[rows]
+        else:
+            candidates = matrix
+            candidate_norms = norms
+
+        denominators = candidate_norms * np.linalg.norm(query)
+        scores = np.divide(
+            candidates @ query, denominators, out=np.zeros(len(candidates), dtype=np.float32), where=denominators > 0
+        )
+        top = self.__top_k(scores, count)
+
+        if rows is not None:
+            return [(row_keys[rows[i]], float(scores[i])) for i in top]
+        else:
+            return [(row_keys[i], float(scores[i])) for i in top]
+
+    def __score_many_with_index(
+        self, vectors: list[list[float]], *, count: Optional[int], keys: Optional[list[str]]
+    ) -> list[list[tuple[str, float]]]:
+        row_keys, matrix, norms, quantized, _ = self.__index_snapshot()
+
+        if matrix is None or norms is None or not row_keys or not vectors:
+            return [[] for _ in vectors]
+
+        rows = self.__key_rows_array(keys, len(row_keys))
+        candidate_count = len(rows) if rows is not None else len(row_keys)
+
+        if count is not None and (
+            (self.index_type == "ivf" and len(row_keys) >= self.ivf_min_rows)
+            or (quantized is not None and count * self.rerank_factor < candidate_count)
+        ):
+            # Approximate searches pick different candidates for every query, so they're scored one by one.
+            return [self.__score_with_index(vector, count=count, keys=keys) for vector in vectors]
+
+        if candidate_count == 0:
+            return [[] for _ in vectors]
+
+        if rows is not None:
+            candidates = matrix[rows]
+            candidate_norms = norms[rows]
+        else:
+            candidates = matrix
+            candidate_norms = norms
+
+        queries = np.asarray(vectors, dtype=np.float32)
+        query_norms = np.linalg.norm(queries, axis=1)
+        result = []
+
+        # Score the queries in batches so that the score matrix stays small for large stores.
+        for start in range(0, len(queries), self.QUERY_BATCH_SIZE):
+            end = start + self.QUERY_BATCH_SIZE
+            denominators = candidate_norms[:, None] * query_norms[None, start:end]
+            scores = np.divide(
+                candidates @ queries[start:end].T,
+                denominators,
+                out=np.zeros(denominators.shape, dtype=np.float32),
+                where=denominators > 0,
+            )
+            top = self.__top_k_columns(scores, count)
+
+            for column in range(scores.shape[1]):
+                result.append(
+                    [(row_keys[rows[i] if rows is not None else i], float(scores[i, column])) for i in top[:, column]]
+                )
+
+        return result
+
+    def __score_with_callable(
+        self, vector: list[float], *, count: Optional[int], keys: Optional[list[str]]
+    ) -> list[tuple[str, float]]:
+        if keys is None:
+            keys = list(self.entries.keys())
+
+        keys_and_scores = [
+            (key, self.calculate_relatedness(vector, self.__entry_vector(key, self.entries[key]))) for key in keys
+        ]
+
+        if count is None or count >= len(keys_and_scores):
+            return sorted(keys_and_scores, key=lambda ks: ks[1], reverse=True)
+        else:
+            return heapq.nlargest(count, keys_and_scores, key=lambda ks: ks[1])
+
+    def __top_k(self, scores: np.ndarray, count: Optional[int]) -> np.ndarray:
+        if count is None or count >= len(scores):
+            return np.argsort(-scores, kind="stable")
+        elif count <= 0:
+            return np.empty(0, dtype=np.intp)
+        else:
+            top = np.argpartition(-scores, count - 1)[:count]
+
+            return top[np.argsort(-scores[top], kind="stable")]
+
+    def __top_k_columns(self, scores: np.ndarray, count: Optional[int]) -> np.ndarray:
+        if count is None or count >= len(scores):
+            return np.argsort(-scores, axis=0, kind="stable")
+        elif count <= 0:
+            return np.empty((0, scores.shape[1]), dtype=np.intp)
+        else:
+            top = np.argpartition(-scores, count - 1, axis=0)[:count]
+            order = np.argsort(-np.take_along_axis(scores, top, axis=0), axis=0, kind="stable")
+
+            return np.take_along_axis(top, order, axis=0)
+
+    def __index_snapshot(
+        self,
+    ) -> tuple[list[str], Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
+        with self.thread_lock:
+            if self.vectors_file is None and len(self._row_keys) != len(self.entries):
+                # Entries were modified without going through upsert_vector.
+                self.__rebuild_index()
+
+            row_keys = self._row_keys
+            row_count = len(row_keys)
+
+            return (
+                row_keys,
+                self._matrix[:row_count] if self._matrix is not None else None,
+                self._norms[:row_count] if self._norms is not None else None,
+                self._quantized[:row_count] if self._quantized is not None else None,
+                self._scales[:row_count] if self._scales is not None else None,
+            )
+
+    def __key_rows_array(self, keys: Optional[list[str]], row_count: int) -> Optional[np.ndarray]:
+        if keys is None:
+            return None
+
+        key_rows = self._key_rows
+
+        return np.sort(
+            np.fromiter(
+                (row for row in (key_rows.get(key) for key in keys) if row is not None and row < row_count),
+                dtype=np.intp,
+            )
+        )
+
+    def __query_entries(
+        self, keys_and_scores: list[tuple[str, float]], *, include_vectors: bool
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        result = []
+
+        for key, score in keys_and_scores:
+            entry = self.entries[key]
+
+            result.append(
+                BaseVectorStoreDriver.Entry(
+                    id=entry.id,
+                    vector=self.__entry_vector(key, entry) if include_vectors else [],
+                    score=score,
+                    meta=entry.meta,
+                    namespace=entry.namespace,
+                )
+            )
+
+        return result
+
+    def __index_vector(self, key: str, vector: list[float]) -> int:
+        row_vector = np.asarray(vector, dtype=np.float32)
+
+        if self._matrix is None or self._norms is None:
+            self._matrix = self.__allocate_matrix(self.INITIAL_INDEX_CAPACITY, len(row_vector))
+            self._norms = np.empty(self.INITIAL_INDEX_CAPACITY, dtype=np.float32)
+        elif self._matrix.shape[1] != len(row_vector):
+            raise ValueError(
+                f"Vector dimension {len(row_vector)} does not match the store dimension {self._matrix.shape[1]}."
+            )
+
+        row = self._key_rows.get(key)
+
+        if row is None:
+            row = len(self._row_keys)
+
+            # Grow geometrically so that appends are amortized O(1).
+            if row >= len(self._matrix):
+                self._matrix = self.__grow_matrix(self._matrix, row)
+
+            if row >= len(self._norms):
+                self._norms = np.concatenate([self._norms, np.empty(max(len(self._norms), 1), dtype=np.float32)])
+
+            self._row_keys.append(key)
+            self._key_rows[key] = row
+
+        self._matrix[row] = row_vector
+        self._norms[row] = np.linalg.norm(row_vector)
+
+        if self.vector_dtype != "float32":
+            self.__quantize_rows(row, row_vector[None])
+
+        if self._ivf_centroids is not None:
+            self.__assign_ivf_rows(np.array([row], dtype=np.intp))
+
+        if self._ivf_dirty_rows is not None:
+            self._ivf_dirty_rows.add(row)
+
+        return row
+
+    def __quantize_rows(self, start: int, vectors: np.ndarray) -> None:
+        capacity = len(self._norms)  # pyright: ignore[reportArgumentType]
+
+        if self._quantized is None or self._scales is None or len(self._quantized) < capacity:
+            quantized = np.zeros((capacity, vectors.shape[1]), dtype=self.vector_dtype)
+            scales = np.ones(capacity, dtype=np.float32)
+
+            if self._quantized is not None and self._scales is not None:
+                quantized[: len(self._quantized)] = self._quantized
+                scales[: len(self._scales)] = self._scales
+
+            self._quantized = quantized
+            self._scales = scales
+
+        end = start + len(vectors)
+
+        if self.vector_dtype == "int8":
+            # Symmetric scalar quantization with one scale per vector.
+            maximums = np.abs(vectors).max(axis=1)
+            scales = np.where(maximums > 0, maximums / 127, 1).astype(np.float32)
+
+            self._quantized[start:end] = np.rint(vectors / scales[:, None]).astype(np.int8)
+            self._scales[start:end] = scales
+        else:
+            finfo = np.finfo(np.float16)
+
+            self._quantized[start:end] = np.clip(vectors, finfo.min, finfo.max).astype(np.float16)
+
+    def __quantized_dot(
+        self, quantized: np.ndarray, scales: np.ndarray, rows: Optional[np.ndarray], query: np.ndarray
+    ) -> np.ndarray:
+        row_count = len(rows) if rows is not None else len(quantized)
+        dots = np.empty(row_count, dtype=np.float32)
+
+        # Dequantize in batches so that the scan never holds a float32 copy of the whole store.
+        for start in range(0, row_count, self.QUANTIZED_SCAN_BATCH_SIZE):
+            end = start + self.QUANTIZED_SCAN_BATCH_SIZE
+            batch = quantized[rows[start:end]] if rows is not None else quantized[start:end]
+            dots[start:end] = batch.astype(np.float32) @ query
+
+        return dots * (scales[rows] if rows is not None else scales)
+
+    def __allocate_matrix(self, capacity: int, dimensions: int) -> np.ndarray:
+        if self.vectors_file is None:
+            return np.empty((capacity, dimensions), dtype=np.float32)
+        else:
+            with open(self.persist_file, "a") as file:  # pyright: ignore[reportArgumentType, reportCallIssue]
+                file.write(json.dumps({"dimensions": dimensions}) + "\n")
+
+            self.__truncate_vectors_file(capacity, dimensions)
+
+            return self.__open_vectors_file(capacity, dimensions)
+
+    def __grow_matrix(self, matrix: np.ndarray, row_count: int) -> np.ndarray:
+        capacity = max(len(matrix) * 2, self.INITIAL_INDEX_CAPACITY)
+
+        if self.vectors_file is None:
+            grown = np.empty((capacity, matrix.shape[1]), dtype=np.float32)
+            grown[:row_count] = matrix[:row_count]
+
+            return grown
+        else:
+            self.__truncate_vectors_file(capacity, matrix.shape[1])
+
+            return self.__open_vectors_file(capacity, matrix.shape[1])
+
+    def __index_namespace(self, key: str, namespace: Optional[str]) -> None:
+        if key in self._key_namespaces:
+            previous = self._key_namespaces[key]
+
+            if previous == namespace:
+                return
+
+            # Namespaces can share keys, e.g. namespace `a` with id `b-c` and namespace `a-b` with id `c`.
+            self._namespace_keys[previous].pop(key, None)
+
+        self._key_namespaces[key] = namespace
+        self._namespace_keys.setdefault(namespace, {})[key] = None
+
+    def __namespace_keys(self, namespace: Optional[str]) -> list[str]:
+        with self.thread_lock:
+            if len(self._key_namespaces) != len(self.entries):
+                # Entries were modified without going through upsert_vector.
+                self.__rebuild_namespace_index()
+
+            return list(self._namespace_keys.get(namespace, {}))
+
+    def __query_keys(self, namespace: Optional[str], meta_filter: Optional[dict]) -> Optional[list[str]]:
+        """Returns the keys of the entries matching `namespace` and `meta_filter`, or `None` if all entries match."""
+        if not namespace and not meta_filter:
+            return None
+
+        with self.thread_lock:
+            if len(self._key_namespaces) != len(self.entries):
+                # Entries were modified without going through upsert_vector.
+                self.__rebuild_namespace_index()
+
+            key_sets: list[Collection[str]] = [self._namespace_keys.get(namespace, {}).keys()] if namespace else []
+            key_sets.extend(
+                self.__filter_field_keys(meta_key, condition) for meta_key, condition in (meta_filter or {}).items()
+            )
+            key_sets.sort(key=len)
+
+            return [key for key in key_sets[0] if all(key in key_set for key_set in key_sets[1:])]
+
+    def __filter_field_keys(self, meta_key: str, condition: Any) -> set[str]:
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        meta_index = self.__meta_index(meta_key)
+        key_sets = []
+        bounds = {}
+
+        for operator, operand in condition.items():
+            if operator == "$eq":
+                key_sets.append(self.__meta_index_lookup(meta_index, operand))
+            elif operator == "$in":
+                key_sets.append(set().union(*(self.__meta_index_lookup(meta_index, value) for value in operand)))
+            elif operator in self.RANGE_FILTER_OPERATORS:
+                bounds[operator] = operand
+            else:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+
+        if bounds:
+            key_sets.append(self.__meta_range_keys(meta_key, bounds))
+
+        if not key_sets:
+            return set()
+
+        key_sets.sort(key=len)
+
+        return key_sets[0].intersection(*key_sets[1:])
+
+    def __meta_index(self, meta_key: str) -> dict[Any, set[str]]:
+        meta_index = self._meta_indexes.get(meta_key)
+
+        if meta_index is None:
+            meta_index = self._meta_indexes[meta_key] = {}
+
+            for key, entry in self.entries.items():
+                if entry.meta is not None and meta_key in entry.meta:
+                    self.__add_to_meta_index(meta_index, key, entry.meta[meta_key])
+
+        return meta_index
+
+    def __meta_index_lookup(self, meta_index: dict[Any, set[str]], value: Any) -> set[str]:
+        try:
+            return meta_index.get(value, set())
+        except TypeError:
+            # Unhashable values are never indexed, so they can't match.
+            return set()
+
+    def __meta_range_keys(self, meta_key: str, bounds: dict[str, Any]) -> set[str]:
+        range_index = self._meta_range_indexes.get(meta_key)
+
+        if range_index is None:
+            pairs = sorted(
+                (value, key)
+                for value, keys in self.__meta_index(meta_key).items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+                for key in keys
+            )
+            range_index = self._meta_range_indexes[meta_key] = (
+                np.array([value for value, _ in pairs], dtype=np.float64),
+                [key for _, key in pairs],
+            )
+
+        values, keys = range_index
+        start = 0
+        end = len(values)
+
+        if "$gt" in bounds:
+            start = max(start, int(np.searchsorted(values, bounds["$gt"], side="right")))
+        if "$gte" in bounds:
+            start = max(start, int(np.searchsorted(values, bounds["$gte"], side="left")))
+        if "$lt" in bounds:
+            end = min(end, int(np.searchsorted(values, bounds["$lt"], side="left")))
+        if "$lte" in bounds:
+            end = min(end, int(np.searchsorted(values, bounds["$lte"], side="right")))
+
+        return set(keys[start:end])
+
+    def __index_meta(self, key: str, previous_meta: Optional[dict], meta: Optional[dict]) -> None:
+        for meta_key, meta_index in self._meta_indexes.items():
+            previous_value = (previous_meta or {}).get(meta_key, self.__MISSING)
+            value = (meta or {}).get(meta_key, self.__MISSING)
+
+            if previous_value is not self.__MISSING:
+                self.__remove_from_meta_index(meta_index, key, previous_value)
+
+            if value is not self.__MISSING:
+                self.__add_to_meta_index(meta_index, key, value)
+
+            self._meta_range_indexes.pop(meta_key, None)
+
+    def __add_to_meta_index(self, meta_index: dict[Any, set[str]], key: str, value: Any) -> None:
+        # Unhashable values can't be looked up, so they aren't indexed.
+        with contextlib.suppress(TypeError):
+            meta_index.setdefault(value, set()).add(key)
+
+    def __remove_from_meta_index(self, meta_index: dict[Any, set[str]], key: str, value: Any) -> None:
+        try:
+            keys = meta_index.get(value)
+        except TypeError:
+            return
+
+        if keys is not None:
+            keys.discard(key)
+
+            if not keys:
+                del meta_index[value]
+
+    def __ivf_candidate_rows(
+        self, query: np.ndarray, *, count: int, rows: Optional[np.ndarray], row_count: int
+    ) -> Optional[np.ndarray]:
+        with self.thread_lock:
+            centroids = self._ivf_centroids
+            assignments = self._ivf_assignments
+
+            if centroids is None or assignments is None:
+                # The index hasn't been trained yet, so the store is searched exactly.
+                return rows
+
+            list_ranks = np.empty(len(centroids), dtype=np.intp)
+            list_ranks[np.argsort(-(centroids @ query))] = np.arange(len(centroids))
+
+            if rows is None:
+                list_sizes = np.array([len(ivf_list) for ivf_list in self._ivf_lists])
+                ranked_sizes = np.cumsum(list_sizes[np.argsort(list_ranks)])
+                # Probe at least `ivf_probe_count` lists, and more if they hold fewer than `count` vectors.
+                probe_count = max(self.ivf_probe_count, int(np.searchsorted(ranked_sizes, count)) + 1)
+                probed_lists = np.flatnonzero(list_ranks < probe_count)
+                rows = np.fromiter(
+                    itertools.chain.from_iterable(self._ivf_lists[i] for i in probed_lists), dtype=np.intp
+                )
+            else:
+                row_ranks = list_ranks[assignments[rows]]
+
+                if len(rows) <= count:
+                    return rows
+
+                threshold = max(self.ivf_probe_count - 1, int(np.partition(row_ranks, count - 1)[count - 1]))
+                rows = rows[row_ranks <= threshold]
+
+        return rows[rows < row_count]
+
+    def __train_stale_ivf_index(self) -> None:
+        """Trains the IVF index once the store has `ivf_min_rows` vectors and retrains it as the store grows.
+
+        Training runs in the upserting thread, never in queries, and only one thread trains at a time. The store lock
+        is only held to snapshot the vectors and to swap in the new centroids and lists, so upserts and queries,
+        which keep using the previous index, aren't blocked while k-means runs.
+        """
+        if self.index_type != "ivf" or not self._ivf_training_lock.acquire(blocking=False):
+            return
+
+        try:
+            with self.thread_lock:
+                row_count = len(self._row_keys)
+
+                if (
+                    self._matrix is None
+                    or row_count < self.ivf_min_rows
+                    or (
+                        self._ivf_centroids is not None
+                        and row_count < self._ivf_trained_rows * self.IVF_RETRAINING_GROWTH
+                    )
+                ):
+                    return
+
+                vectors = self._matrix[:row_count]
+                # Rows that are overwritten during training are reassigned when the index is swapped in.
+                self._ivf_dirty_rows = set()
+
+            centroids = self.__train_ivf_centroids(vectors)
+            labels = self.__closest_centroids(vectors, centroids)
+            lists = [[] for _ in range(len(centroids))]
+
+            for row, label in enumerate(labels.tolist()):
+                lists[label].append(row)
+
+            with self.thread_lock:
+                if self._ivf_dirty_rows is None:
+                    return
+
+                assignments = np.full(len(self._norms), -1, dtype=np.int32)  # pyright: ignore[reportArgumentType]
+                assignments[:row_count] = labels
+                dirty_rows = self._ivf_dirty_rows | set(range(row_count, len(self._row_keys)))
+
+                self._ivf_centroids = centroids
+                self._ivf_assignments = assignments
+                self._ivf_lists = lists
+                self._ivf_trained_rows = row_count
+                self._ivf_dirty_rows = None
+
+                self.__assign_ivf_rows(np.array(sorted(dirty_rows), dtype=np.intp))
+                self.__save_ivf_index()
+        finally:
+            self._ivf_dirty_rows = None
+            self._ivf_training_lock.release()
+
+    def __train_ivf_centroids(self, vectors: np.ndarray) -> np.ndarray:
+        row_count = len(vectors)
+        list_count = min(self.ivf_list_count or max(int(4 * np.sqrt(row_count)), 1), row_count)
+        random = np.random.default_rng(0)
+        sample_size = min(row_count, list_count * self.IVF_TRAINING_ROWS_PER_LIST, self.IVF_MAX_TRAINING_ROWS)
+        sample = self.__unit_vectors(vectors[np.sort(random.choice(row_count, sample_size, replace=False))])
+        centroids = sample[random.choice(sample_size, min(list_count, sample_size), replace=False)]
+
+        # Spherical k-means: centroids are the normalized means of their members.
+        for _ in range(self.IVF_TRAINING_ITERATIONS):
+            labels = self.__closest_centroids(sample, centroids)
+            empty_lists = np.flatnonzero(np.bincount(labels, minlength=len(centroids)) == 0)
+
+            if len(empty_lists) > 0:
+                # Empty lists are moved to the vectors that are furthest from their centroids.
+                similarities = np.einsum("ij,ij->i", sample, centroids[labels])
+                labels[np.argsort(similarities)[: len(empty_lists)]] = empty_lists
+
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            sum_norms = np.linalg.norm(sums, axis=1)
+            centroids = np.where(
+                sum_norms[:, None] > 0, sums / np.maximum(sum_norms, np.finfo(np.float32).tiny)[:, None], centroids
+            )
+
+        return centroids.astype(np.float32)
+
+    def __assign_ivf_rows(self, rows: np.ndarray) -> None:
+        centroids = self._ivf_centroids
+
+        if centroids is None or self._matrix is None or self._norms is None:
+            return
+
+        assignments = self._ivf_assignments
+
+        if assignments is None or len(assignments) < len(self._norms):
+            grown = np.full(len(self._norms), -1, dtype=np.int32)
+
+            if assignments is not None:
+                grown[: len(assignments)] = assignments
+
+            assignments = self._ivf_assignments = grown
+
+        for start in range(0, len(rows), self.IVF_ASSIGNMENT_BATCH_SIZE):
+            batch = rows[start : start + self.IVF_ASSIGNMENT_BATCH_SIZE]
+            # Scaling a vector doesn't change its closest centroid, so vectors don't need to be normalized here.
+            labels = self.__closest_centroids(self._matrix[batch], centroids)
+
+            for row, label in zip(batch.tolist(), labels.tolist()):
+                previous = int(assignments[row])
+
+                if previous == label:
+                    continue
+
+                if previous >= 0:
+                    self._ivf_lists[previous].remove(row)
+
+                assignments[row] = label
+                self._ivf_lists[label].append(row)
+
+    def __save_ivf_index(self) -> None:
+        if self.ivf_file is None or self._ivf_centroids is None or self._ivf_assignments is None:
+            return
+
+        temp_file = f"{self.persist_file}.ivf.tmp.npz"
+
+        np.savez(
+            temp_file,
+            centroids=self._ivf_centroids,
+            assignments=self._ivf_assignments[: len(self._row_keys)],
+            trained_rows=np.array(self._ivf_trained_rows),
+        )
+        os.replace(temp_file, self.ivf_file)
+
+        # Records after this marker were written after the index was saved, so their rows are reassigned on load.
+        self.__append_log_line({"ivf": len(self._row_keys)})
+
+    def __load_ivf_index(self, stale_keys: Optional[set[str]]) -> None:
+        if self.ivf_file is None or not os.path.isfile(self.ivf_file) or self._matrix is None:
+            return
+
+        with np.load(self.ivf_file) as data:
+            centroids = data["centroids"]
+            saved_assignments = data["assignments"]
+            trained_rows = int(data["trained_rows"])
+
+        if centroids.shape[1] != self._matrix.shape[1]:
+            return
+
+        assignments = np.full(len(self._norms), -1, dtype=np.int32)  # pyright: ignore[reportArgumentType]
+        saved_count = min(len(saved_assignments), len(self._row_keys))
+        assignments[:saved_count] = saved_assignments[:saved_count]
+
+        if stale_keys is None:
+            assignments[:] = -1
+        else:
+            for key in stale_keys:
+                assignments[self._key_rows[key]] = -1
+
+        self._ivf_centroids = centroids
+        self._ivf_assignments = assignments
+        self._ivf_lists = [[] for _ in range(len(centroids))]
+        self._ivf_trained_rows = trained_rows
+
+        for row, label in enumerate(assignments[: len(self._row_keys)].tolist()):
+            if label >= 0:
+                self._ivf_lists[label].append(row)
+
+        self.__assign_ivf_rows(np.flatnonzero(assignments[: len(self._row_keys)] < 0))
+
+    def __closest_centroids(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        return np.concatenate(
+            [
+                np.argmax(vectors[start : start + self.IVF_ASSIGNMENT_BATCH_SIZE] @ centroids.T, axis=1)
+                for start in range(0, len(vectors), self.IVF_ASSIGNMENT_BATCH_SIZE)
+            ]
+            or [np.empty(0, dtype=np.intp)]
+        )
+
+    def __unit_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        vector_norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        return np.divide(vectors, vector_norms, out=np.zeros_like(vectors), where=vector_norms > 0)
+
+    def __rebuild_index(self) -> None:
+        if self.sharded:
+            shards = [_VectorShard() for _ in range(self.shard_count)]
+            self._shard_dimensions = None
+
+            for sequence, (key, entry) in enumerate(self.entries.items()):
+                if entry.vector is not None:
+                    vector = np.asarray(entry.vector, dtype=np.float32)
+
+                    self.__check_shard_dimensions(len(vector))
+                    self.__index_shard_vector(shards[self.__shard_index(key)], key, vector, sequence, 0)
+
+            self._shards = shards
+            self._shard_keys = {key: (sequence, 0) for sequence, key in enumerate(self.entries)}
+
+            self.__rebuild_namespace_index()
+
+            return
+
+        self._matrix = None
+        self._norms = None
+        self._row_keys = []
+        self._key_rows = {}
+        self._ivf_centroids = None
+        self._ivf_assignments = None
+        self._ivf_lists = []
+        self._ivf_trained_rows = 0
+        # Cancels training that is in progress, since its rows no longer match the index.
+        self._ivf_dirty_rows = None
+        self._quantized = None
+        self._scales = None
+
+        for key, entry in self.entries.items():
+            if entry.vector is not None:
+                self.__index_vector(key, entry.vector)
+
+        self.__rebuild_namespace_index()
+
+    def __rebuild_namespace_index(self) -> None:
+        self._key_namespaces = {}
+        self._namespace_keys = {}
+        self._meta_indexes = {}
+        self._meta_range_indexes = {}
+
+        for key, entry in self.entries.items():
+            self.__index_namespace(key, entry.namespace)
+
+    def __entry_vector(self, key: str, entry: BaseVectorStoreDriver.Entry) -> Optional[list[float]]:
+        if self.vectors_file is None or self._matrix is None:
+            return entry.vector
+        else:
+            return self._matrix[self._key_rows[key]].tolist()
+
+    def __entry_with_vector(self, key: str, entry: BaseVectorStoreDriver.Entry) -> BaseVectorStoreDriver.Entry:
+        if self.vectors_file is None:
+            return entry
+        else:
+            return BaseVectorStoreDriver.Entry(
+                id=entry.id,
+                vector=self.__entry_vector(key, entry),
+                score=entry.score,
+                meta=entry.meta,
+                namespace=entry.namespace,
+            )
+
+    def __load_binary_store(self) -> None:
+        dimensions, records, stale_keys = self.__read_log()
+
+        if dimensions is None:
+            return
+
+        row_count = max((record["row"] for record in records.values()), default=-1) + 1
+        capacity = max(os.path.getsize(self.vectors_file) // (4 * dimensions), row_count, 1)  # pyright: ignore[reportArgumentType]
+
+        norms = np.zeros(capacity, dtype=np.float32)
+        row_keys = [""] * row_count
+
+        for key, record in records.items():
+            row = record["row"]
+
+            self.entries[key] = BaseVectorStoreDriver.Entry(
+                id=record["id"], vector=None, meta=record["meta"], namespace=record["namespace"]
+            )
+            norms[row] = record["norm"]
+            row_keys[row] = key
+            self._key_rows[key] = row
+
+            self.__index_namespace(key, record["namespace"])
+
+        self.__truncate_vectors_file(capacity, dimensions)
+        self._matrix = self.__open_vectors_file(capacity, dimensions)
+        self._norms = norms
+        self._row_keys = row_keys
+
+        if self.vector_dtype != "float32":
+            for start in range(0, row_count, self.QUANTIZED_SCAN_BATCH_SIZE):
+                self.__quantize_rows(start, self._matrix[start : start + self.QUANTIZED_SCAN_BATCH_SIZE])
+
+        self.__load_ivf_index(stale_keys)
+
+    def __read_log(self) -> tuple[Optional[int], dict[str, dict], Optional[set[str]]]:
+        """Reads the metadata log.
+
+        Returns:
+            The vector dimensions, the latest record per key, and the keys written after the IVF index was last
+            saved, or `None` if it wasn't saved.
+        """
+        dimensions = None
+        records = {}
+        stale_keys = None
+
+        if os.path.isfile(self.persist_file):  # pyright: ignore[reportArgumentType]
+            with open(self.persist_file) as file:  # pyright: ignore[reportArgumentType, reportCallIssue]
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn trailing line from an interrupted write.
+                        continue
+
+                    if "dimensions" in record:
+                        dimensions = record["dimensions"]
+                    elif "ivf" in record:
+                        stale_keys = set()
+                    else:
+                        records[record["key"]] = record
+
+                        if stale_keys is not None:
+                            stale_keys.add(record["key"])
+
+        return dimensions, records, stale_keys
+
+    def __append_log_record(self, key: str, row: int) -> None:
+        self.__append_log_line(self.__log_record(key, row))
+
+    def __append_log_line(self, record: dict) -> None:
+        log_file = self._log_file
+
+        if log_file is None:
+            log_file = self._log_file = open(self.persist_file, "a")  # noqa: SIM115 # pyright: ignore[reportArgumentType, reportCallIssue]
+
+        log_file.write(json.dumps(record) + "\n")
+        log_file.flush()
+
+    def __log_record(self, key: str, row: int) -> dict:
+        entry = self.entries[key]
+
+        return {
+            "key": key,
+            "id": entry.id,
+            "namespace": entry.namespace,
+            "meta": entry.meta,
+            "row": row,
+            "norm": float(self._norms[row]),  # pyright: ignore[reportOptionalSubscript]
+        }
+
+    def __close_log_file(self) -> None:
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def __open_vectors_file(self, capacity: int, dimensions: int) -> np.ndarray:
+        return np.memmap(self.vectors_file, dtype=np.float32, mode="r+", shape=(capacity, dimensions))  # pyright: ignore[reportArgumentType, reportCallIssue]
+
+    def __truncate_vectors_file(self, capacity: int, dimensions: int) -> None:
+        with open(self.vectors_file, "ab") as file:  # pyright: ignore[reportArgumentType, reportCallIssue]
+            file.truncate(max(capacity, 1) * dimensions * 4)
 
     def __save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
-            serialized_data = {k: asdict(v) for k, v in self.entries.items()}
+            serialized_data = {k: v.to_dict() for k, v in self.entries.items()}
 
             json.dump(serialized_data, json_file)
 
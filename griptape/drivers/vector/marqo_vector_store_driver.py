@@ -6,7 +6,7 @@ from attrs import define, field
 
 from griptape import utils
 from griptape.drivers.vector import BaseVectorStoreDriver
-from griptape.utils import import_optional_dependency
+from griptape.utils import import_optional_dependency, with_contextvars
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -91,19 +91,47 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             str: The ID of the artifact that was added.
         """
-        artifact_json = artifact.to_json()
-        vector_id = utils.str_to_hash(artifact.value) if vector_id is None else vector_id
+        return self._add_artifact_documents([self._artifact_document(artifact, namespace, vector_id)])[0]
+
+    def _upsert_namespaced_text_artifacts(
+        self, namespaced_artifacts: list[tuple[Optional[str], TextArtifact]], *, meta: Optional[dict] = None, **kwargs
+    ) -> list[str]:
+        # Marqo embeds documents server side, so Artifacts are upserted as-is instead of being embedded first. Each
+        # namespace is sent in `upsert_batch_size` chunks, and the chunks are added concurrently.
+        batches = self._batch_namespaced_indices([namespace for namespace, _ in namespaced_artifacts])
+
+        with self.create_futures_executor() as futures_executor:
+            batch_ids = utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self._add_artifact_documents),
+                        [self._artifact_document(namespaced_artifacts[i][1], namespace) for i in batch],
+                    )
+                    for namespace, batch in batches
+                ]
+            )
+
+        vector_ids = [""] * len(namespaced_artifacts)
+        for (_, batch), ids in zip(batches, batch_ids):
+            for i, vector_id in zip(batch, ids):
+                vector_ids[i] = vector_id
+
+        return vector_ids
 
-        doc = {
-            "_id": vector_id,
+    def _artifact_document(
+        self, artifact: TextArtifact, namespace: Optional[str], vector_id: Optional[str] = None
+    ) -> dict[str, Any]:
+        return {
+            "_id": utils.str_to_hash(artifact.value) if vector_id is None else vector_id,
             "Description": artifact.value,  # Description will be treated as tensor field
-            "artifact": str(artifact_json),
+            "artifact": str(artifact.to_json()),
             "namespace": namespace,
         }
 
-        response = self.client.index(self.index).add_documents([doc], tensor_fields=["Description", "artifact"])
-        if isinstance(response, dict) and "items" in response and response["items"]:
-            return response["items"][0]["_id"]
+    def _add_artifact_documents(self, docs: list[dict[str, Any]]) -> list[str]:
+        response = self.client.index(self.index).add_documents(docs, tensor_fields=["Description", "artifact"])
+        if isinstance(response, dict) and "items" in response and len(response["items"]) == len(docs):
+            return [item["_id"] for item in response["items"]]
         else:
             raise ValueError(f"Failed to upsert text: {response}")
 
@@ -212,6 +240,31 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             for r in results["hits"]
         ]
 
+    def query_many(
+        self,
+        queries: list[str],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Query the Marqo index with several query strings concurrently."""
+        with self.create_futures_executor() as futures_executor:
+            return utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(self.query),
+                        query,
+                        count=count,
+                        namespace=namespace,
+                        include_vectors=include_vectors,
+                        **kwargs,
+                    )
+                    for query in queries
+                ]
+            )
+
     def delete_index(self, name: str) -> dict[str, Any]:
         """Delete an index in the Marqo client.
 
@@ -9,7 +9,8 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from pymongo import MongoClient
+    from pymongo import AsyncMongoClient, MongoClient
+    from pymongo.asynchronous.collection import AsyncCollection
     from pymongo.collection import Collection
 
 
@@ -24,6 +25,7 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
         index_name: The name of the index to use.
         vector_path: The path to the vector field in the collection.
         client: An optional MongoDb client to use. Defaults to a new client using the connection string.
+        async_client: An optional async MongoDb client to use. Defaults to a new client using the connection string.
     """
 
     MAX_NUM_CANDIDATES = 10000
@@ -39,15 +41,26 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
         metadata={"serializable": True},
     )  # https://www.mongodb.com/docs/atlas/atlas-vector-search/vector-search-stage/#fields
     _client: MongoClient = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: AsyncMongoClient = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> MongoClient:
         return import_optional_dependency("pymongo").MongoClient(self.connection_string)
 
+    @lazy_property()
+    def async_client(self) -> AsyncMongoClient:
+        return import_optional_dependency("pymongo").AsyncMongoClient(self.connection_string)
+
     def get_collection(self) -> Collection:
         """Returns the MongoDB Collection instance for the specified database and collection name."""
         return self.client[self.database_name][self.collection_name]
 
+    def get_async_collection(self) -> AsyncCollection:
+        """Returns the async MongoDB Collection instance for the specified database and collection name."""
+        return self.async_client[self.database_name][self.collection_name]
+
     def upsert_vector(
         self,
         vector: list[float],
@@ -72,8 +85,61 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
                 {self.vector_path: vector, "namespace": namespace, "meta": meta},
                 upsert=True,
             )
+
+        self._invalidate_query_cache(namespace)
+
+        return vector_id
+
+    async def aupsert_vector(
+        self,
+        vector: list[float],
+        *,
+        vector_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> str:
+        """Inserts or updates a vector in the collection with the async client."""
+        collection = self.get_async_collection()
+
+        if vector_id is None:
+            result = await collection.insert_one({self.vector_path: vector, "namespace": namespace, "meta": meta})
+            vector_id = str(result.inserted_id)
+        else:
+            await collection.replace_one(
+                {"_id": vector_id},
+                {self.vector_path: vector, "namespace": namespace, "meta": meta},
+                upsert=True,
+            )
+
+        self._invalidate_query_cache(namespace)
+
         return vector_id
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in the collection with a single `bulk_write`."""
+        if not entries:
+            return []
+
+        vector_ids, operations = self._build_replace_operations(entries)
+
+        self.get_collection().bulk_write(operations, ordered=False)
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+        return vector_ids
+
+    async def aupsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in the collection with a single `bulk_write` of the async client."""
+        if not entries:
+            return []
+
+        vector_ids, operations = self._build_replace_operations(entries)
+
+        await self.get_async_collection().bulk_write(operations, ordered=False)
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Loads a document entry from the MongoDB collection based on the vector ID.
 
@@ -96,6 +162,37 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
                 meta=doc["meta"],
             )
 
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        """Loads several document entries from the MongoDB collection with a single `$in` query.
+
+        Returns:
+            The loaded Entries, in order, with None for ids that weren't found.
+        """
+        docs = {str(doc["_id"]): doc for doc in self.get_collection().find(self._ids_filter(vector_ids, namespace))}
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=str(doc["_id"]),
+                vector=doc[self.vector_path],
+                namespace=doc["namespace"],
+                meta=doc["meta"],
+            )
+            if (doc := docs.get(str(vector_id))) is not None
+            else None
+            for vector_id in vector_ids
+        ]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which vector ids exist in the MongoDB collection with a single `$in` query that only projects ids."""
+        existing_ids = {
+            str(doc["_id"])
+            for doc in self.get_collection().find(self._ids_filter(vector_ids, namespace), projection={"_id": 1})
+        }
+
+        return [str(vector_id) in existing_ids for vector_id in vector_ids]
+
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
         """Loads all document entries from the MongoDB collection.
 
@@ -128,11 +225,55 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
 
         Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
         """
-        collection = self.get_collection()
+        pipeline = self._build_query_pipeline(
+            vector, count=count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT, namespace=namespace
+        )
 
-        count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
-        offset = offset or 0
+        return [
+            self._parse_query_document(doc, namespace=namespace, include_vectors=include_vectors)
+            for doc in self.get_collection().aggregate(pipeline)
+        ]
 
+    async def aquery_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        offset: Optional[int] = None,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Queries the MongoDB collection for documents that match the provided vector list with the async client."""
+        pipeline = self._build_query_pipeline(
+            vector, count=count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT, namespace=namespace
+        )
+        cursor = await self.get_async_collection().aggregate(pipeline)
+
+        return [
+            self._parse_query_document(doc, namespace=namespace, include_vectors=include_vectors)
+            async for doc in cursor
+        ]
+
+    def query(
+        self,
+        query: str,
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        offset: Optional[int] = None,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Queries the MongoDB collection for documents that match the provided query string.
+
+        Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
+        """
+        return super().query(
+            query, count=count, namespace=namespace, include_vectors=include_vectors, offset=offset, **kwargs
+        )
+
+    def _build_query_pipeline(self, vector: list[float], *, count: int, namespace: Optional[str]) -> list[dict]:
         pipeline = [
             {
                 "$vectorSearch": {
@@ -157,38 +298,46 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
         if namespace:
             pipeline[0]["$vectorSearch"]["filter"] = {"namespace": namespace}
 
-        return [
-            BaseVectorStoreDriver.Entry(
-                id=str(doc["_id"]),
-                vector=doc[self.vector_path] if include_vectors else [],
-                score=doc["score"],
-                meta=doc["meta"],
-                namespace=namespace,
+        return pipeline
+
+    def _parse_query_document(
+        self, doc: dict, *, namespace: Optional[str], include_vectors: bool
+    ) -> BaseVectorStoreDriver.Entry:
+        return BaseVectorStoreDriver.Entry(
+            id=str(doc["_id"]),
+            vector=doc[self.vector_path] if include_vectors else [],
+            score=doc["score"],
+            meta=doc["meta"],
+            namespace=namespace,
+        )
+
+    def _build_replace_operations(self, entries: list[BaseVectorStoreDriver.Entry]) -> tuple[list[str], list]:
+        pymongo = import_optional_dependency("pymongo")
+        bson = import_optional_dependency("bson")
+
+        # Generate the ids that MongoDB would have generated so that they are known before the write.
+        vector_ids = [entry.id or bson.ObjectId() for entry in entries]
+        operations = [
+            pymongo.ReplaceOne(
+                {"_id": vector_id},
+                {self.vector_path: entry.vector, "namespace": entry.namespace, "meta": entry.meta},
+                upsert=True,
             )
-            for doc in collection.aggregate(pipeline)
+            for vector_id, entry in zip(vector_ids, entries)
         ]
 
-    def query(
-        self,
-        query: str,
-        *,
-        count: Optional[int] = None,
-        namespace: Optional[str] = None,
-        include_vectors: bool = False,
-        offset: Optional[int] = None,
-        **kwargs,
-    ) -> list[BaseVectorStoreDriver.Entry]:
-        """Queries the MongoDB collection for documents that match the provided query string.
+        return [str(vector_id) for vector_id in vector_ids], operations
 
-        Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
-        """
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-        return self.query_vector(
-            vector, count=count, namespace=namespace, include_vectors=include_vectors, offset=offset, **kwargs
-        )
+    def _ids_filter(self, vector_ids: list[str], namespace: Optional[str]) -> dict:
+        ids_filter: dict = {"_id": {"$in": vector_ids}}
+
+        if namespace:
+            ids_filter["namespace"] = namespace
+
+        return ids_filter
 
     def delete_vector(self, vector_id: str) -> None:
         """Deletes the vector from the collection."""
         collection = self.get_collection()
         collection.delete_one({"_id": vector_id})
+        self._invalidate_query_cache()
@@ -65,9 +65,34 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         doc = {"vector": vector, "namespace": namespace, "metadata": meta}
         doc.update(kwargs)
         response = self.client.index(index=self.index_name, id=vector_id, body=doc)
+        self._invalidate_query_cache(namespace)
 
         return response["_id"]
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in OpenSearch with a single `_bulk` request."""
+        if not entries:
+            return []
+
+        body = []
+
+        for entry in entries:
+            doc = {"vector": entry.vector, "namespace": entry.namespace, "metadata": entry.meta}
+            doc.update(kwargs)
+
+            body.extend([{"index": self._bulk_index_action(entry.id or utils.str_to_hash(str(entry.vector)))}, doc])
+
+        response = self.client.bulk(body=body)
+
+        if response.get("errors"):
+            errors = [item["index"]["error"] for item in response["items"] if "error" in item["index"]]
+
+            raise RuntimeError(f"Failed to upsert vectors: {errors}")
+
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+        return [item["index"]["_id"] for item in response["items"]]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -96,6 +121,34 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             logging.exception("Error while loading entry: %s", e)
             return None
 
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        """Retrieves several vector entries from OpenSearch with a single `ids` query.
+
+        Returns:
+            The entries, in order, with `None` for ids that weren't found.
+        """
+        hits = {hit["_id"]: hit for hit in self._search_ids(vector_ids, namespace=namespace)}
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=vector_id,
+                meta=hit["_source"].get("metadata"),
+                vector=hit["_source"].get("vector"),
+                namespace=hit["_source"].get("namespace"),
+            )
+            if (hit := hits.get(vector_id)) is not None
+            else None
+            for vector_id in vector_ids
+        ]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which vector ids exist in OpenSearch with a single `ids` query that doesn't fetch documents."""
+        existing_ids = {hit["_id"] for hit in self._search_ids(vector_ids, namespace=namespace, source=False)}
+
+        return [vector_id in existing_ids for vector_id in vector_ids]
+
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
         """Retrieves all vector entries from OpenSearch that match the optional namespace.
 
@@ -137,31 +190,61 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
-        count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
-        # Base k-NN query
-        query_body = {"size": count, "query": {"knn": {field_name: {"vector": vector, "k": count}}}}
+        response = self.client.search(
+            index=self.index_name,
+            body=self._knn_query_body(vector, count=count, namespace=namespace, field_name=field_name),
+        )
 
-        if namespace:
-            query_body["query"] = {
-                "bool": {
-                    "must": [
-                        {"match": {"namespace": namespace}},
-                        {"knn": {field_name: {"vector": vector, "k": count}}},
-                    ],
-                },
-            }
+        return self._parse_query_hits(
+            response["hits"]["hits"],
+            namespace=namespace,
+            include_vectors=include_vectors,
+            include_metadata=include_metadata,
+        )
 
-        response = self.client.search(index=self.index_name, body=query_body)
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        include_metadata: bool = True,
+        field_name: str = "vector",
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Performs nearest neighbor searches for several vectors with a single `_msearch` request.
+
+        Returns:
+            A list of BaseVectorStoreDriver.Entry objects for each vector.
+        """
+        if not vectors:
+            return []
+
+        body = []
+
+        for vector in vectors:
+            body.extend(
+                [
+                    {"index": self.index_name},
+                    self._knn_query_body(vector, count=count, namespace=namespace, field_name=field_name),
+                ]
+            )
+
+        responses = self.client.msearch(body=body)["responses"]
+        errors = [response["error"] for response in responses if "error" in response]
+
+        if errors:
+            raise RuntimeError(f"Failed to query vectors: {errors}")
 
         return [
-            BaseVectorStoreDriver.Entry(
-                id=hit["_id"],
-                namespace=hit["_source"].get("namespace") if namespace else None,
-                score=hit["_score"],
-                vector=hit["_source"].get("vector") if include_vectors else None,
-                meta=hit["_source"].get("metadata") if include_metadata else None,
+            self._parse_query_hits(
+                response["hits"]["hits"],
+                namespace=namespace,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
             )
-            for hit in response["hits"]["hits"]
+            for response in responses
         ]
 
     def query(
@@ -182,9 +265,8 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
-        vector = self.embedding_driver.embed_string(query)
-        return self.query_vector(
-            vector,
+        return super().query(
+            query,
             count=count,
             namespace=namespace,
             include_vectors=include_vectors,
@@ -193,5 +275,56 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             **kwargs,
         )
 
+    def _knn_query_body(
+        self, vector: list[float], *, count: Optional[int], namespace: Optional[str], field_name: str
+    ) -> dict:
+        count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
+        # Base k-NN query
+        query_body = {"size": count, "query": {"knn": {field_name: {"vector": vector, "k": count}}}}
+
+        if namespace:
+            query_body["query"] = {
+                "bool": {
+                    "must": [
+                        {"match": {"namespace": namespace}},
+                        {"knn": {field_name: {"vector": vector, "k": count}}},
+                    ],
+                },
+            }
+
+        return query_body
+
+    def _parse_query_hits(
+        self, hits: list[dict], *, namespace: Optional[str], include_vectors: bool, include_metadata: bool
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=hit["_id"],
+                namespace=hit["_source"].get("namespace") if namespace else None,
+                score=hit["_score"],
+                vector=hit["_source"].get("vector") if include_vectors else None,
+                meta=hit["_source"].get("metadata") if include_metadata else None,
+            )
+            for hit in hits
+        ]
+
+    def _search_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None, source: bool = True) -> list[dict]:
+        if not vector_ids:
+            return []
+
+        query: dict[str, dict[str, list[dict]]] = {"bool": {"must": [{"ids": {"values": vector_ids}}]}}
+
+        if namespace:
+            query["bool"]["must"].append({"term": {"namespace": namespace}})
+
+        response = self.client.search(
+            index=self.index_name, body={"query": query, "size": len(vector_ids), "_source": source}
+        )
+
+        return response["hits"]["hits"]
+
+    def _bulk_index_action(self, vector_id: str) -> dict:
+        return {"_index": self.index_name, "_id": vector_id}
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import io
+import json
+import threading
 import uuid
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, NoReturn, Optional
 
 from attrs import Attribute, Factory, define, field
 
@@ -12,6 +15,8 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import sqlalchemy
 
 
@@ -24,11 +29,41 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         create_engine_params: Additional configuration params passed when creating the database connection.
         engine: An optional sqlalchemy Postgres engine to use.
         table_name: Optionally specify the name of the table to used to store vectors.
+        reuse_engine: Whether to share one engine, and therefore one connection pool, between all Drivers with the
+            same `connection_string` and `create_engine_params`.
+        dimensions: Optional number of dimensions of the vector column. Required to create an index.
+        index_type: Optional type of approximate nearest neighbor index created by `setup()`, `hnsw` or `ivfflat`.
+        index_distance_metric: Distance metric of the index. Queries must use the same metric to use the index.
+        index_params: Build parameters of the index, e.g., `{"m": 16, "ef_construction": 64}` for `hnsw` or
+            `{"lists": 100}` for `ivfflat`.
+        ef_search: Optional `hnsw.ef_search` setting used by queries.
+        probes: Optional `ivfflat.probes` setting used by queries.
+        copy_threshold: Minimum number of vectors for which `upsert_vectors` ingests with `COPY` instead of
+            `INSERT`. `None` disables `COPY`.
     """
 
+    INDEX_TYPES = ("hnsw", "ivfflat")
+    INDEX_OPERATOR_CLASSES = {
+        "cosine_distance": "vector_cosine_ops",
+        "l2_distance": "vector_l2_ops",
+        "inner_product": "vector_ip_ops",
+    }
+    DEFAULT_COPY_THRESHOLD = 1000
+
+    _engines: ClassVar[dict[tuple[str, str], sqlalchemy.Engine]] = {}
+    _engines_lock: ClassVar[threading.Lock] = threading.Lock()
+
     connection_string: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
     create_engine_params: dict = field(factory=dict, kw_only=True, metadata={"serializable": True})
     table_name: str = field(kw_only=True, metadata={"serializable": True})
+    reuse_engine: bool = field(default=True, kw_only=True)
+    dimensions: Optional[int] = field(default=None, kw_only=True)
+    index_type: Optional[str] = field(default=None, kw_only=True)
+    index_distance_metric: str = field(default="cosine_distance", kw_only=True)
+    index_params: dict = field(factory=dict, kw_only=True)
+    ef_search: Optional[int] = field(default=None, kw_only=True)
+    probes: Optional[int] = field(default=None, kw_only=True)
+    copy_threshold: Optional[int] = field(default=DEFAULT_COPY_THRESHOLD, kw_only=True)
     _model: Any = field(default=Factory(lambda self: self.default_vector_model(), takes_self=True))
     _engine: sqlalchemy.Engine = field(default=None, kw_only=True, alias="engine", metadata={"serializable": False})
 
@@ -45,11 +80,28 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         if not connection_string.startswith("postgresql://"):
             raise ValueError("The connection string must describe a Postgres database connection")
 
+    @index_type.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    def validate_index_type(self, _: Attribute, index_type: Optional[str]) -> None:
+        if index_type is not None and index_type not in self.INDEX_TYPES:
+            raise ValueError(f"The index type must be one of {', '.join(self.INDEX_TYPES)}")
+
+    @index_distance_metric.validator  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    def validate_index_distance_metric(self, _: Attribute, index_distance_metric: str) -> None:
+        if index_distance_metric not in self.INDEX_OPERATOR_CLASSES:
+            raise ValueError("Invalid distance metric provided")
+
     @lazy_property()
     def engine(self) -> sqlalchemy.Engine:
-        return import_optional_dependency("sqlalchemy").create_engine(
-            self.connection_string, **self.create_engine_params
-        )
+        if not self.reuse_engine:
+            return self._create_engine()
+
+        key = (str(self.connection_string), repr(sorted(self.create_engine_params.items())))
+
+        with PgVectorVectorStoreDriver._engines_lock:
+            if key not in PgVectorVectorStoreDriver._engines:
+                PgVectorVectorStoreDriver._engines[key] = self._create_engine()
+
+            return PgVectorVectorStoreDriver._engines[key]
 
     def setup(
         self,
@@ -57,8 +109,9 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         create_schema: bool = True,
         install_uuid_extension: bool = True,
         install_vector_extension: bool = True,
+        create_index: bool = True,
     ) -> None:
-        """Provides a mechanism to initialize the database schema and extensions."""
+        """Provides a mechanism to initialize the database schema, extensions, and the `index_type` index."""
         sqlalchemy_sql = import_optional_dependency("sqlalchemy.sql")
 
         if install_uuid_extension:
@@ -72,6 +125,10 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         if create_schema:
             self._model.metadata.create_all(self.engine)
 
+        if create_index and self.index_type is not None:
+            with self.engine.begin() as conn:
+                conn.execute(sqlalchemy_sql.text(self._create_index_statement()))
+
     def upsert_vector(
         self,
         vector: list[float],
@@ -82,15 +139,59 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         **kwargs,
     ) -> str:
         """Inserts or updates a vector in the collection."""
+        return self.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(
+                    id=vector_id or str(uuid.uuid4()), vector=vector, namespace=namespace, meta=meta
+                )
+            ],
+            **kwargs,
+        )[0]
+
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in the collection with a single `INSERT ... ON CONFLICT` statement.
+
+        At least `copy_threshold` vectors are ingested with `COPY` into a temporary table instead.
+        """
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+        sqlalchemy_dialects_postgresql = import_optional_dependency("sqlalchemy.dialects.postgresql")
 
-        with sqlalchemy_orm.Session(self.engine) as session:
-            obj = self._model(id=vector_id, vector=vector, namespace=namespace, meta=meta, **kwargs)
+        if not entries:
+            return []
+
+        rows = [
+            {
+                "id": entry.id or str(uuid.uuid4()),
+                "vector": entry.vector,
+                "namespace": entry.namespace,
+                "meta": entry.meta,
+                **kwargs,
+            }
+            for entry in entries
+        ]
+
+        if self.copy_threshold is not None and len(rows) >= self.copy_threshold:
+            self._copy_rows(rows)
+            self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+            return [str(row["id"]) for row in rows]
+
+        # SQLAlchemy sends the rows as a single multi-row INSERT, and Postgres rejects ON CONFLICT DO UPDATE if two
+        # rows have the same id, so only the last row of every id is inserted.
+        unique_rows = list({str(row["id"]): row for row in rows}.values())
+        statement = sqlalchemy_dialects_postgresql.insert(self._model)
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: statement.excluded[column] for column in rows[0] if column != "id"},
+        )
 
-            obj = session.merge(obj)
+        with sqlalchemy_orm.Session(self.engine) as session:
+            session.execute(statement, unique_rows)
             session.commit()
 
-            return str(getattr(obj, "id"))
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+        return [str(row["id"]) for row in rows]
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
@@ -106,6 +207,41 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
                 meta=getattr(result, "meta"),
             )
 
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        """Retrieves several vector entries from the collection with a single `WHERE id IN` query."""
+        sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+
+        with sqlalchemy_orm.Session(self.engine) as session:
+            results = {
+                str(result.id): result
+                for result in session.query(self._model).filter(self._model.id.in_(vector_ids)).all()
+            }
+
+            return [
+                BaseVectorStoreDriver.Entry(
+                    id=str(result.id),
+                    vector=result.vector,
+                    namespace=result.namespace,
+                    meta=result.meta,
+                )
+                if (result := results.get(str(vector_id))) is not None
+                else None
+                for vector_id in vector_ids
+            ]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which vector ids exist in the collection with a single `WHERE id IN` query that only selects ids."""
+        sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+
+        with sqlalchemy_orm.Session(self.engine) as session:
+            existing_ids = {
+                str(row.id) for row in session.query(self._model.id).filter(self._model.id.in_(vector_ids)).all()
+            }
+
+            return [str(vector_id) in existing_ids for vector_id in vector_ids]
+
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
         """Retrieves all vector entries from the collection, optionally filtering to only those that match the provided namespace."""
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
@@ -127,6 +263,29 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
                 for result in results
             ]
 
+    def export_entries(
+        self, *, namespace: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Streams entries out of the collection, fetching `batch_size` rows at a time with a server-side cursor."""
+        sqlalchemy = import_optional_dependency("sqlalchemy")
+        sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+
+        statement = sqlalchemy.select(self._model).execution_options(
+            yield_per=batch_size or BaseVectorStoreDriver.DEFAULT_EXPORT_BATCH_SIZE
+        )
+
+        if namespace:
+            statement = statement.filter_by(namespace=namespace)
+
+        with sqlalchemy_orm.Session(self.engine) as session:
+            for result in session.scalars(statement):
+                yield BaseVectorStoreDriver.Entry(
+                    id=str(result.id),
+                    vector=result.vector,
+                    namespace=result.namespace,
+                    meta=result.meta,
+                )
+
     def query_vector(
         self,
         vector: list[float],
@@ -152,6 +311,8 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         op = distance_metrics[distance_metric]
 
         with sqlalchemy_orm.Session(self.engine) as session:
+            self._apply_search_settings(session)
+
             # The query should return both the vector and the distance metric score.
             query_result = session.query(self._model, op(vector).label("score")).order_by(op(vector))  # pyright: ignore[reportOptionalCall]
 
@@ -191,9 +352,8 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
         """Performs a search on the collection to find vectors similar to the provided input vector, optionally filtering to only those that match the provided namespace."""
-        vector = self.embedding_driver.embed_string(query)
-        return self.query_vector(
-            vector,
+        return super().query(
+            query,
             count=count,
             namespace=namespace,
             include_vectors=include_vectors,
@@ -218,11 +378,101 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
                 unique=True,
                 nullable=False,
             )
-            vector = sqlalchemy.Column(pgvector_sqlalchemy.Vector())
+            vector = sqlalchemy.Column(pgvector_sqlalchemy.Vector(self.dimensions))
             namespace = sqlalchemy.Column(sqlalchemy.String)
             meta = sqlalchemy.Column(sqlalchemy.JSON)
 
         return VectorModel
 
+    def _create_engine(self) -> sqlalchemy.Engine:
+        return import_optional_dependency("sqlalchemy").create_engine(
+            self.connection_string, **self.create_engine_params
+        )
+
+    def _create_index_statement(self) -> str:
+        """Builds the `CREATE INDEX` statement of the `index_type` index."""
+        if self.dimensions is None:
+            raise ValueError("The number of dimensions is required to create an index")
+
+        preparer = import_optional_dependency("sqlalchemy.dialects.postgresql").dialect().identifier_preparer
+        index_name = preparer.quote(f"{self.table_name}_vector_{self.index_type}_idx")
+        operator_class = self.INDEX_OPERATOR_CLASSES[self.index_distance_metric]
+        statement = (
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {preparer.quote(self.table_name)} "
+            f"USING {self.index_type} (vector {operator_class})"
+        )
+
+        if self.index_params:
+            params = ", ".join(f"{preparer.quote(name)} = {int(value)}" for name, value in self.index_params.items())
+            statement += f" WITH ({params})"
+
+        return statement
+
+    def _apply_search_settings(self, session: Any) -> None:
+        """Applies the `ef_search` and `probes` settings to the transaction of a session."""
+        sqlalchemy_sql = import_optional_dependency("sqlalchemy.sql")
+
+        # SET doesn't accept bind parameters.
+        if self.ef_search is not None:
+            session.execute(sqlalchemy_sql.text(f"SET LOCAL hnsw.ef_search = {int(self.ef_search)}"))
+
+        if self.probes is not None:
+            session.execute(sqlalchemy_sql.text(f"SET LOCAL ivfflat.probes = {int(self.probes)}"))
+
+    def _copy_rows(self, rows: list[dict]) -> None:
+        """Upserts rows by copying them into a temporary table and merging it into the collection."""
+        sqlalchemy_sql = import_optional_dependency("sqlalchemy.sql")
+        preparer = import_optional_dependency("sqlalchemy.dialects.postgresql").dialect().identifier_preparer
+
+        # Later rows win, like consecutive upserts. ON CONFLICT can't update a row twice in one statement.
+        rows = list({str(row["id"]): row for row in rows}.values())
+        columns = list(rows[0])
+        table = preparer.quote(self.table_name)
+        staging_table = preparer.quote(f"{self.table_name}_staging")
+        column_list = ", ".join(preparer.quote(column) for column in columns)
+        updates = ", ".join(
+            f"{preparer.quote(column)} = EXCLUDED.{preparer.quote(column)}" for column in columns if column != "id"
+        )
+
+        buffer = io.StringIO(
+            "".join(",".join(self._copy_field(column, row[column]) for column in columns) + "\n" for row in rows)
+        )
+        copy_statement = f"COPY {staging_table} ({column_list}) FROM STDIN WITH (FORMAT csv)"
+
+        with self.engine.begin() as conn:
+            conn.execute(
+                sqlalchemy_sql.text(
+                    f"CREATE TEMP TABLE {staging_table} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            )
+
+            cursor = conn.connection.dbapi_connection.cursor()  # pyright: ignore[reportOptionalMemberAccess]
+
+            if hasattr(cursor, "copy_expert"):
+                # psycopg2
+                cursor.copy_expert(copy_statement, buffer)
+            else:
+                # psycopg 3
+                with cursor.copy(copy_statement) as copy:
+                    copy.write(buffer.getvalue())
+
+            conn.execute(
+                sqlalchemy_sql.text(
+                    f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging_table} "
+                    f"ON CONFLICT (id) DO UPDATE SET {updates}"
+                )
+            )
+
+    def _copy_field(self, column: str, value: Any) -> str:
+        """Formats a value as a `COPY` CSV field. Unquoted empty fields are read as NULL."""
+        if value is None:
+            return ""
+        elif column == "vector":
+            value = f"[{','.join(str(float(v)) for v in value)}]"
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+
+        return '"' + str(value).replace('"', '""') + '"'
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
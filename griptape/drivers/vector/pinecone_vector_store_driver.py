@@ -46,9 +46,25 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
         params: dict[str, Any] = {"namespace": namespace} | kwargs
 
         self.index.upsert(vectors=[(vector_id, vector, meta)], **params)
+        self._invalidate_query_cache(namespace)
 
         return vector_id
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        vector_ids = [entry.id or str_to_hash(str(entry.vector)) for entry in entries]
+        namespaced_vectors: dict[Optional[str], list[tuple]] = {}
+
+        for vector_id, entry in zip(vector_ids, entries):
+            namespaced_vectors.setdefault(entry.namespace, []).append((vector_id, entry.vector, entry.meta))
+
+        # Pinecone upserts into a single namespace per request.
+        for namespace, vectors in namespaced_vectors.items():
+            self.index.upsert(vectors=vectors, **({"namespace": namespace} | kwargs))
+
+        self._invalidate_query_cache(*namespaced_vectors)
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
         vectors = list(result["vectors"].values())
@@ -65,6 +81,29 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
         else:
             return None
 
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        if not vector_ids:
+            return []
+
+        result = self.index.fetch(ids=vector_ids, namespace=namespace).to_dict()
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=vector["id"],
+                meta=vector["metadata"],
+                vector=vector["values"],
+                namespace=result["namespace"],
+            )
+            if (vector := result["vectors"].get(vector_id)) is not None
+            else None
+            for vector_id in vector_ids
+        ]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        return [entry is not None for entry in self.load_entries_by_ids(vector_ids, namespace=namespace)]
+
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
         # This is a hacky way to query up to 10,000 values from Pinecone. Waiting on an official API for fetching
         # all values from a namespace:
@@ -127,9 +166,8 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
         include_metadata: bool = True,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        vector = self.embedding_driver.embed_string(query)
-        return self.query_vector(
-            vector,
+        return super().query(
+            query,
             count=count,
             namespace=namespace,
             include_vectors=include_vectors,
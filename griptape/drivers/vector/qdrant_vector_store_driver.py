@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import uuid
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import define, field
 
@@ -11,7 +11,9 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from qdrant_client import QdrantClient
+    from collections.abc import Iterator
+
+    from qdrant_client import AsyncQdrantClient, QdrantClient
 
 
 DEFAULT_DISTANCE = "Cosine"
@@ -62,23 +64,33 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
     vector_name: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
     content_payload_key: str = field(default=CONTENT_PAYLOAD_KEY, kw_only=True, metadata={"serializable": True})
     _client: QdrantClient = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: AsyncQdrantClient = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> QdrantClient:
-        return import_optional_dependency("qdrant_client").QdrantClient(
-            location=self.location,
-            url=self.url,
-            host=self.host,
-            path=self.path,
-            port=self.port,
-            prefer_grpc=self.prefer_grpc,
-            grpc_port=self.grpc_port,
-            api_key=self.api_key,
-            https=self.https,
-            prefix=self.prefix,
-            force_disable_check_same_thread=self.force_disable_check_same_thread,
-            timeout=self.timeout,
-        )
+        return import_optional_dependency("qdrant_client").QdrantClient(**self._client_params())
+
+    @lazy_property()
+    def async_client(self) -> AsyncQdrantClient:
+        return import_optional_dependency("qdrant_client").AsyncQdrantClient(**self._client_params())
+
+    def _client_params(self) -> dict:
+        return {
+            "location": self.location,
+            "url": self.url,
+            "host": self.host,
+            "path": self.path,
+            "port": self.port,
+            "prefer_grpc": self.prefer_grpc,
+            "grpc_port": self.grpc_port,
+            "api_key": self.api_key,
+            "https": self.https,
+            "prefix": self.prefix,
+            "force_disable_check_same_thread": self.force_disable_check_same_thread,
+            "timeout": self.timeout,
+        }
 
     def delete_vector(self, vector_id: str) -> None:
         """Delete a vector from the Qdrant collection based on its ID.
@@ -90,6 +102,8 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
             collection_name=self.collection_name,
             points_selector=import_optional_dependency("qdrant_client.http.models").PointIdsList(points=[vector_id]),
         )
+        self._invalidate_query_cache()
+
         if deletion_response.status == import_optional_dependency("qdrant_client.http.models").UpdateStatus.COMPLETED:
             logging.info("ID %s is successfully deleted", vector_id)
 
@@ -119,15 +133,67 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         results = self.client.search(**request)
 
         # Convert results to QueryResult objects
-        return [
-            BaseVectorStoreDriver.Entry(
-                id=result.id,
-                vector=result.vector if include_vectors else [],
-                score=result.score,
-                meta={k: v for k, v in result.payload.items() if k not in ["_score", "_tensor_facets"]},
-            )
-            for result in results
+        return self._parse_scored_points(results, include_vectors=include_vectors)
+
+    async def aquery_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Query the Qdrant collection based on a query vector with the async client.
+
+        Parameters:
+            vector (list[float]): Query vector.
+            count (Optional[int]): Optional number of results to return.
+            namespace (Optional[str]): Optional namespace of the vectors.
+            include_vectors (bool): Whether to include vectors in the results.
+
+        Returns:
+            list[BaseVectorStoreDriver.Entry]: List of Entry objects.
+        """
+        limit = {} if count is None else {"limit": count}
+        response = await self.async_client.query_points(
+            collection_name=self.collection_name, query=vector, with_payload=True, with_vectors=include_vectors, **limit
+        )
+
+        return self._parse_scored_points(response.points, include_vectors=include_vectors)
+
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Query the Qdrant collection with several query vectors in a single batch request.
+
+        Parameters:
+            vectors (list[list[float]]): Query vectors.
+            count (Optional[int]): Optional number of results to return per vector.
+            namespace (Optional[str]): Optional namespace of the vectors.
+            include_vectors (bool): Whether to include vectors in the results.
+
+        Returns:
+            list[list[BaseVectorStoreDriver.Entry]]: List of Entry objects for each query vector.
+        """
+        if not vectors:
+            return []
+
+        models = import_optional_dependency("qdrant_client.http.models")
+        limit = {} if count is None else {"limit": count}
+        requests = [
+            models.QueryRequest(query=vector, with_payload=True, with_vector=include_vectors, **limit)
+            for vector in vectors
         ]
+        responses = self.client.query_batch_points(collection_name=self.collection_name, requests=requests)
+
+        return [self._parse_scored_points(response.points, include_vectors=include_vectors) for response in responses]
 
     def upsert_vector(
         self,
@@ -151,24 +217,77 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             str: The ID of the upserted vector.
         """
-        if vector_id is None:
-            vector_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, str(vector)))
+        vector_id, points = self._build_vector_points(vector, vector_id=vector_id, meta=meta, content=content)
 
-        if meta is None:
-            meta = {}
+        self.client.upsert(collection_name=self.collection_name, points=points)
+        # Namespaces aren't stored, so every cached query is affected.
+        self._invalidate_query_cache()
 
-        if content:
-            meta[self.content_payload_key] = content
+        return vector_id
 
-        points = import_optional_dependency("qdrant_client.http.models").Batch(
-            ids=[vector_id],
-            vectors=[vector],
-            payloads=[meta] if meta else None,
-        )
+    async def aupsert_vector(
+        self,
+        vector: list[float],
+        *,
+        vector_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        content: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """Upsert vectors into the Qdrant collection with the async client.
+
+        Parameters:
+            vector (list[float]): The vector to be upserted.
+            vector_id (Optional[str]): Optional vector ID.
+            namespace (Optional[str]): Optional namespace for the vector.
+            meta (Optional[dict]): Optional dictionary containing metadata.
+            content (Optional[str]): The text content to be included in the payload.
+
+        Returns:
+            str: The ID of the upserted vector.
+        """
+        vector_id, points = self._build_vector_points(vector, vector_id=vector_id, meta=meta, content=content)
+
+        await self.async_client.upsert(collection_name=self.collection_name, points=points)
+        self._invalidate_query_cache()
 
-        self.client.upsert(collection_name=self.collection_name, points=points)
         return vector_id
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Upsert vectors into the Qdrant collection with a single batch of points.
+
+        Parameters:
+            entries (list[BaseVectorStoreDriver.Entry]): The entries to be upserted.
+
+        Returns:
+            list[str]: The IDs of the upserted vectors.
+        """
+        vector_ids, points = self._build_entry_points(entries)
+
+        if entries:
+            self.client.upsert(collection_name=self.collection_name, points=points)
+            self._invalidate_query_cache()
+
+        return vector_ids
+
+    async def aupsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Upsert vectors into the Qdrant collection with a single batch of points using the async client.
+
+        Parameters:
+            entries (list[BaseVectorStoreDriver.Entry]): The entries to be upserted.
+
+        Returns:
+            list[str]: The IDs of the upserted vectors.
+        """
+        vector_ids, points = self._build_entry_points(entries)
+
+        if entries:
+            await self.async_client.upsert(collection_name=self.collection_name, points=points)
+            self._invalidate_query_cache()
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a vector entry from the Qdrant collection based on its ID.
 
@@ -190,6 +309,53 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         else:
             return None
 
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        """Load several vector entries from the Qdrant collection with a single retrieve request.
+
+        Parameters:
+            vector_ids (list[str]): IDs of the vectors to load.
+            namespace (str, optional): Optional namespace of the vectors.
+
+        Returns:
+            list[Optional[BaseVectorStoreDriver.Entry]]: Vector entries, in order, with None for IDs that weren't found.
+        """
+        results = {
+            str(result.id): result
+            for result in self.client.retrieve(collection_name=self.collection_name, ids=vector_ids)
+        }
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=result.id,
+                vector=result.vector,
+                meta={k: v for k, v in result.payload.items() if k not in ["_score", "_tensor_facets"]},
+            )
+            if (result := results.get(str(vector_id))) is not None
+            else None
+            for vector_id in vector_ids
+        ]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Check which vector IDs exist in the Qdrant collection with a single retrieve request without payloads.
+
+        Parameters:
+            vector_ids (list[str]): IDs of the vectors to check.
+            namespace (str, optional): Optional namespace of the vectors.
+
+        Returns:
+            list[bool]: Whether each ID exists, in order.
+        """
+        existing_ids = {
+            str(result.id)
+            for result in self.client.retrieve(
+                collection_name=self.collection_name, ids=vector_ids, with_payload=False, with_vectors=False
+            )
+        }
+
+        return [str(vector_id) in existing_ids for vector_id in vector_ids]
+
     def load_entries(self, *, namespace: Optional[str] = None, **kwargs) -> list[BaseVectorStoreDriver.Entry]:
         """Load vector entries from the Qdrant collection.
 
@@ -214,3 +380,77 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
             )
             for entry in results
         ]
+
+    def export_entries(
+        self, *, namespace: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Streams points out of the Qdrant collection, one `scroll` page of `batch_size` points at a time.
+
+        Parameters:
+            namespace: Unused, Qdrant points aren't namespaced.
+            batch_size: Number of points per page.
+
+        Returns:
+            An iterator of Entry objects.
+        """
+        offset = None
+
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=batch_size or BaseVectorStoreDriver.DEFAULT_EXPORT_BATCH_SIZE,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+
+            for point in points:
+                yield BaseVectorStoreDriver.Entry(
+                    id=point.id,
+                    vector=point.vector,
+                    meta={k: v for k, v in point.payload.items() if k not in ["_score", "_tensor_facets"]},
+                )
+
+            if offset is None:
+                break
+
+    def _parse_scored_points(self, points: list, *, include_vectors: bool) -> list[BaseVectorStoreDriver.Entry]:
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=point.id,
+                vector=point.vector if include_vectors else [],
+                score=point.score,
+                meta={k: v for k, v in point.payload.items() if k not in ["_score", "_tensor_facets"]},
+            )
+            for point in points
+        ]
+
+    def _build_vector_points(
+        self, vector: list[float], *, vector_id: Optional[str], meta: Optional[dict], content: Optional[str]
+    ) -> tuple[str, Any]:
+        if vector_id is None:
+            vector_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, str(vector)))
+
+        if meta is None:
+            meta = {}
+
+        if content:
+            meta[self.content_payload_key] = content
+
+        points = import_optional_dependency("qdrant_client.http.models").Batch(
+            ids=[vector_id],
+            vectors=[vector],
+            payloads=[meta] if meta else None,
+        )
+
+        return vector_id, points
+
+    def _build_entry_points(self, entries: list[BaseVectorStoreDriver.Entry]) -> tuple[list[str], Any]:
+        vector_ids = [entry.id or str(uuid.uuid5(uuid.NAMESPACE_DNS, str(entry.vector))) for entry in entries]
+        points = import_optional_dependency("qdrant_client.http.models").Batch(
+            ids=vector_ids,
+            vectors=[entry.vector for entry in entries],
+            payloads=[entry.meta or {} for entry in entries],
+        )
+
+        return vector_ids, points
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import json
+from itertools import islice
 from typing import TYPE_CHECKING, NoReturn, Optional
 
 import numpy as np
 from attrs import define, field
 
+from griptape.artifacts import ListArtifact, TextArtifact
 from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.utils import import_optional_dependency, str_to_hash
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
+    from redis.commands.search.query import Query
 
 
 @define
@@ -27,14 +33,21 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         db: The database of the Redis instance.
         password: The password of the Redis instance.
         index: The name of the index to use.
+        scan_batch_size: Number of keys fetched per `SCAN` call and per pipelined `HMGET` round trip when loading entries.
     """
 
+    DEFAULT_SCAN_BATCH_SIZE = 1000
+
     host: str = field(kw_only=True, metadata={"serializable": True})
     port: int = field(kw_only=True, metadata={"serializable": True})
     db: int = field(kw_only=True, default=0, metadata={"serializable": True})
     password: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
     index: str = field(kw_only=True, metadata={"serializable": True})
+    scan_batch_size: int = field(default=DEFAULT_SCAN_BATCH_SIZE, kw_only=True)
     _client: Redis = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: AsyncRedis = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> Redis:
@@ -46,6 +59,16 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
             decode_responses=False,
         )
 
+    @lazy_property()
+    def async_client(self) -> AsyncRedis:
+        return import_optional_dependency("redis.asyncio").Redis(
+            host=self.host,
+            port=self.port,
+            db=self.db,
+            password=self.password,
+            decode_responses=False,
+        )
+
     def upsert_vector(
         self,
         vector: list[float],
@@ -61,22 +84,67 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """
         vector_id = vector_id or str_to_hash(str(vector))
         key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(key, mapping=self._build_mapping(vector, namespace=namespace, meta=meta))
+        self._invalidate_query_cache(namespace)
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    async def aupsert_vector(
+        self,
+        vector: list[float],
+        vector_id: Optional[str] = None,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> str:
+        """Inserts or updates a vector in Redis with the async client."""
+        vector_id = vector_id or str_to_hash(str(vector))
+        key = self._generate_key(vector_id, namespace)
 
-        self.client.hset(key, mapping=mapping)
+        await self.async_client.hset(key, mapping=self._build_mapping(vector, namespace=namespace, meta=meta))
+        self._invalidate_query_cache(namespace)
 
         return vector_id
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in Redis with a single pipelined round trip."""
+        pipeline = self.client.pipeline(transaction=False)
+        vector_ids = []
+
+        for entry in entries:
+            vector_id = entry.id or str_to_hash(str(entry.vector))
+
+            pipeline.hset(
+                self._generate_key(vector_id, entry.namespace),
+                mapping=self._build_mapping(entry.vector, namespace=entry.namespace, meta=entry.meta),  # pyright: ignore[reportArgumentType]
+            )
+            vector_ids.append(vector_id)
+
+        pipeline.execute()
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+        return vector_ids
+
+    async def aupsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in Redis with a single pipelined round trip of the async client."""
+        pipeline = self.async_client.pipeline(transaction=False)
+        vector_ids = []
+
+        for entry in entries:
+            vector_id = entry.id or str_to_hash(str(entry.vector))
+
+            pipeline.hset(
+                self._generate_key(vector_id, entry.namespace),
+                mapping=self._build_mapping(entry.vector, namespace=entry.namespace, meta=entry.meta),  # pyright: ignore[reportArgumentType]
+            )
+            vector_ids.append(vector_id)
+
+        await pipeline.execute()
+        self._invalidate_query_cache(*{entry.namespace for entry in entries})
+
+        return vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
 
@@ -90,22 +158,100 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
 
         return BaseVectorStoreDriver.Entry(id=vector_id, meta=meta, vector=vector, namespace=namespace)
 
-    def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
+    def load_entries_by_ids(
+        self, vector_ids: list[str], *, namespace: Optional[str] = None
+    ) -> list[Optional[BaseVectorStoreDriver.Entry]]:
+        """Retrieves several vector entries from Redis with a single pipelined round trip.
+
+        Returns:
+            The entries, in order, with `None` for ids that weren't found.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+
+        for vector_id in vector_ids:
+            pipeline.hgetall(self._generate_key(vector_id, namespace))
+
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=vector_id,
+                meta=json.loads(result[b"metadata"]) if b"metadata" in result else None,
+                vector=np.frombuffer(result[b"vector"], dtype=np.float32).tolist(),
+                namespace=namespace,
+            )
+            if result
+            else None
+            for vector_id, result in zip(vector_ids, pipeline.execute())
+        ]
+
+    def entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which vector ids exist in Redis with a single pipelined round trip of `EXISTS` commands."""
+        pipeline = self.client.pipeline(transaction=False)
+
+        for vector_id in vector_ids:
+            pipeline.exists(self._generate_key(vector_id, namespace))
+
+        return [bool(exists) for exists in pipeline.execute()]
+
+    def does_entry_exist(self, vector_id: str, *, namespace: Optional[str] = None) -> bool:
+        return bool(self.client.exists(self._generate_key(vector_id, namespace)))
+
+    def load_entries(
+        self, *, namespace: Optional[str] = None, include_vectors: bool = True
+    ) -> list[BaseVectorStoreDriver.Entry]:
         """Retrieves all vector entries from Redis that match the optional namespace.
 
         Returns:
             A list of `BaseVectorStoreDriver.Entry` objects.
         """
+        return list(self.iter_entries(namespace=namespace, include_vectors=include_vectors))
+
+    def iter_entries(
+        self, *, namespace: Optional[str] = None, include_vectors: bool = True, batch_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        """Streams all vector entries from Redis that match the optional namespace.
+
+        Keys are iterated with `SCAN` so that the server isn't blocked, and entries are fetched with one pipelined
+        `HMGET` round trip per `batch_size` keys.
+
+        Args:
+            namespace: Namespace of the entries to load.
+            include_vectors: Whether to fetch and decode vectors. Set to `False` when only metadata is needed.
+            batch_size: Number of keys fetched per round trip. Defaults to `scan_batch_size`.
+
+        Returns:
+            An iterator of `BaseVectorStoreDriver.Entry` objects.
+        """
         pattern = f"{namespace}:*" if namespace else "*"
-        keys = self.client.keys(pattern)
+        fields = ["namespace", "metadata", "vector"] if include_vectors else ["namespace", "metadata"]
+        batch_size = batch_size or self.scan_batch_size
+        keys = self.client.scan_iter(match=pattern, count=batch_size)
+        # SCAN may return a key more than once.
+        seen_keys = set()
 
-        entries = []
-        for key in keys:
-            entry = self.load_entry(key.decode("utf-8"), namespace=namespace)
-            if entry:
-                entries.append(entry)
+        while scanned_keys := list(islice(keys, batch_size)):
+            batch = list(dict.fromkeys(key for key in scanned_keys if key not in seen_keys))
+            seen_keys.update(batch)
+            pipeline = self.client.pipeline(transaction=False)
 
-        return entries
+            for key in batch:
+                pipeline.hmget(key, fields)
+
+            for key, values in zip(batch, pipeline.execute()):
+                entry = self._parse_hash_values(key.decode("utf-8"), values, include_vectors=include_vectors)
+
+                if entry is not None:
+                    yield entry
+
+    def export_entries(
+        self, *, namespace: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> Iterator[BaseVectorStoreDriver.Entry]:
+        return self.iter_entries(namespace=namespace, batch_size=batch_size)
+
+    def load_artifacts(self, *, namespace: Optional[str] = None) -> ListArtifact:
+        """Loads the Artifacts stored in a namespace without fetching their vectors."""
+        artifacts = [entry.to_artifact() for entry in self.iter_entries(namespace=namespace, include_vectors=False)]
+
+        return ListArtifact([a for a in artifacts if isinstance(a, TextArtifact)])
 
     def query_vector(
         self,
@@ -123,10 +269,74 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
+        query_expression = self._build_query(count=count, namespace=namespace)
+        query_params = {"vector": np.array(vector, dtype=np.float32).tobytes()}
+
+        results = self.client.ft(self.index).search(query_expression, query_params).docs  # pyright: ignore[reportArgumentType]
+
+        return self._parse_documents(results, include_vectors=include_vectors)
+
+    async def aquery_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Performs a nearest neighbor search on Redis with the async client.
+
+        Returns:
+            A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
+        """
+        query_expression = self._build_query(count=count, namespace=namespace)
+        query_params = {"vector": np.array(vector, dtype=np.float32).tobytes()}
+
+        results = (await self.async_client.ft(self.index).search(query_expression, query_params)).docs  # pyright: ignore[reportArgumentType]
+
+        return self._parse_documents(results, include_vectors=include_vectors)
+
+    def query_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Performs nearest neighbor searches for several vectors with a single pipelined round trip.
+
+        Returns:
+            A list of BaseVectorStoreDriver.Entry objects for each vector.
+        """
+        search_result = import_optional_dependency("redis.commands.search.result")
+
+        query_expression = self._build_query(count=count, namespace=namespace)
+        search = self.client.ft(self.index)
+        pipeline = self.client.pipeline(transaction=False)
+
+        for vector in vectors:
+            pipeline.execute_command(
+                "FT.SEARCH",
+                self.index,
+                *query_expression.get_args(),
+                *search.get_params_args({"vector": np.array(vector, dtype=np.float32).tobytes()}),
+            )
+
+        return [
+            self._parse_documents(search_result.Result(result, hascontent=True).docs, include_vectors=include_vectors)
+            for result in pipeline.execute()
+        ]
+
+    def _build_query(self, *, count: Optional[int], namespace: Optional[str]) -> Query:
+        """Builds the KNN search query for a count and an optional namespace."""
         search_query = import_optional_dependency("redis.commands.search.query")
 
         filter_expression = f"(@namespace:{{{namespace}}})" if namespace else "*"
-        query_expression = (
+
+        return (
             search_query.Query(f"{filter_expression}=>[KNN {count or 10} @vector $vector as score]")
             .sort_by("score")
             .return_fields("id", "score", "metadata", "vec_string")
@@ -134,12 +344,10 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
             .dialect(2)
         )
 
-        query_params = {"vector": np.array(vector, dtype=np.float32).tobytes()}
-
-        results = self.client.ft(self.index).search(query_expression, query_params).docs  # pyright: ignore[reportArgumentType]
-
+    def _parse_documents(self, documents: list, *, include_vectors: bool) -> list[BaseVectorStoreDriver.Entry]:
+        """Converts search result documents to entries."""
         query_results = []
-        for document in results:
+        for document in documents:
             metadata = json.loads(document.metadata) if hasattr(document, "metadata") else None
             namespace = document.id.split(":")[0] if ":" in document.id else None
             vector_id = document.id.split(":")[1] if ":" in document.id else document.id
@@ -155,6 +363,39 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
             )
         return query_results
 
+    def _parse_hash_values(
+        self, key: str, values: list[Optional[bytes]], *, include_vectors: bool
+    ) -> Optional[BaseVectorStoreDriver.Entry]:
+        """Converts the `HMGET` values of a hash key to an entry, or `None` if the key no longer exists."""
+        if all(value is None for value in values):
+            return None
+
+        namespace = values[0].decode("utf-8") if values[0] is not None else None
+        metadata = values[1]
+        vector = values[2] if include_vectors else None
+        prefix = self._get_doc_prefix(namespace)
+
+        return BaseVectorStoreDriver.Entry(
+            id=key[len(prefix) :] if prefix and key.startswith(prefix) else key,
+            vector=np.frombuffer(vector, dtype=np.float32).tolist() if vector is not None else None,
+            meta=json.loads(metadata) if metadata is not None else None,
+            namespace=namespace,
+        )
+
+    def _build_mapping(self, vector: list[float], *, namespace: Optional[str], meta: Optional[dict]) -> dict:
+        """Builds the Redis hash mapping of a vector."""
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+        mapping["vec_string"] = json.dumps(vector).encode("utf-8")
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _generate_key(self, vector_id: str, namespace: Optional[str] = None) -> str:
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
@@ -27,6 +27,9 @@ class VectorStoreRetrievalRagModule(BaseRetrievalRagModule):
     )
 
     def run(self, context: RagContext) -> Sequence[TextArtifact]:
-        query_params = utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
+        return self.process_query_output(
+            self.vector_store_driver.query(context.query, **self.get_query_params(context))
+        )
 
-        return self.process_query_output(self.vector_store_driver.query(context.query, **query_params))
+    def get_query_params(self, context: RagContext) -> dict[str, Any]:
+        return utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
@@ -8,10 +8,15 @@ from attrs import define, field
 
 from griptape import utils
 from griptape.artifacts import TextArtifact
+from griptape.drivers.vector import BaseVectorStoreDriver
+from griptape.engines.rag.modules import VectorStoreRetrievalRagModule
 from griptape.engines.rag.stages import BaseRagStage
 from griptape.utils import with_contextvars
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griptape.artifacts import BaseArtifact
     from griptape.engines.rag import RagContext
     from griptape.engines.rag.modules import BaseRagModule, BaseRerankRagModule, BaseRetrievalRagModule
 
@@ -36,13 +41,24 @@ class RetrievalRagStage(BaseRagStage):
     def run(self, context: RagContext) -> RagContext:
         logging.info("RetrievalRagStage: running %s retrieval modules in parallel", len(self.retrieval_modules))
 
+        module_groups = self.__group_retrieval_modules()
+
         with self.create_futures_executor() as futures_executor:
-            results = utils.execute_futures_list(
-                [futures_executor.submit(with_contextvars(r.run), context) for r in self.retrieval_modules]
+            group_results = utils.execute_futures_list(
+                [
+                    futures_executor.submit(with_contextvars(self.__run_retrieval_modules), context, modules)
+                    for modules in module_groups
+                ]
             )
 
-        # flatten the list of lists
-        results = list(itertools.chain.from_iterable(results))
+        # restore the module order and flatten the list of lists
+        module_results = dict(
+            zip(
+                (id(m) for m in itertools.chain.from_iterable(module_groups)),
+                itertools.chain.from_iterable(group_results),
+            )
+        )
+        results = list(itertools.chain.from_iterable(module_results[id(r)] for r in self.retrieval_modules))
 
         # deduplicate the list
         chunks_before_dedup = len(results)
@@ -67,3 +83,94 @@ class RetrievalRagStage(BaseRagStage):
             context.text_chunks = context.text_chunks[: self.max_chunks]
 
         return context
+
+    def __group_retrieval_modules(self) -> list[list[BaseRetrievalRagModule]]:
+        """Groups Vector Store Retrieval Modules that share a Vector Store Driver.
+
+        Only modules that use the default `VectorStoreRetrievalRagModule.run` with a Driver that searches with the
+        default `BaseVectorStoreDriver.query` are grouped; other modules run on their own.
+        """
+        groups: list[list[BaseRetrievalRagModule]] = []
+        group_drivers: list[Optional[BaseVectorStoreDriver]] = []
+
+        for module in self.retrieval_modules:
+            if (
+                isinstance(module, VectorStoreRetrievalRagModule)
+                and type(module).run is VectorStoreRetrievalRagModule.run
+                and self.__can_share_searches(module.vector_store_driver)
+            ):
+                for group, group_driver in zip(groups, group_drivers):
+                    if group_driver is module.vector_store_driver:
+                        group.append(module)
+
+                        break
+                else:
+                    groups.append([module])
+                    group_drivers.append(module.vector_store_driver)
+            else:
+                groups.append([module])
+                group_drivers.append(None)
+
+        return groups
+
+    def __can_share_searches(self, driver: BaseVectorStoreDriver) -> bool:
+        # Drivers that override `query`, e.g. to search by text on the server, may not embed queries or support
+        # `query_vector` at all.
+        return (
+            type(driver).query is BaseVectorStoreDriver.query
+            and type(driver).query_vector is not BaseVectorStoreDriver.query_vector
+        )
+
+    def __run_retrieval_modules(
+        self, context: RagContext, modules: list[BaseRetrievalRagModule]
+    ) -> list[Sequence[BaseArtifact]]:
+        if len(modules) == 1:
+            return [modules[0].run(context)]
+
+        # Grouped modules share a Driver, so the query is embedded once and modules whose query parameters only
+        # differ by `count` share a single search for the largest `count`.
+        vector_store_modules = [m for m in modules if isinstance(m, VectorStoreRetrievalRagModule)]
+        driver = vector_store_modules[0].vector_store_driver
+        module_params = [m.get_query_params(context) for m in vector_store_modules]
+        searches: list[tuple[dict, bool, list[int]]] = []
+
+        for index, params in enumerate(module_params):
+            search_params = {k: v for k, v in params.items() if k != "count"}
+            unbounded = params.get("count") is None
+
+            for other_search_params, other_unbounded, indexes in searches:
+                if other_search_params == search_params and other_unbounded == unbounded:
+                    indexes.append(index)
+
+                    break
+            else:
+                searches.append((search_params, unbounded, [index]))
+
+        if driver.query_cache_size > 0:
+            # Searching with `query` serves the query embedding and the results from the Driver's cache.
+            search, query = driver.query, context.query
+        else:
+            search, query = driver.query_vector, driver.embedding_driver.embed_string(context.query)
+
+        with self.create_futures_executor() as futures_executor:
+            search_entries = utils.execute_futures_list(
+                [
+                    futures_executor.submit(
+                        with_contextvars(search),
+                        query,
+                        count=None if unbounded else max(module_params[i]["count"] for i in indexes),
+                        **search_params,
+                    )
+                    for search_params, unbounded, indexes in searches
+                ]
+            )
+
+        results: list[Sequence[BaseArtifact]] = [[] for _ in vector_store_modules]
+
+        for (_, unbounded, indexes), entries in zip(searches, search_entries):
+            for i in indexes:
+                results[i] = vector_store_modules[i].process_query_output(
+                    entries if unbounded else entries[: module_params[i]["count"]]
+                )
+
+        return results
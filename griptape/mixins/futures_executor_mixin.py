@@ -12,6 +12,7 @@ from attrs import Factory, define, field
 class FuturesExecutorMixin(ABC):
     create_futures_executor: Callable[[], futures.Executor] = field(
         default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        eq=False,
     )
 
     _futures_executor: futures.Executor = field(
@@ -20,6 +21,7 @@ class FuturesExecutorMixin(ABC):
             takes_self=True,
         ),
         alias="futures_executor",
+        eq=False,
     )
 
     @property
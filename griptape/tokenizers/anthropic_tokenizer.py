@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+from typing import TYPE_CHECKING, Literal, Optional
 
 from attrs import Factory, define, field
 
 from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers.simple_tokenizer import SimpleTokenizer
 from griptape.utils import import_optional_dependency
+from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
     from anthropic import Anthropic
@@ -14,15 +17,60 @@ if TYPE_CHECKING:
 
 @define()
 class AnthropicTokenizer(BaseTokenizer):
+    """Tokenizer for Anthropic models.
+
+    Token counts come from Anthropic's token counting API by default. With `count_mode="local"`, tokens are estimated
+    offline by `local_tokenizer`, which uses a characters per token ratio calibrated for the model family plus a
+    safety margin so that estimates err on the high side.
+
+    Attributes:
+        count_mode: Whether `count_tokens` calls the API ("remote") or estimates locally ("local").
+        local_tokenizer: Tokenizer used for local estimates.
+        client: Custom `Anthropic` client used for remote counts.
+    """
+
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {"claude-3": 200000, "claude-2.1": 200000, "claude": 100000}
     MODEL_PREFIXES_TO_MAX_OUTPUT_TOKENS = {"claude": 4096}
+    # Calibrated on English prose and code. Claude 3 and later models use a tokenizer with fewer characters per token.
+    MODEL_PREFIXES_TO_CHARACTERS_PER_TOKEN = {"claude-2": 3.8, "claude-instant": 3.8, "claude": 3.5}
+    DEFAULT_CHARACTERS_PER_TOKEN = 3.5
+    DEFAULT_SAFETY_MARGIN = 0.1
 
-    client: Anthropic = field(
-        default=Factory(lambda: import_optional_dependency("anthropic").Anthropic()),
+    count_mode: Literal["remote", "local"] = field(default="remote", kw_only=True)
+    local_tokenizer: BaseTokenizer = field(
+        default=Factory(
+            lambda self: SimpleTokenizer(
+                characters_per_token=self._default_characters_per_token(),
+                safety_margin=self.DEFAULT_SAFETY_MARGIN,
+            ),
+            takes_self=True,
+        ),
         kw_only=True,
     )
+    _client: Optional[Anthropic] = field(default=None, kw_only=True, alias="client")
+
+    @lazy_property()
+    def client(self) -> Anthropic:
+        return import_optional_dependency("anthropic").Anthropic()
+
+    def count_tokens(
+        self,
+        text: str | list[BetaMessageParam],
+        *,
+        count_mode: Optional[Literal["remote", "local"]] = None,
+    ) -> int:
+        """Counts the tokens of a string or a list of messages.
+
+        Args:
+            text: String or messages to count the tokens of.
+            count_mode: Overrides `count_mode` for this call.
+        """
+        if (count_mode or self.count_mode) == "local":
+            if isinstance(text, str):
+                return self.local_tokenizer.count_tokens(text)
+            else:
+                return self.local_tokenizer.count_tokens("\n".join(self._message_text(message) for message in text))
 
-    def count_tokens(self, text: str | list[BetaMessageParam]) -> int:
         types = import_optional_dependency("anthropic.types.beta")
 
         # TODO: Refactor all Tokenizers to support Prompt Stack as an input.
@@ -34,3 +82,26 @@ class AnthropicTokenizer(BaseTokenizer):
         )
 
         return usage.input_tokens
+
+    def _default_characters_per_token(self) -> float:
+        return next(
+            (
+                characters_per_token
+                for model_prefix, characters_per_token in self.MODEL_PREFIXES_TO_CHARACTERS_PER_TOKEN.items()
+                if self.model.startswith(model_prefix)
+            ),
+            self.DEFAULT_CHARACTERS_PER_TOKEN,
+        )
+
+    def _message_text(self, message: BetaMessageParam) -> str:
+        content = message["content"]
+
+        if isinstance(content, str):
+            return content
+
+        blocks: list[dict] = [dict(block) for block in content]
+
+        # Non-text blocks, such as tool calls, are estimated from their JSON representation.
+        return "\n".join(
+            block["text"] if block.get("type") == "text" else json.dumps(block, default=str) for block in blocks
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from attrs import Factory, define, field
 
@@ -45,6 +46,13 @@ class BaseTokenizer(ABC):
     @abstractmethod
     def count_tokens(self, text: str) -> int: ...
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        return [self.count_tokens(text) for text in texts]
+
+    def token_offsets(self, text: str) -> Optional[list[int]]:
+        """Returns the index of the character each token of `text` starts at, or `None` if it isn't known."""
+        return None
+
     def _default_max_input_tokens(self) -> int:
         tokens = next(
             (
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Any, ClassVar, Optional
 
 import tiktoken
-from attrs import Factory, define, field
+from attrs import Factory, define, field, fields
 
 from griptape.tokenizers import BaseTokenizer
 
 
 @define()
 class OpenAiTokenizer(BaseTokenizer):
+    """Tokenizer for OpenAI models backed by tiktoken.
+
+    Resolved encodings are cached per model and shared by all instances.
+
+    Attributes:
+        token_count_cache_size: Maximum number of string token counts kept in an LRU cache keyed by the string's
+            hash. Defaults to 0, which disables the cache.
+    """
+
     DEFAULT_OPENAI_GPT_3_COMPLETION_MODEL = "gpt-3.5-turbo-instruct"
     DEFAULT_OPENAI_GPT_3_CHAT_MODEL = "gpt-3.5-turbo"
     DEFAULT_OPENAI_GPT_4_MODEL = "gpt-4o"
@@ -44,6 +55,8 @@ class OpenAiTokenizer(BaseTokenizer):
         "text-embedding-3-large",
     ]
 
+    _model_encodings: ClassVar[dict[str, Optional[tiktoken.Encoding]]] = {}
+
     max_input_tokens: int = field(
         kw_only=True,
         default=Factory(lambda self: self._default_max_input_tokens(), takes_self=True),
@@ -52,13 +65,41 @@ class OpenAiTokenizer(BaseTokenizer):
         kw_only=True,
         default=Factory(lambda self: self._default_max_output_tokens(), takes_self=True),
     )
+    token_count_cache_size: int = field(default=0, kw_only=True)
+    _token_count_cache: OrderedDict[int, int] = field(factory=OrderedDict, init=False, eq=False, repr=False)
+    _token_count_cache_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False, repr=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The cache lock can't be pickled, so pickled tokenizers, e.g. in worker processes, start with an empty cache.
+        return {
+            a.name: getattr(self, a.name)
+            for a in fields(type(self))
+            if a.name not in ("_token_count_cache", "_token_count_cache_lock")
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        object.__setattr__(self, "_token_count_cache", OrderedDict())
+        object.__setattr__(self, "_token_count_cache_lock", threading.Lock())
 
     @property
     def encoding(self) -> tiktoken.Encoding:
-        try:
-            return tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            return tiktoken.get_encoding(self.DEFAULT_ENCODING)
+        return self._encoding_for_model(self.model) or tiktoken.get_encoding(self.DEFAULT_ENCODING)
+
+    @classmethod
+    def _encoding_for_model(cls, model: str) -> Optional[tiktoken.Encoding]:
+        """Returns the cached encoding of `model` or `None` if tiktoken doesn't know the model."""
+        encodings = cls._model_encodings
+
+        if model not in encodings:
+            try:
+                encodings[model] = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encodings[model] = None
+
+        return encodings[model]
 
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
@@ -86,9 +127,9 @@ class OpenAiTokenizer(BaseTokenizer):
         if isinstance(text, list):
             model = model or self.model
 
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
+            encoding = self._encoding_for_model(model)
+
+            if encoding is None:
                 logging.warning("model not found. Using cl100k_base encoding.")
 
                 encoding = tiktoken.get_encoding("cl100k_base")
@@ -138,5 +179,77 @@ class OpenAiTokenizer(BaseTokenizer):
             num_tokens += 3
 
             return num_tokens
+        elif self.token_count_cache_size > 0:
+            key = hash(text)
+
+            with self._token_count_cache_lock:
+                tokens = self._token_count_cache.get(key)
+
+                if tokens is not None:
+                    self._token_count_cache.move_to_end(key)
+
+                    return tokens
+
+            tokens = len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+            self.__cache_token_counts({key: tokens})
+
+            return tokens
         else:
             return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of multiple strings with tiktoken's multi-threaded `encode_batch`.
+
+        Args:
+            texts: Strings to count the tokens of.
+
+        Returns:
+            The token count of each string, in the same order as `texts`.
+        """
+        if self.token_count_cache_size > 0:
+            keys = [hash(text) for text in texts]
+            counts = {}
+
+            with self._token_count_cache_lock:
+                for key in keys:
+                    tokens = self._token_count_cache.get(key)
+
+                    if tokens is not None:
+                        self._token_count_cache.move_to_end(key)
+
+                        counts[key] = tokens
+
+            missing = {key: text for key, text in zip(keys, texts) if key not in counts}
+
+            if missing:
+                new_counts = dict(zip(missing.keys(), self.__encode_batch_lengths(list(missing.values()))))
+
+                self.__cache_token_counts(new_counts)
+                counts.update(new_counts)
+
+            return [counts[key] for key in keys]
+        else:
+            return self.__encode_batch_lengths(texts)
+
+    def token_offsets(self, text: str) -> list[int]:
+        encoding = self.encoding
+        _, offsets = encoding.decode_with_offsets(encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+        return offsets
+
+    def clear_token_count_cache(self) -> None:
+        with self._token_count_cache_lock:
+            self._token_count_cache.clear()
+
+    def __encode_batch_lengths(self, texts: list[str]) -> list[int]:
+        return [len(tokens) for tokens in self.encoding.encode_batch(texts, allowed_special=set(self.stop_sequences))]
+
+    def __cache_token_counts(self, counts: dict[int, int]) -> None:
+        with self._token_count_cache_lock:
+            for key, tokens in counts.items():
+                self._token_count_cache[key] = tokens
+                self._token_count_cache.move_to_end(key)
+
+            while len(self._token_count_cache) > self.token_count_cache_size:
+                self._token_count_cache.popitem(last=False)
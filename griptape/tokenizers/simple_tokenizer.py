@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 from attrs import define, field
 
 from griptape.tokenizers import BaseTokenizer
@@ -7,8 +9,16 @@ from griptape.tokenizers import BaseTokenizer
 
 @define()
 class SimpleTokenizer(BaseTokenizer):
+    """Tokenizer that estimates token counts from the number of characters.
+
+    Attributes:
+        characters_per_token: Average number of characters per token.
+        safety_margin: Fraction added to every estimate so that token counts err on the high side, e.g. `0.1` for 10%.
+    """
+
     model: str = field(init=False, kw_only=True)
-    characters_per_token: int = field(kw_only=True)
+    characters_per_token: float = field(kw_only=True)
+    safety_margin: float = field(default=0.0, kw_only=True)
 
     def count_tokens(self, text: str) -> int:
-        return (len(text) + self.characters_per_token - 1) // self.characters_per_token
+        return math.ceil(len(text) * (1 + self.safety_margin) / self.characters_per_token)
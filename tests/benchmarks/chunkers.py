@@ -0,0 +1,156 @@
+"""Compares the token offset chunking engine with the recursive midpoint search it replaced.
+
+Run with `python -m tests.benchmarks.chunkers [--repeat N]`. Each document is chunked by the current
+`TextChunker`, `MarkdownChunker`, and `PdfChunker` and by a copy of the recursive implementation, and the
+timings and chunk statistics of both are printed side by side.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Optional
+
+from attrs import define
+from pypdf import PdfReader
+
+from griptape.chunkers import BaseChunker, ChunkSeparator, MarkdownChunker, PdfChunker, TextChunker
+
+RESOURCES_PATH = os.path.join(os.path.dirname(__file__), "../resources")
+
+
+@define
+class RecursiveChunkerMixin(BaseChunker):
+    """The recursive midpoint search `BaseChunker` used before the token offset engine."""
+
+    def _chunk_text(self, text: str) -> list[str]:
+        return self._chunk_recursively(text)
+
+    def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
+        token_count = self.tokenizer.count_tokens(chunk)
+        half_token_count = token_count // 2
+
+        if token_count <= self.max_tokens:
+            return [chunk]
+
+        separators = (
+            self.separators[self.separators.index(current_separator) :] if current_separator else self.separators
+        )
+
+        for separator in separators:
+            subchunks = chunk.strip().split(separator.value)
+
+            if len(list(filter(None, subchunks))) > 1:
+                midpoint_index = self._find_midpoint_index(subchunks, half_token_count)
+                first_subchunk, second_subchunk = self._get_subchunks(separator, subchunks, midpoint_index)
+
+                return self._chunk_recursively(first_subchunk.strip(), separator) + self._chunk_recursively(
+                    second_subchunk.strip(), separator
+                )
+
+        midpoint = len(chunk) // 2
+
+        return self._chunk_recursively(chunk[:midpoint]) + self._chunk_recursively(chunk[midpoint:])
+
+    def _get_subchunks(self, separator: ChunkSeparator, subchunks: list[str], balance_index: int) -> tuple[str, str]:
+        if separator.is_prefix:
+            first_subchunk = separator.value.join(subchunks[: balance_index + 1])
+            second_subchunk = separator.value + separator.value.join(subchunks[balance_index + 1 :])
+        else:
+            first_subchunk = separator.value.join(subchunks[: balance_index + 1]) + separator.value
+            second_subchunk = separator.value.join(subchunks[balance_index + 1 :])
+
+        return first_subchunk, second_subchunk
+
+    def _find_midpoint_index(self, subchunks: list[str], half_token_count: int) -> int:
+        midpoint_index = -1
+        best_midpoint_distance = float("inf")
+
+        for index, _ in enumerate(subchunks):
+            subchunk_tokens_count = self.tokenizer.count_tokens("".join(subchunks[: index + 1]))
+            midpoint_distance = abs(subchunk_tokens_count - half_token_count)
+
+            if midpoint_distance < best_midpoint_distance:
+                midpoint_index = index
+                best_midpoint_distance = midpoint_distance
+
+        return midpoint_index
+
+
+@define
+class RecursiveTextChunker(RecursiveChunkerMixin, TextChunker): ...
+
+
+@define
+class RecursiveMarkdownChunker(RecursiveChunkerMixin, MarkdownChunker): ...
+
+
+@define
+class RecursivePdfChunker(RecursiveChunkerMixin, PdfChunker): ...
+
+
+def load_pdf_text(repeat: int) -> str:
+    reader = PdfReader(os.path.join(RESOURCES_PATH, "bitcoin.pdf"))
+
+    return "\n\n".join(["".join(page.extract_text() for page in reader.pages)] * repeat)
+
+
+def load_text(repeat: int) -> str:
+    with open(os.path.join(RESOURCES_PATH, "test.txt")) as file:
+        text = file.read()
+
+    return "\n\n".join([text.replace("foobar foobar", "foobar. Foobar")] * repeat * 4)
+
+
+def load_markdown(repeat: int) -> str:
+    pdf_text = load_pdf_text(repeat)
+    paragraphs = pdf_text.split("\n\n")
+
+    return "\n\n".join(
+        f"## Section {i}\n{paragraph}" if i % 2 == 0 else f"### Subsection {i}\n{paragraph}"
+        for i, paragraph in enumerate(paragraphs)
+    )
+
+
+def benchmark(name: str, chunker: BaseChunker, recursive_chunker: BaseChunker, text: str) -> None:
+    for label, current in (("recursive", recursive_chunker), ("token offsets", chunker)):
+        start = time.perf_counter()
+        chunks = current.chunk(text)
+        elapsed = time.perf_counter() - start
+        token_counts = [current.tokenizer.count_tokens(chunk.value) for chunk in chunks]
+
+        print(
+            f"{name:<10}{label:<15}{elapsed:>10.3f}s{len(chunks):>8} chunks"
+            f"{sum(token_counts) / len(token_counts):>10.1f} avg tokens{max(token_counts):>6} max tokens"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of copies of each document to chunk.")
+    parser.add_argument("--max-tokens", type=int, default=500, help="max_tokens of the chunkers.")
+    args = parser.parse_args()
+
+    benchmark(
+        "text",
+        TextChunker(max_tokens=args.max_tokens),
+        RecursiveTextChunker(max_tokens=args.max_tokens),
+        load_text(args.repeat),
+    )
+    benchmark(
+        "markdown",
+        MarkdownChunker(max_tokens=args.max_tokens),
+        RecursiveMarkdownChunker(max_tokens=args.max_tokens),
+        load_markdown(args.repeat),
+    )
+    benchmark(
+        "pdf",
+        PdfChunker(max_tokens=args.max_tokens),
+        RecursivePdfChunker(max_tokens=args.max_tokens),
+        load_pdf_text(args.repeat),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import pickle
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.chunkers import ChunkingPool, TextChunker
+from griptape.common import Reference
+from tests.unit.chunkers.utils import gen_paragraph
+
+MAX_TOKENS = 50
+
+
+class TestChunkingPool:
+    @pytest.fixture()
+    def chunker(self):
+        return TextChunker(max_tokens=MAX_TOKENS)
+
+    @pytest.fixture()
+    def texts(self, chunker):
+        return [gen_paragraph(MAX_TOKENS * (i + 1), chunker.tokenizer, ". ") for i in range(4)]
+
+    def test_chunk_many(self, chunker, texts):
+        with ChunkingPool(chunker=chunker, max_workers=2, batch_size=1) as pool:
+            chunks = pool.chunk_many(texts)
+
+        assert [[c.value for c in text_chunks] for text_chunks in chunks] == [
+            [c.value for c in chunker.chunk(text)] for text in texts
+        ]
+        assert pool._executor is None
+
+    def test_chunk_many_reuses_workers_in_context(self, chunker, texts):
+        with ChunkingPool(chunker=chunker, max_workers=2) as pool:
+            pool.chunk_many(texts[:2])
+            executor = pool._executor
+            pool.chunk_many(texts[2:])
+
+            assert executor is not None
+            assert pool._executor is executor
+
+        assert pool._executor is None
+
+    def test_chunk_many_shuts_down_workers_outside_context(self, chunker, texts):
+        pool = ChunkingPool(chunker=chunker, max_workers=2)
+
+        chunks = pool.chunk_many(texts)
+
+        assert [len(text_chunks) for text_chunks in chunks] == [len(chunker.chunk(text)) for text in texts]
+        assert pool._executor is None
+
+    def test_chunk_many_in_process(self, chunker, texts, mocker):
+        pool = ChunkingPool(chunker=chunker, max_workers=1)
+        executor = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+
+        chunks = pool.chunk_many(texts)
+
+        executor.assert_not_called()
+        assert [len(text_chunks) for text_chunks in chunks] == [len(chunker.chunk(text)) for text in texts]
+
+    def test_chunk_collection(self, chunker, texts):
+        reference = Reference(title="foo")
+
+        with ChunkingPool(chunker=chunker, max_workers=2) as pool:
+            chunks = pool.chunk_collection({"foo": TextArtifact(texts[1], reference=reference), "bar": texts[2]})
+
+        assert list(chunks.keys()) == ["foo", "bar"]
+        assert [c.value for c in chunks["foo"]] == [c.value for c in chunker.chunk(texts[1])]
+        assert all(c.reference == reference for c in chunks["foo"])
+        assert all(c.reference is None for c in chunks["bar"])
+
+    def test_chunk(self, chunker, texts):
+        pool = ChunkingPool(chunker=chunker)
+
+        assert [c.value for c in pool.chunk(texts[0])] == [c.value for c in chunker.chunk(texts[0])]
+
+    def test_chunker_is_picklable(self, chunker):
+        chunker.tokenizer.token_count_cache_size = 10
+        chunker.tokenizer.count_tokens("foo")
+
+        unpickled = pickle.loads(pickle.dumps(chunker))
+
+        assert unpickled == chunker
+        assert len(unpickled.tokenizer._token_count_cache) == 0
+        assert unpickled.tokenizer.count_tokens("foo") == 1
@@ -33,12 +33,12 @@ class TestTextChunker:
         assert chunks[1].value.startswith("## Header 2\nfoo-0")
         assert chunks[2].value.startswith("foo-0.")
         assert chunks[3].value.startswith("## Header 3\nfoo-0")
-        assert chunks[4].value.startswith("foo-10.")
+        assert chunks[4].value.startswith("foo-7.")
         assert chunks[5].value.startswith("foo-16.")
 
         assert chunks[0].value.endswith(". foo-5.")
         assert chunks[1].value.endswith(". foo-5.")
         assert chunks[2].value.endswith(". foo-5.")
-        assert chunks[3].value.endswith(". foo-9.")
+        assert chunks[3].value.endswith(". foo-6.")
         assert chunks[4].value.endswith(". foo-15.")
         assert chunks[5].value.endswith(". foo-24.")
@@ -1,8 +1,11 @@
+import io
+
 import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
 from griptape.chunkers.chunk_separator import ChunkSeparator
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -56,11 +59,11 @@ class TestTextChunker:
             assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
 
         assert chunks[0].value.startswith("foo-0!")
-        assert chunks[1].value.startswith("foo-11!")
+        assert chunks[1].value.startswith("foo-8!")
         assert chunks[2].value.startswith("foo-17!")
         assert chunks[3].value.startswith("foo-0.")
 
-        assert chunks[0].value.endswith("! foo-10!")
+        assert chunks[0].value.endswith("! foo-7!")
         assert chunks[1].value.endswith("! foo-16!")
         assert chunks[2].value.endswith("! foo-24!")
         assert chunks[3].value.endswith(". foo-11.")
@@ -92,19 +95,19 @@ class TestTextChunker:
             assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
 
         assert chunks[0].value.startswith("foo-0!")
-        assert chunks[1].value.startswith("foo-11!")
+        assert chunks[1].value.startswith("foo-8!")
         assert chunks[2].value.startswith("foo-17!")
         assert chunks[3].value.startswith("foo-0.")
         assert chunks[4].value.startswith("foo-0?")
-        assert chunks[5].value.startswith("foo-9?")
+        assert chunks[5].value.startswith("foo-6?")
         assert chunks[6].value.startswith("foo-0")
         assert chunks[7].value.startswith("foo-8")
 
-        assert chunks[0].value.endswith("! foo-10!")
+        assert chunks[0].value.endswith("! foo-7!")
         assert chunks[1].value.endswith("! foo-16!")
         assert chunks[2].value.endswith("! foo-24!")
         assert chunks[3].value.endswith(". foo-11.")
-        assert chunks[4].value.endswith("? foo-8?")
+        assert chunks[4].value.endswith("? foo-5?")
         assert chunks[5].value.endswith("? foo-12?")
         assert chunks[6].value.endswith(" foo-7")
         assert chunks[7].value.endswith(" foo-16")
@@ -125,6 +128,88 @@ class TestTextChunker:
             assert chunker.tokenizer.count_tokens(chunk.value) <= max_tokens
         assert chunks[-1].value.endswith("one, two three.")
 
+    def test_chunk_preserves_text(self, chunker):
+        text = "".join(
+            [
+                gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, "! "),
+                "\n\n",
+                gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, " "),
+            ]
+        )
+        chunks = chunker.chunk(text)
+
+        assert " ".join(chunk.value for chunk in chunks).split() == text.split()
+
+        for chunk in chunks:
+            assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+
+    def test_chunk_without_token_offsets(self):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo-bar"), max_tokens=MAX_TOKENS)
+        text = "\n\n".join(["foo bar. " * 10, "foo! " * 30, "baz" * 30])
+        chunks = chunker.chunk(text)
+
+        assert [chunk.value for chunk in chunks] == [
+            ("foo bar. " * 5).strip(),
+            ("foo bar. " * 5).strip(),
+            ("foo! " * 10).strip(),
+            ("foo! " * 10).strip(),
+            ("foo! " * 10).strip(),
+            "baz" * 16 + "ba",
+            "z" + "baz" * 13,
+        ]
+
+    def test_chunk_iter_with_string(self, chunker):
+        text = gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, ". ")
+
+        assert [chunk.value for chunk in chunker.chunk_iter(text)] == [chunk.value for chunk in chunker.chunk(text)]
+
+    def test_chunk_iter_with_stream(self, chunker):
+        text = "\n".join(gen_paragraph(MAX_TOKENS, chunker.tokenizer, ". ") for _ in range(20))
+        chunks = list(chunker.chunk_iter(io.StringIO(text), buffer_size=500))
+
+        assert len(chunks) == 20
+        assert " ".join(chunk.value for chunk in chunks).split() == text.split()
+
+        for chunk in chunks:
+            assert chunker.tokenizer.count_tokens(chunk.value) <= MAX_TOKENS
+
+    def test_chunk_iter_with_lines(self, chunker):
+        read_lines = []
+
+        def lines():
+            for i in range(1000):
+                read_lines.append(i)
+
+                yield f"foo-{i}. bar-{i}.\n"
+
+        chunks = chunker.chunk_iter(lines(), buffer_size=1000)
+        first_chunk = next(chunks)
+
+        assert first_chunk.value.startswith("foo-0. bar-0.")
+        assert chunker.tokenizer.count_tokens(first_chunk.value) <= MAX_TOKENS
+        assert len(read_lines) < 100
+
+        remaining_chunks = list(chunks)
+
+        assert len(read_lines) == 1000
+        assert remaining_chunks[-1].value.endswith("foo-999. bar-999.")
+
+    def test_chunk_iter_with_text_artifact(self, chunker):
+        from griptape.common.reference import Reference
+
+        reference = Reference(title="foo")
+        artifact = TextArtifact(gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, " "), reference=reference)
+        chunks = list(chunker.chunk_iter(artifact, buffer_size=100))
+
+        assert len(chunks) == 3
+
+        for chunk in chunks:
+            assert chunk.reference == reference
+
+    def test_chunk_iter_with_empty_source(self, chunker):
+        assert list(chunker.chunk_iter("")) == []
+        assert list(chunker.chunk_iter(io.StringIO(""))) == []
+
     def test_artifact_reference(self, chunker):
         from griptape.common.reference import Reference
 
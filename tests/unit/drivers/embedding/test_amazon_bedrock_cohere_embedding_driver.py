@@ -26,3 +26,6 @@ class TestAmazonBedrockCohereEmbeddingDriver:
 
     def test_try_embed_chunk(self):
         assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self):
+        assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunks(["foo"]) == [[0, 1, 0]]
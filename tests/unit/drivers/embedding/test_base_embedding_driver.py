@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -26,6 +27,42 @@ class TestBaseEmbeddingDriver:
 
         assert embedding == [0, 1]
 
+    def test_embed_long_string_weighted_average(self, driver):
+        driver.mock_output = lambda chunk: [1.0, 0.0] if chunk.startswith("a") else [0.0, 1.0]
+        driver.chunker.max_tokens = 10
+
+        embedding = driver._embed_long_string("a" * 30 + " " + "b" * 10)
+
+        assert embedding == pytest.approx([0.95, 0.32], abs=0.01)
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_long_string_batches_chunks(self, try_embed_chunks, driver):
+        try_embed_chunks.side_effect = lambda chunks: [[0, 1] for _ in chunks]
+        driver.max_batch_size = 4
+
+        assert driver.embed_string("foobar" * 5000) == [0, 1]
+        assert all(len(call.args[0]) <= 4 for call in try_embed_chunks.call_args_list)
+        assert try_embed_chunks.call_count < len(driver.chunker.chunk("foobar" * 5000))
+
+    def test_embed_long_string_retries_failed_chunk_only(self, driver):
+        chunk_count = len(driver.chunker.chunk("foobar" * 5000))
+        calls = []
+
+        def try_embed_chunk(chunk: str) -> list[float]:
+            calls.append(chunk)
+
+            if len(calls) == 1:
+                raise Exception("transient")
+
+            return [0, 1]
+
+        driver.max_attempts = 2
+        driver.min_retry_delay = 0
+        driver.mock_output = try_embed_chunk
+
+        assert driver.embed_string("foobar" * 5000) == [0, 1]
+        assert len(calls) == chunk_count + 1
+
     def test_no_tokenizer(self, driver):
         driver.tokenizer = None
 
@@ -41,3 +78,71 @@ class TestBaseEmbeddingDriver:
             driver.embed_string("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_strings(self, driver):
+        driver.mock_output = lambda chunk: [len(chunk), 1]
+
+        assert driver.embed_strings(["a", "bb", "ccc"]) == [[1, 1], [2, 1], [3, 1]]
+
+    def test_embed_strings_empty(self, driver):
+        assert driver.embed_strings([]) == []
+
+    def test_embed_strings_long_string(self, driver):
+        embeddings = driver.embed_strings(["foobar", "foobar" * 5000])
+
+        assert embeddings == [[0, 1], [0, 1]]
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_strings_batches(self, try_embed_chunks, driver):
+        try_embed_chunks.side_effect = lambda chunks: [[0, 1] for _ in chunks]
+        driver.max_batch_size = 2
+
+        assert len(driver.embed_strings(["a", "b", "c", "d", "e"])) == 5
+        assert sorted(len(call.args[0]) for call in try_embed_chunks.call_args_list) == [1, 2, 2]
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_strings_batches_by_tokens(self, try_embed_chunks, driver):
+        try_embed_chunks.side_effect = lambda chunks: [[0, 1] for _ in chunks]
+        driver.max_batch_size = 10
+        driver.max_batch_tokens = 5
+
+        driver.embed_strings(["aaa", "bb", "c", "dddd"])
+
+        assert sorted(call.args[0] for call in try_embed_chunks.call_args_list) == [["aaa", "bb"], ["c", "dddd"]]
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunks")
+    def test_embed_strings_raises_on_mismatched_embeddings(self, try_embed_chunks, driver):
+        try_embed_chunks.return_value = [[0, 1]]
+        driver.max_batch_size = 2
+
+        with pytest.raises(ValueError, match="Expected 2 embeddings"):
+            driver.embed_strings(["a", "b"])
+
+    def test_aembed_string(self, driver):
+        assert asyncio.run(driver.aembed_string("foobar")) == [0, 1]
+
+    @patch.object(MockEmbeddingDriver, "embed_strings")
+    def test_aembed_strings_offloads_to_thread(self, embed_strings, driver):
+        embed_strings.return_value = [[0, 1], [1, 0]]
+
+        assert asyncio.run(driver.aembed_strings(["foo", "bar"])) == [[0, 1], [1, 0]]
+        embed_strings.assert_called_once_with(["foo", "bar"])
+
+    def test_aembed_strings_with_async_client(self, driver):
+        calls = []
+
+        async def atry_embed_chunks(chunks: list[str]) -> list[list[float]]:
+            calls.append(chunks)
+
+            return [[len(chunk), 0] for chunk in chunks]
+
+        driver.max_batch_size = 2
+
+        with (
+            patch.object(MockEmbeddingDriver, "atry_embed_chunks", side_effect=atry_embed_chunks),
+            patch.object(MockEmbeddingDriver, "_has_async_client", return_value=True),
+        ):
+            embeddings = asyncio.run(driver.aembed_strings(["a", "bb", "ccc", "foobar" * 5000]))
+
+        assert embeddings == [[1, 0], [2, 0], [3, 0], [0, 1]]
+        assert sorted(calls) == [["a", "bb"], ["ccc"]]
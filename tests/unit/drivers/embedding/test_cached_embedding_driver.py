@@ -0,0 +1,105 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers.embedding.cached import CachedEmbeddingDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCachedEmbeddingDriver:
+    @pytest.fixture()
+    def embedding_driver(self):
+        return MockEmbeddingDriver(mock_output=lambda chunk: [float(len(chunk)), 1.0])
+
+    @pytest.fixture()
+    def driver(self, embedding_driver):
+        return CachedEmbeddingDriver(embedding_driver=embedding_driver)
+
+    @pytest.fixture()
+    def persist_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield os.path.join(temp_dir, "embeddings.db")
+
+    def test_init(self, driver):
+        assert driver.model == "foo"
+
+    def test_eq_ignores_counters(self, driver, embedding_driver):
+        other_driver = CachedEmbeddingDriver(embedding_driver=embedding_driver)
+
+        driver.embed_string("foo")
+        driver.embed_string("foo")
+
+        assert driver == other_driver
+
+    def test_embed_string(self, driver, embedding_driver):
+        with patch.object(embedding_driver, "embed_string", wraps=embedding_driver.embed_string) as embed_string:
+            assert driver.embed_string("foo") == [3.0, 1.0]
+            assert driver.embed_string("foo") == [3.0, 1.0]
+
+        embed_string.assert_called_once_with("foo")
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_embed_text_artifact(self, driver):
+        driver.embed_string("foo")
+
+        assert driver.embed_text_artifact(TextArtifact("foo")) == [3.0, 1.0]
+        assert driver.hits == 1
+
+    def test_embed_strings(self, driver, embedding_driver):
+        driver.embed_string("foo")
+
+        with patch.object(embedding_driver, "embed_strings", wraps=embedding_driver.embed_strings) as embed_strings:
+            assert driver.embed_strings(["foo", "fooo", "fooo", "fo"]) == [
+                [3.0, 1.0],
+                [4.0, 1.0],
+                [4.0, 1.0],
+                [2.0, 1.0],
+            ]
+
+        embed_strings.assert_called_once_with(["fooo", "fo"])
+        assert driver.hits == 1
+        assert driver.misses == 3
+
+    def test_max_cache_bytes(self, embedding_driver):
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, max_cache_bytes=32)
+
+        driver.embed_strings(["a", "bb", "ccc"])
+
+        assert driver.cache_bytes == 32
+        assert driver.embed_string("bb") == [2.0, 1.0]
+        assert driver.embed_string("a") == [1.0, 1.0]
+        assert driver.hits == 1
+        assert driver.misses == 4
+
+    def test_persist_file(self, embedding_driver, persist_file):
+        CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file).embed_strings(["foo", "ba"])
+
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file)
+
+        with patch.object(embedding_driver, "embed_string") as embed_string:
+            assert driver.embed_string("foo") == [3.0, 1.0]
+            assert driver.embed_string("ba") == [2.0, 1.0]
+
+        embed_string.assert_not_called()
+        assert driver.hits == 2
+
+    def test_persist_file_is_keyed_by_model(self, embedding_driver, persist_file):
+        CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file).embed_string("foo")
+
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file, model="bar")
+        driver.embed_string("foo")
+
+        assert driver.misses == 1
+
+    def test_clear_cache(self, driver):
+        driver.embed_string("foo")
+        driver.clear_cache()
+        driver.embed_string("foo")
+
+        assert driver.cache_bytes == 16
+        assert driver.hits == 0
+        assert driver.misses == 1
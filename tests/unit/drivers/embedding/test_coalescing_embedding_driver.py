@@ -0,0 +1,65 @@
+import threading
+from concurrent import futures
+from unittest.mock import patch
+
+import pytest
+
+from griptape.drivers.embedding.coalescing import CoalescingEmbeddingDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCoalescingEmbeddingDriver:
+    @pytest.fixture()
+    def embedding_driver(self):
+        return MockEmbeddingDriver(mock_output=lambda chunk: [float(len(chunk)), 1.0], max_batch_size=4)
+
+    def test_init(self, embedding_driver):
+        driver = CoalescingEmbeddingDriver(embedding_driver=embedding_driver)
+
+        assert driver.model == "foo"
+        assert driver.max_batch_size == 4
+
+    def test_embed_string(self, embedding_driver):
+        driver = CoalescingEmbeddingDriver(embedding_driver=embedding_driver)
+
+        assert driver.embed_string("foo") == [3.0, 1.0]
+
+    def test_embed_string_coalesces_concurrent_calls(self, embedding_driver):
+        driver = CoalescingEmbeddingDriver(embedding_driver=embedding_driver, batch_window=5)
+        barrier = threading.Barrier(8)
+
+        def embed(string: str) -> list[float]:
+            barrier.wait()
+
+            return driver.embed_string(string)
+
+        with (
+            patch.object(embedding_driver, "embed_strings", wraps=embedding_driver.embed_strings) as embed_strings,
+            futures.ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            strings = ["a" * i for i in range(1, 9)]
+            results = list(executor.map(embed, strings))
+
+        assert results == [[float(i), 1.0] for i in range(1, 9)]
+        assert embed_strings.call_count == 2
+        assert sorted(len(call.args[0]) for call in embed_strings.call_args_list) == [4, 4]
+
+    def test_embed_string_flushes_after_window(self, embedding_driver):
+        driver = CoalescingEmbeddingDriver(embedding_driver=embedding_driver, batch_window=0.01, max_batch_size=100)
+
+        assert driver.embed_string("foo") == [3.0, 1.0]
+        assert driver.embed_string("fo") == [2.0, 1.0]
+
+    def test_embed_string_propagates_errors(self, embedding_driver):
+        driver = CoalescingEmbeddingDriver(embedding_driver=embedding_driver)
+
+        with (
+            patch.object(embedding_driver, "embed_strings", side_effect=Exception("nope")),
+            pytest.raises(Exception, match="nope"),
+        ):
+            driver.embed_string("foo")
+
+    def test_embed_strings(self, embedding_driver):
+        driver = CoalescingEmbeddingDriver(embedding_driver=embedding_driver)
+
+        assert driver.embed_strings(["foo", "fo"]) == [[3.0, 1.0], [2.0, 1.0]]
@@ -8,12 +8,19 @@ class TestOllamaEmbeddingDriver:
     def mock_client(self, mocker):
         mock_client = mocker.patch("ollama.Client")
 
-        mock_client.return_value.embeddings.return_value = {"embedding": [0, 1, 0]}
+        mock_client.return_value.embed.return_value = {"embeddings": [[0, 1, 0]]}
 
         return mock_client
 
     def test_init(self):
         assert OllamaEmbeddingDriver(model="foo")
 
-    def test_try_embed_chunk(self):
+    def test_try_embed_chunk(self, mock_client):
         assert OllamaEmbeddingDriver(model="foo").try_embed_chunk("foobar") == [0, 1, 0]
+        mock_client.return_value.embed.assert_called_once_with(model="foo", input="foobar")
+
+    def test_try_embed_chunks(self, mock_client):
+        mock_client.return_value.embed.return_value = {"embeddings": [[0, 1, 0], [1, 0, 0]]}
+
+        assert OllamaEmbeddingDriver(model="foo").try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_client.return_value.embed.call_args.kwargs["input"] == ["foo", "bar"]
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -30,3 +31,19 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
         assert mock_openai.call_args.kwargs["input"] == "foo bar" if model.endswith("001") else "foo\nbar"
+
+    def test_try_embed_chunks(self, mock_openai):
+        first = Mock(embedding=[0, 1, 0], index=0)
+        second = Mock(embedding=[1, 0, 0], index=1)
+        mock_openai.return_value = Mock(data=[second, first])
+
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+
+    def test_atry_embed_chunks(self, mocker):
+        mock_create = mocker.patch("openai.AsyncOpenAI").return_value.embeddings.create = AsyncMock(
+            return_value=Mock(data=[Mock(embedding=[1, 0, 0], index=1), Mock(embedding=[0, 1, 0], index=0)])
+        )
+
+        assert asyncio.run(OpenAiEmbeddingDriver().atry_embed_chunks(["foo", "bar"])) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_create.call_args.kwargs["input"] == ["foo", "bar"]
@@ -4,7 +4,9 @@ import boto3
 import numpy as np
 import pytest
 
+from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.drivers.vector.amazon_opensearch import AmazonOpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestAmazonOpenSearchVectorStoreDriver:
@@ -52,3 +54,19 @@ class TestAmazonOpenSearchVectorStoreDriver:
             results = driver.query(query_vector, count=5, namespace="company")
             assert len(results) == 1, "Expected results from the query"
             assert results[0].id == "query_result", "Expected a result id"
+
+    def test_upsert_vectors_serverless(self):
+        client = Mock()
+        client.bulk.return_value = {"errors": False, "items": [{"index": {"_id": "generated"}}]}
+        driver = AmazonOpenSearchVectorStoreDriver(
+            host="localhost",
+            index_name="test",
+            service="aoss",
+            session=create_autospec(boto3.Session, instance=True),
+            http_auth=("user", "password"),
+            client=client,
+            embedding_driver=MockEmbeddingDriver(),
+        )
+
+        assert driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2])]) == ["generated"]
+        assert client.bulk.call_args.kwargs["body"][0] == {"index": {"_index": "test"}}
@@ -157,3 +157,29 @@ class TestAstraDbVectorStoreDriver:
             projection=None,
             include_similarity=True,
         )
+
+    def test_upsert_vectors(self, driver, mock_collection):
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 2.0, 3.0], namespace="ns"),
+                BaseVectorStoreDriver.Entry(id="", vector=[3.0, 2.0, 1.0]),
+            ]
+        )
+
+        assert vector_ids == ["foo", "insert_one_server_side_id"]
+        mock_collection.return_value.find_one_and_replace.assert_called_once()
+        mock_collection.return_value.insert_one.assert_called_once()
+
+    def test_load_entries_by_ids(self, driver, mock_collection, one_entry):
+        entries = driver.load_entries_by_ids(["other_id", "doc_id"], namespace="some_namespace")
+
+        mock_collection.return_value.find.assert_called_once_with(
+            filter={"_id": {"$in": ["other_id", "doc_id"]}, "namespace": "some_namespace"}, projection={"*": 1}
+        )
+        assert entries == [None, one_entry]
+
+    def test_entries_exist(self, driver, mock_collection):
+        assert driver.entries_exist(["other_id", "doc_id"]) == [False, True]
+        mock_collection.return_value.find.assert_called_once_with(
+            filter={"_id": {"$in": ["other_id", "doc_id"]}}, projection={"_id": 1}
+        )
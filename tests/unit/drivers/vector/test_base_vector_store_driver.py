@@ -1,10 +1,15 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
+from griptape.chunkers import TextChunker
 from griptape.drivers.vector import BaseVectorStoreDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestBaseVectorStoreDriver(ABC):
@@ -73,3 +78,301 @@ class TestBaseVectorStoreDriver(ABC):
     def test_does_entry_exist_exception(self, driver):
         with patch.object(driver, "load_entry", side_effect=Exception):
             assert driver.does_entry_exist("does_not_exist") is False
+
+    def test_upsert_text_artifacts_embeds_in_batch(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        with patch.object(
+            driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings
+        ) as embed_strings:
+            vector_ids = driver.upsert_text_artifacts({"foo": [TextArtifact("foo"), TextArtifact("bar")]})
+
+        embed_strings.assert_called_once_with(["bar"])
+        assert len(vector_ids["foo"]) == 2
+        assert len(driver.load_entries(namespace="foo")) == 2
+
+    def test_upsert_text_artifacts_dedupes_repeated_artifacts(self, driver, mocker):
+        embed_strings = mocker.patch.object(
+            driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings
+        )
+        upsert_vectors = mocker.patch.object(driver, "upsert_vectors", wraps=driver.upsert_vectors)
+
+        vector_ids = driver.upsert_text_artifacts([TextArtifact("header"), TextArtifact("foo"), TextArtifact("header")])
+
+        embed_strings.assert_called_once_with(["foo", "header"])
+        assert [len(call.args[0]) for call in upsert_vectors.call_args_list] == [2]
+        assert vector_ids[0] == vector_ids[2]
+        assert len(driver.load_entries()) == 2
+
+    def test_upsert_text_artifacts_does_not_mutate_meta(self, driver):
+        meta = {"foo": "bar"}
+
+        driver.upsert_text_artifacts([TextArtifact("foo"), TextArtifact("bar")], meta=meta)
+
+        assert meta == {"foo": "bar"}
+        assert {e.to_artifact().value for e in driver.load_entries()} == {"foo", "bar"}
+
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.0, 1.0], namespace="foo", meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1.0, 0.0], namespace="foo"),
+            ]
+        )
+
+        assert vector_ids == ["foo", "bar"]
+        assert driver.load_entry("foo", namespace="foo").meta == {"foo": "bar"}
+        assert driver.load_entry("bar", namespace="foo").vector == [1.0, 0.0]
+
+    def test_upsert_text_artifacts_upserts_in_batches(self, driver):
+        driver.upsert_batch_size = 2
+
+        with patch.object(driver, "upsert_vectors", wraps=driver.upsert_vectors) as upsert_vectors:
+            vector_ids = driver.upsert_text_artifacts([TextArtifact(f"foo-{i}") for i in range(5)])
+
+        assert [len(call.args[0]) for call in upsert_vectors.call_args_list] == [2, 2, 1]
+        assert len(vector_ids) == 5
+        assert len(driver.load_entries()) == 5
+
+    def test_upsert_text_artifacts_with_chunker(self, driver):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=10)
+
+        vector_ids = driver.upsert_text_artifacts([TextArtifact("foo bar. baz qux.")], chunker=chunker)
+
+        assert len(vector_ids) == 2
+        assert sorted(e.to_artifact().value for e in driver.load_entries()) == ["baz qux.", "foo bar."]
+
+        vector_ids = driver.upsert_text_artifacts(
+            {"foo": [TextArtifact("foo bar. baz qux."), TextArtifact("quux")], "bar": [TextArtifact("bar")]},
+            chunker=chunker,
+        )
+
+        assert [len(vector_ids["foo"]), len(vector_ids["bar"])] == [3, 1]
+        assert sorted(e.to_artifact().value for e in driver.load_entries(namespace="foo")) == [
+            "baz qux.",
+            "foo bar.",
+            "quux",
+        ]
+
+    def test_aupsert_text_artifacts_with_chunker(self, driver):
+        chunker = TextChunker(tokenizer=MockTokenizer(model="foo"), max_tokens=10)
+
+        vector_ids = asyncio.run(driver.aupsert_text_artifacts([TextArtifact("foo bar. baz qux.")], chunker=chunker))
+
+        assert len(vector_ids) == 2
+        assert sorted(e.to_artifact().value for e in driver.load_entries()) == ["baz qux.", "foo bar."]
+
+    def test_entries_exist(self, driver):
+        vector_id = driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        assert driver.entries_exist([vector_id, "bar"], namespace="foo") == [True, False]
+        assert driver.entries_exist([vector_id], namespace="bar") == [False]
+
+    def test_load_entries_by_ids(self, driver):
+        vector_id = driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        entries = driver.load_entries_by_ids(["bar", vector_id], namespace="foo")
+
+        assert entries[0] is None
+        assert entries[1].id == vector_id
+        assert entries[1].to_artifact().value == "foo"
+
+    def test_upsert_text_artifacts_checks_existence_in_batches(self, driver):
+        driver.upsert_batch_size = 2
+        driver.upsert_text_artifact(TextArtifact("foo-0"), namespace="foo")
+
+        with (
+            patch.object(driver, "entries_exist", wraps=driver.entries_exist) as entries_exist,
+            patch.object(driver, "does_entry_exist") as does_entry_exist,
+        ):
+            vector_ids = driver.upsert_text_artifacts(
+                {"foo": [TextArtifact(f"foo-{i}") for i in range(3)], "bar": [TextArtifact("bar")]}
+            )
+
+        assert sorted((call.kwargs["namespace"], len(call.args[0])) for call in entries_exist.call_args_list) == [
+            ("bar", 1),
+            ("foo", 1),
+            ("foo", 2),
+        ]
+        does_entry_exist.assert_not_called()
+        assert len(vector_ids["foo"]) == 3
+        assert len(driver.load_entries(namespace="foo")) == 3
+
+    def test_query_vectors(self, driver):
+        driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 0.0], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[0.0, 1.0], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id="baz", vector=[1.0, 0.0], namespace="baz"),
+            ]
+        )
+
+        results = driver.query_vectors([[1.0, 0.1], [0.1, 1.0]], count=1, namespace="foo")
+
+        assert [[e.id for e in entries] for entries in results] == [["foo"], ["bar"]]
+        assert results == [driver.query_vector(v, count=1, namespace="foo") for v in [[1.0, 0.1], [0.1, 1.0]]]
+        assert driver.query_vectors([]) == []
+
+    def test_query_many(self, driver):
+        driver.upsert_text_artifacts([TextArtifact("foo"), TextArtifact("bar")])
+
+        with patch.object(
+            driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings
+        ) as embed_strings:
+            results = driver.query_many(["foo", "bar"], count=1)
+
+        embed_strings.assert_called_once_with(["foo", "bar"])
+        assert len(results) == 2
+        assert results[0] == driver.query("foo", count=1)
+
+    def test_query_cache(self, driver):
+        driver.query_cache_size = 8
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("bar")]})
+
+        with (
+            patch.object(driver.embedding_driver, "embed_string", wraps=driver.embedding_driver.embed_string) as embed,
+            patch.object(driver, "query_vector", wraps=driver.query_vector) as query_vector,
+        ):
+            results = driver.query("foo", namespace="foo")
+
+            assert driver.query("foo", namespace="foo") == results
+            assert driver.query("foo") == driver.query("foo")
+            assert embed.call_count == 1
+            assert query_vector.call_count == 2
+
+            driver.upsert_text_artifact(TextArtifact("baz"), namespace="bar")
+            driver.query("foo", namespace="foo")
+
+            assert query_vector.call_count == 2
+
+            driver.query("foo")
+
+            assert query_vector.call_count == 3
+
+            driver.upsert_text_artifact(TextArtifact("baz"), namespace="foo")
+
+            assert len(driver.query("foo", namespace="foo")) == 2
+            assert query_vector.call_count == 4
+
+            driver.query("foo", namespace="foo", count=1)
+            driver.query("foo", namespace="foo", include_vectors=True)
+
+            assert query_vector.call_count == 6
+            assert [call.args[0] for call in embed.call_args_list].count("foo") == 1
+
+    def test_query_cache_eviction(self, driver):
+        driver.query_cache_size = 1
+        driver.upsert_text_artifacts([TextArtifact("foo"), TextArtifact("bar")])
+
+        with patch.object(driver, "query_vector", wraps=driver.query_vector) as query_vector:
+            driver.query("foo")
+            driver.query("bar")
+            driver.query("bar")
+            driver.query("foo")
+
+        assert query_vector.call_count == 3
+
+    def test_query_cache_ttl(self, driver):
+        driver.query_cache_size = 8
+        driver.query_cache_ttl = 60
+        driver.upsert_text_artifacts([TextArtifact("foo")])
+
+        with (
+            patch("time.monotonic", return_value=0.0) as monotonic,
+            patch.object(driver, "query_vector", wraps=driver.query_vector) as query_vector,
+        ):
+            driver.query("foo")
+            monotonic.return_value = 30.0
+            driver.query("foo")
+            monotonic.return_value = 61.0
+            driver.query("foo")
+
+        assert query_vector.call_count == 2
+
+    def test_clear_query_cache(self, driver):
+        driver.query_cache_size = 8
+        driver.upsert_text_artifacts([TextArtifact("foo")])
+
+        with patch.object(driver, "query_vector", wraps=driver.query_vector) as query_vector:
+            driver.query("foo")
+            driver.clear_query_cache()
+            driver.query("foo")
+
+        assert query_vector.call_count == 2
+
+    def test_aupsert_text_artifacts(self, driver):
+        asyncio.run(driver.aupsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("bar")]}))
+
+        assert driver.load_entries(namespace="foo")[0].to_artifact().value == "foo"
+        assert driver.load_entries(namespace="bar")[0].to_artifact().value == "bar"
+
+    def test_aupsert_text_artifact(self, driver):
+        vector_id = asyncio.run(driver.aupsert_text_artifact(TextArtifact(id="foo1", value="foobar")))
+
+        assert driver.load_entry(vector_id).to_artifact().value == "foobar"
+        assert asyncio.run(driver.aupsert_text_artifact(TextArtifact(id="foo1", value="foobar"))) == vector_id
+        assert len(driver.load_entries()) == 1
+
+    def test_aquery(self, driver):
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("bar")]})
+
+        assert asyncio.run(driver.aquery("foo", namespace="foo")) == driver.query("foo", namespace="foo")
+        assert len(asyncio.run(driver.aquery("foo"))) == 2
+
+    def test_aquery_cache(self, driver):
+        driver.query_cache_size = 8
+        driver.upsert_text_artifacts([TextArtifact("foo")])
+
+        with patch.object(driver, "query_vector", wraps=driver.query_vector) as query_vector:
+            results = asyncio.run(driver.aquery("foo"))
+
+            assert driver.query("foo") == results
+            assert asyncio.run(driver.aquery("foo")) == results
+
+        assert query_vector.call_count == 1
+
+    def test_export_entries(self, driver):
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("bar")]})
+
+        assert [entry.id for entry in driver.export_entries(namespace="foo")] == [
+            entry.id for entry in driver.load_entries(namespace="foo")
+        ]
+        assert len(list(driver.export_entries(batch_size=1))) == 2
+
+    def test_import_entries(self, driver):
+        entries = (
+            BaseVectorStoreDriver.Entry(id=f"foo{i}", vector=[0.0, 1.0], namespace="foo", meta={"i": i})
+            for i in range(5)
+        )
+
+        with patch.object(driver, "upsert_vectors", wraps=driver.upsert_vectors) as upsert_vectors:
+            assert driver.import_entries(entries, batch_size=2) == 5
+
+        assert [len(call.args[0]) for call in upsert_vectors.call_args_list] == [2, 2, 1]
+        assert driver.load_entry("foo3", namespace="foo").meta == {"i": 3}
+
+    def test_export_to_directory(self, driver, tmp_path):
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("bar")]})
+
+        assert driver.export_to_directory(str(tmp_path)) == 2
+
+        vectors = np.load(tmp_path / driver.EXPORT_VECTORS_FILE)
+        lines = (tmp_path / driver.EXPORT_ENTRIES_FILE).read_text().splitlines()
+
+        assert vectors.shape == (2, 2)
+        assert vectors.dtype == np.float32
+        assert {json.loads(line)["namespace"] for line in lines} == {"foo", "bar"}
+
+    def test_import_from_directory(self, driver, tmp_path):
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("bar")]})
+        driver.export_to_directory(str(tmp_path))
+        entries = driver.load_entries(namespace="foo")
+        imported_driver = type(driver)(embedding_driver=driver.embedding_driver)
+
+        assert imported_driver.import_from_directory(str(tmp_path), batch_size=1) == 2
+        assert imported_driver.load_entries(namespace="foo") == entries
+
+    def test_export_to_directory_empty(self, driver, tmp_path):
+        assert driver.export_to_directory(str(tmp_path)) == 0
+        assert np.load(tmp_path / driver.EXPORT_VECTORS_FILE).shape == (0, 0)
+        assert driver.import_from_directory(str(tmp_path)) == 0
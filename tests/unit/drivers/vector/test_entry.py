@@ -1,4 +1,6 @@
-from griptape.artifacts import TextArtifact
+from unittest.mock import patch
+
+from griptape.artifacts import BaseArtifact, TextArtifact
 from griptape.drivers.vector import BaseVectorStoreDriver
 
 
@@ -10,3 +12,39 @@ class TestEntry:
     def test_to_artifact(self):
         entry = BaseVectorStoreDriver.Entry(id="test", vector=[], meta={"artifact": TextArtifact("foo").to_json()})
         assert entry.to_artifact().value == "foo"
+
+    def test_to_artifact_is_memoized(self):
+        entry = BaseVectorStoreDriver.Entry(id="test", meta={"artifact": TextArtifact("foo").to_json()})
+
+        with patch.object(BaseArtifact, "from_json", wraps=BaseArtifact.from_json) as from_json:
+            artifact = entry.to_artifact()
+
+            assert entry.to_artifact() is artifact
+            assert from_json.call_count == 1
+
+            entry.meta["artifact"] = TextArtifact("bar").to_json()  # pyright: ignore[reportOptionalSubscript]
+
+            assert entry.to_artifact().value == "bar"
+            assert from_json.call_count == 2
+
+    def test_eq_ignores_decoded_artifact(self):
+        meta = {"artifact": TextArtifact("foo").to_json()}
+        entry = BaseVectorStoreDriver.Entry(id="test", meta=meta)
+        entry.to_artifact()
+
+        assert entry == BaseVectorStoreDriver.Entry(id="test", meta=meta)
+
+    def test_to_dict(self):
+        entry = BaseVectorStoreDriver.Entry(id="test", vector=[0.1], meta={"foo": "bar"}, namespace="baz")
+
+        assert entry.to_dict() == {
+            "id": "test",
+            "vector": [0.1],
+            "score": None,
+            "meta": {"foo": "bar"},
+            "namespace": "baz",
+        }
+        assert BaseVectorStoreDriver.Entry.from_dict(entry.to_dict()) == entry
+
+    def test_slots(self):
+        assert not hasattr(BaseVectorStoreDriver.Entry(id="test"), "__dict__")
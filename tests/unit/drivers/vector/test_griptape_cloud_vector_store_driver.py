@@ -60,6 +60,15 @@ class TestGriptapeCloudVectorStoreDriver:
         assert result[0].score == self.test_scores[0]
         assert result[1].score == self.test_scores[1]
 
+    def test_query_many(self, driver, mocker):
+        post = mocker.patch("requests.post", return_value=mocker.Mock(json=lambda: {"entries": []}))
+
+        results = driver.query_many(["foo", "bar"], count=10)
+
+        assert results == [[], []]
+        assert sorted(call.kwargs["json"]["query"] for call in post.call_args_list) == ["bar", "foo"]
+        assert all(call.kwargs["json"]["query_args"] == {"count": 10} for call in post.call_args_list)
+
     def test_query_defaults(self, driver):
         result = driver.query("some query")
 
@@ -1,3 +1,8 @@
+import os
+import tempfile
+from concurrent import futures
+
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
@@ -6,11 +11,28 @@ from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.unit.drivers.vector.test_base_vector_store_driver import TestBaseVectorStoreDriver
 
 
+def clustered_vectors(count: int, dimensions: int = 32, clusters: int = 50, seed: int = 0) -> np.ndarray:
+    random = np.random.default_rng(seed)
+    centers = random.normal(size=(clusters, dimensions))
+
+    return centers[random.integers(clusters, size=count)] + random.normal(scale=0.3, size=(count, dimensions))
+
+
 class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
     @pytest.fixture()
     def driver(self):
         return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
 
+    @pytest.fixture()
+    def ivf_driver(self):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            index_type="ivf",
+            ivf_list_count=50,
+            ivf_probe_count=4,
+            ivf_min_rows=1000,
+        )
+
     def test_upsert_text_artifacts_dict(self, driver):
         driver.upsert_text_artifacts({"foo": [TextArtifact("bar"), TextArtifact("baz")], "bar": [TextArtifact("bar")]})
 
@@ -47,3 +69,398 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         assert result[0].vector == [0, 1]
         assert result[0].score is not None
         assert result[0].namespace == "foo"
+
+    def test_query_vector_top_k(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="b")
+        driver.upsert_vector([1.0, 1.0], vector_id="c")
+        driver.upsert_vector([-1.0, 0.0], vector_id="d")
+
+        result = driver.query_vector([1.0, 0.1], count=2)
+
+        assert [r.id for r in result] == ["a", "c"]
+        assert result[0].score == pytest.approx(0.995, abs=1e-3)
+        assert [r.id for r in driver.query_vector([1.0, 0.1])] == ["a", "c", "b", "d"]
+
+    def test_query_vector_upsert_overwrites_row(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="b")
+        driver.upsert_vector([-1.0, 0.0], vector_id="a")
+
+        result = driver.query_vector([1.0, 0.0], count=1, include_vectors=True)
+
+        assert result[0].id == "b"
+        assert len(driver.query_vector([1.0, 0.0])) == 2
+
+    def test_query_vector_grows_index(self, driver):
+        for i in range(LocalVectorStoreDriver.INITIAL_INDEX_CAPACITY + 10):
+            driver.upsert_vector([1.0, float(i)], vector_id=str(i))
+
+        result = driver.query_vector([1.0, 0.0], count=3)
+
+        assert [r.id for r in result] == ["0", "1", "2"]
+        assert len(driver.query_vector([1.0, 0.0])) == LocalVectorStoreDriver.INITIAL_INDEX_CAPACITY + 10
+
+    def test_query_vector_custom_relatedness(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), calculate_relatedness=lambda x, y: -abs(x[0] - y[0])
+        )
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([5.0, 0.0], vector_id="b")
+        driver.upsert_vector([3.0, 0.0], vector_id="c")
+
+        result = driver.query_vector([4.0, 0.0], count=2)
+
+        assert [r.id for r in result] == ["b", "c"]
+        assert result[0].score == -1.0
+
+    def test_upsert_vector_dimension_mismatch(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+
+        with pytest.raises(ValueError, match="dimension"):
+            driver.upsert_vector([1.0, 0.0, 0.0], vector_id="b")
+
+    def test_query_vector_namespace_prefix(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="x", namespace="a")
+        driver.upsert_vector([1.0, 0.0], vector_id="y", namespace="a-b")
+        driver.upsert_vector([1.0, 0.0], vector_id="z", namespace="a-b")
+
+        assert [r.id for r in driver.query_vector([1.0, 0.0], namespace="a")] == ["x"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0], namespace="a-b")] == ["y", "z"]
+        assert [e.id for e in driver.load_entries(namespace="a")] == ["x"]
+
+    def test_count_entries(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="x", namespace="a")
+        driver.upsert_vector([1.0, 0.0], vector_id="y", namespace="a-b")
+        driver.upsert_vector([1.0, 0.0], vector_id="z")
+
+        assert driver.count_entries() == 3
+        assert driver.count_entries(namespace="a") == 1
+        assert driver.count_entries(namespace="a-b") == 1
+        assert driver.count_entries(namespace="c") == 0
+
+    def test_upsert_vector_moves_shared_key_between_namespaces(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="b-c", namespace="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="c", namespace="a-b")
+
+        assert driver.count_entries(namespace="a") == 0
+        assert [e.id for e in driver.load_entries(namespace="a-b")] == ["c"]
+        assert [r.id for r in driver.query_vector([1.0, 0.0], namespace="a-b")] == ["c"]
+
+    def test_load_entries_after_direct_modification(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="x", namespace="a")
+        driver.entries["b-y"] = LocalVectorStoreDriver.Entry(id="y", vector=[0.0, 1.0], namespace="b")
+
+        assert [e.id for e in driver.load_entries(namespace="b")] == ["y"]
+        assert [r.id for r in driver.query_vector([0.0, 1.0], namespace="b")] == ["y"]
+
+    def test_query_vector_ivf_recall(self, driver, ivf_driver):
+        for i, vector in enumerate(clustered_vectors(5000).tolist()):
+            driver.upsert_vector(vector, vector_id=str(i))
+            ivf_driver.upsert_vector(vector, vector_id=str(i))
+
+        queries = clustered_vectors(50, seed=1).tolist()
+        recalls = [
+            len(
+                {r.id for r in ivf_driver.query_vector(query, count=10)}
+                & {r.id for r in driver.query_vector(query, count=10)}
+            )
+            / 10
+            for query in queries
+        ]
+
+        assert len(ivf_driver._ivf_lists) == 50
+        assert np.mean(recalls) >= 0.9
+
+    def test_ivf_index_is_trained_by_upserts(self, ivf_driver, mocker):
+        train_ivf_centroids = ivf_driver._LocalVectorStoreDriver__train_ivf_centroids
+
+        def assert_unlocked(vectors):
+            assert not ivf_driver.thread_lock.locked()
+
+            return train_ivf_centroids(vectors)
+
+        mocker.patch.object(ivf_driver, "_LocalVectorStoreDriver__train_ivf_centroids", side_effect=assert_unlocked)
+        vectors = clustered_vectors(1000).tolist()
+
+        for i, vector in enumerate(vectors[:-1]):
+            ivf_driver.upsert_vector(vector, vector_id=str(i))
+
+        assert ivf_driver._ivf_centroids is None
+
+        ivf_driver.upsert_vector(vectors[-1], vector_id="999")
+
+        assert ivf_driver._ivf_trained_rows == 1000
+        assert sum(len(ivf_list) for ivf_list in ivf_driver._ivf_lists) == 1000
+
+        ivf_driver.query_vector(vectors[0], count=5)
+
+        assert ivf_driver._LocalVectorStoreDriver__train_ivf_centroids.call_count == 1
+
+    def test_query_vector_ivf_exact_scores(self, driver, ivf_driver):
+        for i, vector in enumerate(clustered_vectors(2000).tolist()):
+            driver.upsert_vector(vector, vector_id=str(i))
+            ivf_driver.upsert_vector(vector, vector_id=str(i))
+
+        query = clustered_vectors(1, seed=1)[0].tolist()
+        exact_scores = {r.id: r.score for r in driver.query_vector(query)}
+
+        for result in ivf_driver.query_vector(query, count=5):
+            assert result.score == pytest.approx(exact_scores[result.id])
+
+    def test_query_vector_ivf_incremental_insert(self, ivf_driver):
+        for i, vector in enumerate(clustered_vectors(2000).tolist()):
+            ivf_driver.upsert_vector(vector, vector_id=str(i))
+
+        query = clustered_vectors(1, seed=1)[0].tolist()
+        ivf_driver.query_vector(query, count=5)
+        ivf_driver.upsert_vector(query, vector_id="new")
+
+        assert ivf_driver.query_vector(query, count=5)[0].id == "new"
+
+    def test_query_vector_ivf_namespace(self, ivf_driver):
+        for i, vector in enumerate(clustered_vectors(2000).tolist()):
+            ivf_driver.upsert_vector(vector, vector_id=str(i), namespace="even" if i % 2 == 0 else "odd")
+
+        query = clustered_vectors(1, seed=1)[0].tolist()
+        result = ivf_driver.query_vector(query, count=20, namespace="odd")
+
+        assert len(result) == 20
+        assert all(r.namespace == "odd" for r in result)
+
+    def test_query_vector_ivf_returns_count(self, ivf_driver):
+        for i, vector in enumerate(clustered_vectors(2000).tolist()):
+            ivf_driver.upsert_vector(vector, vector_id=str(i))
+
+        assert len(ivf_driver.query_vector(clustered_vectors(1, seed=1)[0].tolist(), count=500)) == 500
+
+    def test_invalid_index_type(self):
+        with pytest.raises(ValueError, match="Unsupported index type"):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), index_type="foo")
+
+    @pytest.fixture()
+    def persist_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield os.path.join(temp_dir, "store.jsonl")
+
+    @pytest.mark.parametrize("vector_dtype", ["float16", "int8"])
+    def test_query_vector_quantized(self, driver, persist_file, vector_dtype):
+        quantized_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="binary",
+            vector_dtype=vector_dtype,
+        )
+
+        for i, vector in enumerate(clustered_vectors(2000).tolist()):
+            driver.upsert_vector(vector, vector_id=str(i))
+            quantized_driver.upsert_vector(vector, vector_id=str(i))
+
+        queries = clustered_vectors(20, seed=1).tolist()
+
+        for query in queries:
+            exact = driver.query_vector(query, count=10)
+            result = quantized_driver.query_vector(query, count=10)
+
+            assert len({r.id for r in result} & {r.id for r in exact}) >= 9
+            assert [r.score for r in result] == pytest.approx([r.score for r in exact], abs=1e-2)
+
+        assert quantized_driver._quantized.dtype == np.dtype(vector_dtype)
+        assert quantized_driver.load_entry("0").vector == pytest.approx(driver.load_entry("0").vector)
+
+    def test_query_vector_quantized_scores_are_exact(self, driver, persist_file):
+        quantized_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="binary",
+            vector_dtype="int8",
+        )
+
+        for i, vector in enumerate(clustered_vectors(500).tolist()):
+            driver.upsert_vector(vector, vector_id=str(i))
+            quantized_driver.upsert_vector(vector, vector_id=str(i))
+
+        query = clustered_vectors(1, seed=1)[0].tolist()
+        exact_scores = {r.id: r.score for r in driver.query_vector(query)}
+
+        for result in quantized_driver.query_vector(query, count=5):
+            assert result.score == pytest.approx(exact_scores[result.id], abs=1e-6)
+
+    @pytest.mark.parametrize("kwargs", [{}, {"persist_format": "binary"}, {"persist_file": "foo"}])
+    def test_init_validates_quantized_persistence(self, kwargs):
+        with pytest.raises(ValueError, match='requires a persist_file with persist_format="binary"'):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), vector_dtype="int8", **kwargs)
+
+    def test_invalid_vector_dtype(self):
+        with pytest.raises(ValueError, match="Unsupported vector dtype"):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), vector_dtype="int4")
+
+    @pytest.fixture()
+    def filter_driver(self, driver):
+        for i in range(20):
+            driver.upsert_vector(
+                [1.0, float(i)],
+                vector_id=str(i),
+                namespace="even" if i % 2 == 0 else "odd",
+                meta={"page": i, "source": f"source-{i % 3}", "tags": ["a"]},
+            )
+
+        return driver
+
+    @pytest.mark.parametrize(
+        ("meta_filter", "expected"),
+        [
+            ({"source": "source-0"}, {"0", "3", "6", "9", "12", "15", "18"}),
+            ({"source": {"$eq": "source-0"}}, {"0", "3", "6", "9", "12", "15", "18"}),
+            ({"source": {"$in": ["source-1", "source-2"]}, "page": {"$lt": 5}}, {"1", "2", "4"}),
+            ({"page": {"$gt": 15}}, {"16", "17", "18", "19"}),
+            ({"page": {"$gte": 5, "$lte": 7}}, {"5", "6", "7"}),
+            ({"page": {"$gt": 5, "$lt": 5}}, set()),
+            ({"source": "missing"}, set()),
+            ({"missing": "foo"}, set()),
+            ({"tags": ["a"]}, set()),
+        ],
+    )
+    def test_query_vector_filter(self, filter_driver, meta_filter, expected):
+        result = filter_driver.query_vector([1.0, 0.0], filter=meta_filter)
+
+        assert {r.id for r in result} == expected
+
+    def test_query_vector_filter_and_namespace(self, filter_driver):
+        result = filter_driver.query_vector([1.0, 0.0], count=2, namespace="even", filter={"source": "source-0"})
+
+        assert [r.id for r in result] == ["0", "6"]
+
+    def test_query_vector_filter_custom_relatedness(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), calculate_relatedness=lambda x, y: -abs(x[0] - y[0])
+        )
+        driver.upsert_vector([1.0, 0.0], vector_id="a", meta={"source": "x"})
+        driver.upsert_vector([2.0, 0.0], vector_id="b", meta={"source": "y"})
+
+        assert [r.id for r in driver.query_vector([2.0, 0.0], filter={"source": "x"})] == ["a"]
+
+    def test_query_vector_filter_updates_on_upsert(self, filter_driver):
+        assert {r.id for r in filter_driver.query_vector([1.0, 0.0], filter={"page": {"$gt": 18}})} == {"19"}
+
+        filter_driver.upsert_vector([1.0, 0.0], vector_id="0", namespace="even", meta={"page": 100, "source": "new"})
+
+        assert {r.id for r in filter_driver.query_vector([1.0, 0.0], filter={"page": {"$gt": 18}})} == {"0", "19"}
+        assert {r.id for r in filter_driver.query_vector([1.0, 0.0], filter={"source": "new"})} == {"0"}
+        assert "0" not in {r.id for r in filter_driver.query_vector([1.0, 0.0], filter={"source": "source-0"})}
+
+    def test_query_vector_filter_unsupported_operator(self, filter_driver):
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            filter_driver.query_vector([1.0, 0.0], filter={"page": {"$ne": 1}})
+
+    def test_query_filter(self, driver):
+        driver.upsert_text_artifacts([TextArtifact("foo")], meta={"source": "a"})
+        driver.upsert_text_artifacts([TextArtifact("bar")], meta={"source": "b"})
+
+        assert [e.to_artifact().value for e in driver.query("foo", filter={"source": "b"})] == ["bar"]
+
+    @pytest.mark.parametrize("count", [None, 1, 5, 100])
+    def test_query_vectors_matches_query_vector(self, driver, count):
+        for i, vector in enumerate(clustered_vectors(100, dimensions=8).tolist()):
+            driver.upsert_vector(vector, vector_id=str(i), namespace="even" if i % 2 == 0 else "odd")
+
+        queries = clustered_vectors(40, dimensions=8, seed=1).tolist()
+        results = driver.query_vectors(queries, count=count, namespace="even", include_vectors=True)
+
+        assert len(results) == 40
+        for query, entries in zip(queries, results):
+            expected = driver.query_vector(query, count=count, namespace="even", include_vectors=True)
+
+            assert [e.id for e in entries] == [e.id for e in expected]
+            assert np.allclose([e.score for e in entries], [e.score for e in expected], atol=1e-6)
+            assert [e.vector for e in entries] == [e.vector for e in expected]
+
+    def test_query_vectors_filter(self, filter_driver):
+        results = filter_driver.query_vectors([[1.0, 0.0], [0.0, 1.0]], count=2, filter={"source": "source-0"})
+
+        assert [[r.id for r in entries] for entries in results] == [["0", "3"], ["18", "15"]]
+
+    def test_query_vectors_ivf(self, ivf_driver):
+        for i, vector in enumerate(clustered_vectors(2000).tolist()):
+            ivf_driver.upsert_vector(vector, vector_id=str(i))
+
+        queries = clustered_vectors(5, seed=1).tolist()
+
+        assert ivf_driver.query_vectors(queries, count=10) == [ivf_driver.query_vector(q, count=10) for q in queries]
+
+    def test_query_vectors_custom_relatedness(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), calculate_relatedness=lambda x, y: -abs(x[0] - y[0])
+        )
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([2.0, 0.0], vector_id="b")
+
+        results = driver.query_vectors([[1.0, 0.0], [2.0, 0.0]], count=1)
+
+        assert [[r.id for r in entries] for entries in results] == [["a"], ["b"]]
+
+
+class TestShardedLocalVectorStoreDriver(TestLocalVectorStoreDriver):
+    @pytest.fixture()
+    def driver(self):
+        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shard_count=4)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"persist_format": "binary", "persist_file": "foo"}, {"index_type": "ivf"}, {"vector_dtype": "int8"}]
+    )
+    def test_init_validates_sharding(self, kwargs):
+        with pytest.raises(ValueError, match="Sharding"):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shard_count=4, **kwargs)
+
+    def test_init_validates_shard_count(self):
+        with pytest.raises(ValueError, match="shard_count"):
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), shard_count=0)
+
+    def test_query_vectors_matches_unsharded(self, driver):
+        unsharded_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        vectors = clustered_vectors(500).tolist()
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector, vector_id=str(i), namespace=str(i % 2))
+            unsharded_driver.upsert_vector(vector, vector_id=str(i), namespace=str(i % 2))
+
+        queries = clustered_vectors(20, seed=1).tolist()
+
+        for kwargs in [{"count": 10}, {"count": 10, "namespace": "1"}, {"count": None}]:
+            expected = unsharded_driver.query_vectors(queries, **kwargs)
+
+            assert [[r.id for r in results] for results in driver.query_vectors(queries, **kwargs)] == [
+                [r.id for r in results] for results in expected
+            ]
+            assert [r.score for r in driver.query_vector(queries[0], **kwargs)] == pytest.approx(
+                [r.score for r in expected[0]], abs=1e-6
+            )
+
+    def test_concurrent_upserts_and_queries(self, driver):
+        vectors = clustered_vectors(400).tolist()
+
+        def upsert(start: int) -> None:
+            for i in range(start, len(vectors), 4):
+                driver.upsert_vector(vectors[i], vector_id=str(i))
+
+        def query() -> None:
+            for vector in vectors[:50]:
+                driver.query_vector(vector, count=5)
+
+        with futures.ThreadPoolExecutor() as executor:
+            for future in [executor.submit(upsert, start) for start in range(4)] + [executor.submit(query)]:
+                future.result()
+
+        assert driver.count_entries() == len(vectors)
+        assert [r.id for r in driver.query_vector(vectors[123], count=1)] == ["123"]
+
+    def test_stale_shard_write_is_skipped(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="a")
+        shard = driver._shards[driver._LocalVectorStoreDriver__shard_index("a")]
+
+        # The write of the first upsert lands after the write of the second one.
+        driver._LocalVectorStoreDriver__index_shard_vector(shard, "a", np.asarray([1.0, 0.0], dtype=np.float32), 0, 0)
+
+        assert driver.load_entry("a").vector == [0.0, 1.0]
+        assert driver.query_vector([0.0, 1.0], count=1)[0].score == pytest.approx(1.0)
@@ -117,6 +117,34 @@ class TestMarqoVectorStorageDriver:
         }
         assert result == expected_return_value["items"][0]["_id"]
 
+    def test_upsert_text_artifacts(self, driver, mock_marqo):
+        driver.upsert_batch_size = 2
+        mock_marqo.index().add_documents.side_effect = lambda docs, **kwargs: {
+            "errors": False,
+            "items": [{"_id": doc["_id"], "result": "created", "status": 201} for doc in docs],
+        }
+
+        result = driver.upsert_text_artifacts(
+            {
+                "foo": [TextArtifact("foo 1"), TextArtifact("foo 2"), TextArtifact("foo 3")],
+                "bar": [TextArtifact("bar 1")],
+            }
+        )
+
+        calls = mock_marqo.index().add_documents.call_args_list
+        assert sorted(len(call.args[0]) for call in calls) == [1, 1, 2]
+        assert all(len({doc["namespace"] for doc in call.args[0]}) == 1 for call in calls)
+        assert result == {
+            "foo": [driver._artifact_document(TextArtifact(f"foo {i}"), "foo")["_id"] for i in range(1, 4)],
+            "bar": [driver._artifact_document(TextArtifact("bar 1"), "bar")["_id"]],
+        }
+
+    def test_upsert_text_artifacts_with_failed_batch(self, driver, mock_marqo):
+        mock_marqo.index().add_documents.return_value = {"errors": True, "items": []}
+
+        with pytest.raises(ValueError):
+            driver.upsert_text_artifacts([TextArtifact("foo")])
+
     def test_query_vector(self, driver):
         with pytest.raises(NotImplementedError):
             driver.query_vector([0.0, 0.5])
@@ -130,6 +158,14 @@ class TestMarqoVectorStorageDriver:
         assert results[0].meta["Description"] == "Test description"
         assert results[0].id == "5aed93eb-3878-4f12-bc92-0fda01c7d23d"
 
+    def test_query_many(self, driver, mock_marqo):
+        results = driver.query_many(["Test query", "Other query"], count=3)
+
+        assert mock_marqo.index().search.call_count == 2
+        assert {call.args[0] for call in mock_marqo.index().search.call_args_list} == {"Test query", "Other query"}
+        assert len(results) == 2
+        assert results[0][0].id == "5aed93eb-3878-4f12-bc92-0fda01c7d23d"
+
     def test_search_with_include_vectors(self, driver, mock_marqo):
         # Act
         results = driver.query("Test query", include_vectors=True)
@@ -1,5 +1,9 @@
+import asyncio
+from unittest.mock import AsyncMock
+
 import mongomock
 import pytest
+from bson import ObjectId
 
 from griptape.artifacts import TextArtifact
 from griptape.drivers.vector import BaseVectorStoreDriver
@@ -27,6 +31,24 @@ class TestMongoDbAtlasVectorStoreDriver:
         test_id = driver.upsert_vector(vector, vector_id=vector_id_str)
         assert test_id == vector_id_str
 
+    def test_upsert_vectors(self, driver, mocker):
+        collection = mocker.patch.object(driver, "get_collection").return_value
+
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="bar", meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="", vector=[0.2, 0.1]),
+            ]
+        )
+        operations = collection.bulk_write.call_args.args[0]
+
+        assert vector_ids[0] == "foo"
+        assert len(vector_ids[1]) == 24
+        collection.bulk_write.assert_called_once()
+        assert [operation._filter for operation in operations] == [{"_id": "foo"}, {"_id": ObjectId(vector_ids[1])}]
+        assert operations[0]._doc == {"vector": [0.1, 0.2], "namespace": "bar", "meta": {"foo": "bar"}}
+        assert all(operation._upsert for operation in operations)
+
     def test_upsert_text_artifact(self, driver):
         artifact = TextArtifact("foo")
         test_id = driver.upsert_text_artifact(artifact)
@@ -77,6 +99,21 @@ class TestMongoDbAtlasVectorStoreDriver:
         result = driver.load_entry(vector_id_str)
         assert result is not None
 
+    def test_load_entries_by_ids(self, driver):
+        driver.upsert_vector([0.5, 0.5, 0.5], vector_id="123", namespace="foo")
+
+        entries = driver.load_entries_by_ids(["456", "123"], namespace="foo")
+
+        assert entries[0] is None
+        assert entries[1].id == "123"
+        assert entries[1].vector == [0.5, 0.5, 0.5]
+        assert driver.load_entries_by_ids(["123"], namespace="bar") == [None]
+
+    def test_entries_exist(self, driver):
+        driver.upsert_vector([0.5, 0.5, 0.5], vector_id="123")
+
+        assert driver.entries_exist(["456", "123"]) == [False, True]
+
     def test_load_entries(self, driver):
         vector_id_str = "123"
         vector = [0.5, 0.5, 0.5]
@@ -97,3 +134,29 @@ class TestMongoDbAtlasVectorStoreDriver:
         results = list(driver.load_entries())
         assert results is not None
         assert len(results) == 0
+
+    def test_aquery_vector(self, driver, mocker):
+        async def cursor():
+            yield {"_id": ObjectId(), "vector": [0.5, 0.5], "score": 0.9, "meta": {"foo": "bar"}}
+
+        collection = mocker.patch.object(driver, "get_async_collection").return_value
+        collection.aggregate = AsyncMock(return_value=cursor())
+
+        results = asyncio.run(driver.aquery_vector([0.5, 0.5], count=1, namespace="foo", include_vectors=True))
+
+        pipeline = collection.aggregate.call_args.args[0]
+        assert pipeline[0]["$vectorSearch"]["limit"] == 1
+        assert pipeline[0]["$vectorSearch"]["filter"] == {"namespace": "foo"}
+        assert results[0].vector == [0.5, 0.5]
+        assert results[0].meta == {"foo": "bar"}
+        assert results[0].namespace == "foo"
+
+    def test_aupsert_vectors(self, driver, mocker):
+        collection = mocker.patch.object(driver, "get_async_collection").return_value
+        collection.bulk_write = AsyncMock()
+
+        vector_ids = asyncio.run(driver.aupsert_vectors([BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2])]))
+
+        assert vector_ids == ["foo"]
+        assert isinstance(collection.bulk_write.call_args.args[0], list)
+        collection.bulk_write.assert_awaited_once()
@@ -3,7 +3,9 @@ from unittest.mock import Mock, create_autospec, patch
 import numpy as np
 import pytest
 
+from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.drivers.vector.opensearch import OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestOpenSearchVectorStoreDriver:
@@ -60,3 +62,119 @@ class TestOpenSearchVectorStoreDriver:
             results = driver.query(query_string, count=5, namespace="company")
             assert len(results) == 1, "Expected results from the query"
             assert results[0].id == "query_result", "Expected a result id"
+
+    def test_upsert_vectors(self):
+        client = Mock()
+        client.bulk.return_value = {"errors": False, "items": [{"index": {"_id": "foo"}}, {"index": {"_id": "bar"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="company"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[0.2, 0.1], meta={"foo": "bar"}),
+            ]
+        )
+
+        assert vector_ids == ["foo", "bar"]
+        client.bulk.assert_called_once_with(
+            body=[
+                {"index": {"_index": "test", "_id": "foo"}},
+                {"vector": [0.1, 0.2], "namespace": "company", "metadata": None},
+                {"index": {"_index": "test", "_id": "bar"}},
+                {"vector": [0.2, 0.1], "namespace": None, "metadata": {"foo": "bar"}},
+            ]
+        )
+
+    def test_upsert_vectors_errors(self):
+        client = Mock()
+        client.bulk.return_value = {"errors": True, "items": [{"index": {"_id": "foo", "error": {"type": "oops"}}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        with pytest.raises(RuntimeError, match="oops"):
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2])])
+
+    def test_load_entries_by_ids(self):
+        client = Mock()
+        client.search.return_value = {
+            "hits": {
+                "hits": [{"_id": "bar", "_source": {"vector": [0.1, 0.2], "namespace": "company", "metadata": {}}}]
+            }
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        entries = driver.load_entries_by_ids(["foo", "bar"], namespace="company")
+
+        assert entries[0] is None
+        assert entries[1].id == "bar"
+        assert entries[1].vector == [0.1, 0.2]
+        assert entries[1].namespace == "company"
+        client.search.assert_called_once_with(
+            index="test",
+            body={
+                "query": {"bool": {"must": [{"ids": {"values": ["foo", "bar"]}}, {"term": {"namespace": "company"}}]}},
+                "size": 2,
+                "_source": True,
+            },
+        )
+
+    def test_entries_exist(self):
+        client = Mock()
+        client.search.return_value = {"hits": {"hits": [{"_id": "foo"}]}}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        assert driver.entries_exist(["foo", "bar"]) == [True, False]
+        assert client.search.call_args.kwargs["body"]["_source"] is False
+        assert driver.entries_exist([]) == []
+        client.search.assert_called_once()
+
+    def test_query_vectors(self):
+        client = Mock()
+        client.msearch.return_value = {
+            "responses": [
+                {
+                    "hits": {
+                        "hits": [{"_id": "foo", "_score": 0.5, "_source": {"namespace": "company", "metadata": {}}}]
+                    }
+                },
+                {"hits": {"hits": []}},
+            ]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        results = driver.query_vectors([[0.1, 0.2], [0.2, 0.1]], count=3, namespace="company")
+
+        assert [[e.id for e in entries] for entries in results] == [["foo"], []]
+        assert results[0][0].score == 0.5
+        assert results[0][0].namespace == "company"
+        body = client.msearch.call_args.kwargs["body"]
+        assert body[0] == {"index": "test"}
+        assert body[1] == {
+            "size": 3,
+            "query": {
+                "bool": {
+                    "must": [{"match": {"namespace": "company"}}, {"knn": {"vector": {"vector": [0.1, 0.2], "k": 3}}}]
+                }
+            },
+        }
+        assert len(body) == 4
+        client.search.assert_not_called()
+
+    def test_query_vectors_errors(self):
+        client = Mock()
+        client.msearch.return_value = {"responses": [{"error": {"type": "oops"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        with pytest.raises(RuntimeError, match="oops"):
+            driver.query_vectors([[0.1, 0.2]])
@@ -1,6 +1,7 @@
 import os
 import tempfile
 
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
@@ -29,3 +30,151 @@ class TestPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+
+class TestPersistentBinaryLocalVectorStoreDriver(TestBaseVectorStoreDriver):
+    @pytest.fixture()
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    @pytest.fixture()
+    def persist_file(self, temp_dir):
+        return os.path.join(temp_dir, "store.jsonl")
+
+    @pytest.fixture()
+    def driver(self, persist_file):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+    def test_persistence(self, driver, persist_file):
+        driver.upsert_text_artifact(TextArtifact("persistent foobar"), namespace="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+        assert new_driver.query("persistent foobar", namespace="foo")[0].to_artifact().value == "persistent foobar"
+        assert new_driver.load_entry("bar").vector == [1.0, 0.0]
+        assert new_driver.count_entries(namespace="foo") == 1
+        assert new_driver.query_vector([1.0, 0.0], count=1)[0].id == "bar"
+        assert os.path.isfile(new_driver.vectors_file)
+
+    def test_upsert_appends_to_log(self, driver, persist_file):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 3
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+        assert len(new_driver.entries) == 1
+        assert new_driver.load_entry("foo").vector == [0.0, 1.0]
+
+    def test_compact(self, driver, persist_file):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo", meta={"a": 1})
+        driver.upsert_vector([0.0, 1.0], vector_id="foo", meta={"a": 2})
+        driver.upsert_vector([1.0, 1.0], vector_id="bar")
+
+        driver.compact()
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 3
+
+        driver.upsert_vector([1.0, 2.0], vector_id="baz")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+        assert new_driver.load_entry("foo").meta == {"a": 2}
+        assert new_driver.load_entry("baz").vector == [1.0, 2.0]
+        assert [r.id for r in new_driver.query_vector([0.0, 1.0])] == ["foo", "baz", "bar"]
+
+    def test_ignores_torn_log_record(self, driver, persist_file):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+
+        with open(persist_file, "a") as file:
+            file.write('{"key": "bar", "id"')
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+        assert list(new_driver.entries.keys()) == ["foo"]
+
+    def test_invalid_persist_format(self, persist_file):
+        with pytest.raises(ValueError, match="Unsupported persist format"):
+            LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="foo"
+            )
+
+    def test_ivf_persistence(self, persist_file):
+        vectors = np.random.default_rng(0).normal(size=(1500, 8)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="binary",
+            index_type="ivf",
+            ivf_min_rows=1000,
+        )
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector, vector_id=str(i))
+
+        driver.query_vector(vectors[0], count=1)
+        driver.upsert_vector(vectors[1], vector_id="0")
+
+        assert os.path.isfile(driver.ivf_file)
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="binary",
+            index_type="ivf",
+            ivf_min_rows=1000,
+        )
+
+        assert new_driver.query_vector(vectors[1], count=2)[0].score == pytest.approx(1.0)
+        assert {r.id for r in new_driver.query_vector(vectors[1], count=2)} == {"0", "1"}
+
+        new_driver.compact()
+
+        compacted_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="binary",
+            index_type="ivf",
+            ivf_min_rows=1000,
+        )
+
+        assert {r.id for r in compacted_driver.query_vector(vectors[1], count=2)} == {"0", "1"}
+
+    def test_quantized_persistence(self, persist_file):
+        vectors = np.random.default_rng(0).normal(size=(200, 8)).tolist()
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="binary",
+            vector_dtype="int8",
+        )
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector, vector_id=str(i))
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            persist_file=persist_file,
+            persist_format="binary",
+            vector_dtype="int8",
+        )
+        result = new_driver.query_vector(vectors[42], count=1, include_vectors=True)
+
+        assert result[0].id == "42"
+        assert result[0].score == pytest.approx(1.0)
+        assert result[0].vector == pytest.approx(vectors[42])
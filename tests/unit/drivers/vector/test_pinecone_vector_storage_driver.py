@@ -1,6 +1,7 @@
 import pytest
 
 from griptape.artifacts import TextArtifact
+from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.drivers.vector.pinecone import PineconeVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
@@ -44,6 +45,26 @@ class TestPineconeVectorStorageDriver:
         assert driver.upsert_vector([0, 1, 2], vector_id="foo") == "foo"
         assert isinstance(driver.upsert_vector([0, 1, 2]), str)
 
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1, 2], namespace="a"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1, 2, 3], namespace="b", meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="", vector=[2, 3, 4], namespace="a"),
+            ]
+        )
+
+        assert vector_ids[:2] == ["foo", "bar"]
+        assert driver.index.upsert.call_count == 2
+        assert driver.index.upsert.call_args_list[0].kwargs == {
+            "vectors": [("foo", [0, 1, 2], None), (vector_ids[2], [2, 3, 4], None)],
+            "namespace": "a",
+        }
+        assert driver.index.upsert.call_args_list[1].kwargs == {
+            "vectors": [("bar", [1, 2, 3], {"foo": "bar"})],
+            "namespace": "b",
+        }
+
     def test_upsert_text(self, driver):
         assert driver.upsert_text("foo", vector_id="foo") == "foo"
         assert isinstance(driver.upsert_text("foo"), str)
@@ -59,3 +80,17 @@ class TestPineconeVectorStorageDriver:
 
         assert results[0].vector == [0, 1, 0]
         assert results[0].id == "foo"
+
+    def test_load_entries_by_ids(self, driver):
+        driver.index.fetch.return_value.to_dict.return_value = {
+            "vectors": {"bar": {"id": "bar", "values": [0, 1, 0], "metadata": {"foo": "bar"}}},
+            "namespace": "foobar",
+        }
+
+        entries = driver.load_entries_by_ids(["foo", "bar"], namespace="foobar")
+
+        driver.index.fetch.assert_called_once_with(ids=["foo", "bar"], namespace="foobar")
+        assert entries[0] is None
+        assert entries[1].id == "bar"
+        assert entries[1].namespace == "foobar"
+        assert driver.entries_exist(["foo", "bar"], namespace="foobar") == [False, True]
@@ -1,8 +1,10 @@
+import asyncio
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.drivers.vector.qdrant import QdrantVectorStoreDriver
 from griptape.utils import import_optional_dependency
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
@@ -129,6 +131,29 @@ class TestQdrantVectorStoreDriver:
             driver.client.upsert.assert_called_once_with(collection_name=driver.collection_name, points=mock_batch)
             assert result == vector_id
 
+    def test_upsert_vectors(self, driver):
+        vector_id = str(uuid.uuid4())
+        entries = [
+            BaseVectorStoreDriver.Entry(id=vector_id, vector=[0.1, 0.2, 0.3], meta={"meta_key": "meta_value"}),
+            BaseVectorStoreDriver.Entry(id="", vector=[0.3, 0.2, 0.1]),
+        ]
+
+        with patch("griptape.drivers.vector.qdrant_vector_store_driver.import_optional_dependency") as mock_import:
+            mock_batch = MagicMock()
+            mock_import.return_value.Batch.return_value = mock_batch
+            driver.client = MagicMock()
+
+            result = driver.upsert_vectors(entries)
+
+            generated_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, str([0.3, 0.2, 0.1])))
+            mock_import.return_value.Batch.assert_called_once_with(
+                ids=[vector_id, generated_id],
+                vectors=[[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]],
+                payloads=[{"meta_key": "meta_value"}, {}],
+            )
+            driver.client.upsert.assert_called_once_with(collection_name=driver.collection_name, points=mock_batch)
+            assert result == [vector_id, generated_id]
+
     def test_load_entry(self, driver):
         vector_id = str(uuid.uuid4())
         mock_entry = MagicMock()
@@ -175,3 +200,93 @@ class TestQdrantVectorStoreDriver:
             assert results[1].id == "id2"
             assert results[1].vector == [0.4, 0.5, 0.6]
             assert results[1].meta == {"key2": "value2"}
+
+    def test_export_entries(self, driver):
+        driver.client = MagicMock()
+        driver.client.scroll.side_effect = [
+            ([MagicMock(id="id1", vector=[0.1], payload={"key": "value1", "_score": 0.99})], "id2"),
+            ([MagicMock(id="id2", vector=[0.2], payload={"key": "value2"})], None),
+        ]
+
+        entries = list(driver.export_entries(batch_size=1))
+
+        assert [entry.id for entry in entries] == ["id1", "id2"]
+        assert entries[0].meta == {"key": "value1"}
+        assert [call.kwargs["offset"] for call in driver.client.scroll.call_args_list] == [None, "id2"]
+        assert driver.client.scroll.call_args.kwargs["limit"] == 1
+        assert driver.client.scroll.call_args.kwargs["with_vectors"] is True
+
+    def test_load_entries_by_ids(self, driver):
+        mock_entry = MagicMock(id="id2", vector=[0.1, 0.2, 0.3], payload={"key": "value", "_score": 0.99})
+
+        with patch.object(driver.client, "retrieve", return_value=[mock_entry]) as mock_retrieve:
+            results = driver.load_entries_by_ids(["id1", "id2"])
+
+            mock_retrieve.assert_called_once_with(collection_name=driver.collection_name, ids=["id1", "id2"])
+            assert results[0] is None
+            assert results[1].id == "id2"
+            assert results[1].vector == [0.1, 0.2, 0.3]
+            assert results[1].meta == {"key": "value"}
+
+    def test_entries_exist(self, driver):
+        with patch.object(driver.client, "retrieve", return_value=[MagicMock(id="id2")]) as mock_retrieve:
+            assert driver.entries_exist(["id1", "id2"]) == [False, True]
+
+            mock_retrieve.assert_called_once_with(
+                collection_name=driver.collection_name, ids=["id1", "id2"], with_payload=False, with_vectors=False
+            )
+
+    def test_query_vectors(self, driver):
+        models = import_optional_dependency("qdrant_client.http.models")
+        mock_responses = [
+            MagicMock(points=[MagicMock(id="foo", vector=[0, 1], score=42, payload={"foo": "bar", "_score": 0.99})]),
+            MagicMock(points=[]),
+        ]
+
+        with patch.object(driver.client, "query_batch_points", return_value=mock_responses) as mock_query_batch:
+            results = driver.query_vectors([[0.1, 0.2], [0.2, 0.1]], count=10, include_vectors=True)
+
+            mock_query_batch.assert_called_once_with(
+                collection_name=driver.collection_name,
+                requests=[
+                    models.QueryRequest(query=[0.1, 0.2], limit=10, with_payload=True, with_vector=True),
+                    models.QueryRequest(query=[0.2, 0.1], limit=10, with_payload=True, with_vector=True),
+                ],
+            )
+            assert len(results) == 2
+            assert results[0][0].id == "foo"
+            assert results[0][0].vector == [0, 1]
+            assert results[0][0].score == 42
+            assert results[0][0].meta == {"foo": "bar"}
+            assert results[1] == []
+
+    def test_aquery_vector(self, driver):
+        driver.async_client = MagicMock()
+        driver.async_client.query_points = AsyncMock(
+            return_value=MagicMock(points=[MagicMock(id="foo", vector=[0, 1, 0], score=42, payload={"foo": "bar"})])
+        )
+
+        results = asyncio.run(driver.aquery_vector([0.1, 0.2, 0.3], count=10, include_vectors=True))
+
+        driver.async_client.query_points.assert_awaited_once_with(
+            collection_name=driver.collection_name,
+            query=[0.1, 0.2, 0.3],
+            with_payload=True,
+            with_vectors=True,
+            limit=10,
+        )
+        assert results == [BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1, 0], score=42, meta={"foo": "bar"})]
+
+    def test_aupsert_vectors(self, driver):
+        vector_id = str(uuid.uuid4())
+        driver.async_client = MagicMock()
+        driver.async_client.upsert = AsyncMock()
+
+        with patch("griptape.drivers.vector.qdrant_vector_store_driver.import_optional_dependency") as mock_import:
+            mock_batch = MagicMock()
+            mock_import.return_value.Batch.return_value = mock_batch
+
+            result = asyncio.run(driver.aupsert_vectors([BaseVectorStoreDriver.Entry(id=vector_id, vector=[0.1])]))
+
+        driver.async_client.upsert.assert_awaited_once_with(collection_name=driver.collection_name, points=mock_batch)
+        assert result == [vector_id]
@@ -1,7 +1,11 @@
-from unittest.mock import MagicMock
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from griptape.artifacts import TextArtifact
+from griptape.drivers.vector import BaseVectorStoreDriver
 from griptape.drivers.vector.redis import RedisVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
@@ -12,9 +16,12 @@ class TestRedisVectorStorageDriver:
         return mocker.patch("redis.Redis").return_value
 
     @pytest.fixture()
-    def mock_keys(self, mock_client):
-        mock_client.keys.return_value = [b"some_vector_id"]
-        return mock_client.keys
+    def mock_scan(self, mock_client):
+        mock_client.scan_iter.return_value = iter([b"some_namespace:some_vector_id"])
+        mock_client.pipeline.return_value.execute.return_value = [
+            [b"some_namespace", b'{"foo": "bar"}', b"\x00\x00\x80?\x00\x00\x00@\x00\x00@@"]
+        ]
+        return mock_client.scan_iter
 
     @pytest.fixture()
     def mock_hgetall(self, mock_client):
@@ -62,22 +69,73 @@ class TestRedisVectorStorageDriver:
         assert entry.vector == [1.0, 2.0, 3.0]
         assert entry.meta == {"foo": "bar"}
 
-    def test_load_entries(self, driver, mock_keys, mock_hgetall):
+    def test_load_entries(self, driver, mock_client, mock_scan):
         entries = driver.load_entries()
-        mock_keys.assert_called_once_with("*")
-        mock_hgetall.assert_called_once_with("some_vector_id")
+        mock_scan.assert_called_once_with(match="*", count=driver.scan_batch_size)
+        mock_client.pipeline.return_value.hmget.assert_called_once_with(
+            b"some_namespace:some_vector_id", ["namespace", "metadata", "vector"]
+        )
+        mock_client.keys.assert_not_called()
+        mock_client.hgetall.assert_not_called()
         assert len(entries) == 1
+        assert entries[0].id == "some_vector_id"
+        assert entries[0].namespace == "some_namespace"
         assert entries[0].vector == [1.0, 2.0, 3.0]
         assert entries[0].meta == {"foo": "bar"}
 
-    def test_load_entries_with_namespace(self, driver, mock_keys, mock_hgetall):
+    def test_load_entries_with_namespace(self, driver, mock_scan):
         entries = driver.load_entries(namespace="some_namespace")
-        mock_keys.assert_called_once_with("some_namespace:*")
-        mock_hgetall.assert_called_once_with("some_namespace:some_vector_id")
+        mock_scan.assert_called_once_with(match="some_namespace:*", count=driver.scan_batch_size)
         assert len(entries) == 1
+        assert entries[0].id == "some_vector_id"
         assert entries[0].vector == [1.0, 2.0, 3.0]
         assert entries[0].meta == {"foo": "bar"}
 
+    def test_load_entries_without_vectors(self, driver, mock_client, mock_scan):
+        mock_client.pipeline.return_value.execute.return_value = [[b"some_namespace", b'{"foo": "bar"}']]
+
+        entries = driver.load_entries(namespace="some_namespace", include_vectors=False)
+
+        mock_client.pipeline.return_value.hmget.assert_called_once_with(
+            b"some_namespace:some_vector_id", ["namespace", "metadata"]
+        )
+        assert entries[0].vector is None
+        assert entries[0].meta == {"foo": "bar"}
+
+    def test_iter_entries(self, mock_client):
+        driver = RedisVectorStoreDriver(
+            host="localhost", port=6379, index="test_index", embedding_driver=MockEmbeddingDriver(), scan_batch_size=2
+        )
+        pipeline = mock_client.pipeline.return_value
+        mock_client.scan_iter.return_value = iter([b"foo", b"bar", b"foo", b"baz"])
+        pipeline.execute.side_effect = [[[None, b"{}"], [None, None]], [[None, b"{}"]]]
+
+        entries = driver.iter_entries(include_vectors=False)
+
+        assert next(entries).id == "foo"
+        assert pipeline.execute.call_count == 1
+        assert [entry.id for entry in entries] == ["baz"]
+        assert [call.args[0] for call in pipeline.hmget.call_args_list] == [b"foo", b"bar", b"baz"]
+
+    def test_export_entries(self, driver, mock_client, mock_scan):
+        entries = list(driver.export_entries(namespace="some_namespace", batch_size=10))
+
+        mock_scan.assert_called_once_with(match="some_namespace:*", count=10)
+        assert entries[0].id == "some_vector_id"
+        assert entries[0].vector == [1.0, 2.0, 3.0]
+
+    def test_load_artifacts(self, driver, mock_client, mock_scan):
+        mock_client.pipeline.return_value.execute.return_value = [
+            [b"some_namespace", json.dumps({"artifact": TextArtifact("foo").to_json()}).encode()]
+        ]
+
+        artifacts = driver.load_artifacts(namespace="some_namespace")
+
+        assert [artifact.value for artifact in artifacts.value] == ["foo"]
+        mock_client.pipeline.return_value.hmget.assert_called_once_with(
+            b"some_namespace:some_vector_id", ["namespace", "metadata"]
+        )
+
     def test_query_vector(self, driver, mock_search):
         results = driver.query_vector([0.0, 0.5])
         mock_search.assert_called_once()
@@ -117,3 +175,112 @@ class TestRedisVectorStorageDriver:
         assert results[0].score == 0.456198036671
         assert results[0].meta == {"foo": "bar"}
         assert results[0].vector == [1.0, 2.0, 3.0]
+
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+
+        vector_ids = driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 2.0], namespace="some_namespace"),
+                BaseVectorStoreDriver.Entry(id="", vector=[2.0, 1.0], meta={"foo": "bar"}),
+            ]
+        )
+
+        assert vector_ids[0] == "foo"
+        assert pipeline.hset.call_count == 2
+        assert pipeline.hset.call_args_list[0].args[0] == "some_namespace:foo"
+        assert pipeline.hset.call_args_list[1].args[0] == vector_ids[1]
+        assert pipeline.hset.call_args_list[1].kwargs["mapping"]["metadata"] == '{"foo": "bar"}'
+        pipeline.execute.assert_called_once()
+        mock_client.hset.assert_not_called()
+
+    def test_entries_exist(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [1, 0]
+
+        assert driver.entries_exist(["foo", "bar"], namespace="some_namespace") == [True, False]
+        assert [call.args[0] for call in pipeline.exists.call_args_list] == ["some_namespace:foo", "some_namespace:bar"]
+        mock_client.hgetall.assert_not_called()
+
+    def test_does_entry_exist(self, driver, mock_client):
+        mock_client.exists.return_value = 1
+
+        assert driver.does_entry_exist("foo", namespace="some_namespace") is True
+        mock_client.exists.assert_called_once_with("some_namespace:foo")
+        mock_client.hgetall.assert_not_called()
+
+    def test_load_entries_by_ids(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [{}, {b"vector": b"\x00\x00\x80?\x00\x00\x00@", b"metadata": b'{"foo": "bar"}'}]
+
+        entries = driver.load_entries_by_ids(["foo", "bar"], namespace="some_namespace")
+
+        assert entries[0] is None
+        assert entries[1].id == "bar"
+        assert entries[1].vector == [1.0, 2.0]
+        assert entries[1].meta == {"foo": "bar"}
+        assert entries[1].namespace == "some_namespace"
+        pipeline.execute.assert_called_once()
+
+    def test_query_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [
+            [
+                1,
+                b"some_namespace:foo",
+                [b"score", b"0.25", b"metadata", b'{"foo": "bar"}', b"vec_string", b"[1.0, 2.0]"],
+            ],
+            [0],
+        ]
+
+        results = driver.query_vectors([[1.0, 2.0], [2.0, 1.0]], count=5, include_vectors=True)
+
+        assert pipeline.execute_command.call_count == 2
+        assert pipeline.execute_command.call_args_list[0].args[:3] == (
+            "FT.SEARCH",
+            "test_index",
+            "*=>[KNN 5 @vector $vector as score]",
+        )
+        assert results[0][0].id == "foo"
+        assert results[0][0].namespace == "some_namespace"
+        assert results[0][0].score == 0.25
+        assert results[0][0].meta == {"foo": "bar"}
+        assert results[0][0].vector == [1.0, 2.0]
+        assert results[1] == []
+        mock_client.ft.return_value.search.assert_not_called()
+
+    def test_aupsert_vectors(self, driver, mocker):
+        pipeline = mocker.patch("redis.asyncio.Redis").return_value.pipeline.return_value
+        pipeline.execute = AsyncMock()
+
+        vector_ids = asyncio.run(
+            driver.aupsert_vectors(
+                [BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 2.0], namespace="some_namespace")]
+            )
+        )
+
+        assert vector_ids == ["foo"]
+        assert pipeline.hset.call_args.args[0] == "some_namespace:foo"
+        pipeline.execute.assert_awaited_once()
+
+    def test_aquery_vector(self, driver, mocker):
+        search = mocker.patch("redis.asyncio.Redis").return_value.ft.return_value.search = AsyncMock(
+            return_value=MagicMock(
+                docs=[
+                    MagicMock(
+                        id="some_namespace:some_vector_id",
+                        score="0.456198036671",
+                        metadata='{"foo": "bar"}',
+                        vec_string="[1.0, 2.0, 3.0]",
+                    )
+                ]
+            )
+        )
+
+        results = asyncio.run(driver.aquery_vector([0.0, 0.5], include_vectors=True))
+
+        search.assert_awaited_once()
+        assert results[0].id == "some_vector_id"
+        assert results[0].namespace == "some_namespace"
+        assert results[0].meta == {"foo": "bar"}
+        assert results[0].vector == [1.0, 2.0, 3.0]
@@ -0,0 +1,135 @@
+from unittest.mock import patch
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers.embedding.dummy import DummyEmbeddingDriver
+from griptape.drivers.vector.local import LocalVectorStoreDriver
+from griptape.engines.rag import RagContext
+from griptape.engines.rag.modules import VectorStoreRetrievalRagModule
+from griptape.engines.rag.stages import RetrievalRagStage
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestRetrievalRagStage:
+    @pytest.fixture()
+    def vector_store_driver(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")], "bar": [TextArtifact("bar")]})
+
+        return driver
+
+    def test_run(self, vector_store_driver):
+        stage = RetrievalRagStage(
+            retrieval_modules=[
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver, query_params={"namespace": "foo"}
+                ),
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=LocalVectorStoreDriver(
+                        embedding_driver=MockEmbeddingDriver(), entries=vector_store_driver.entries
+                    ),
+                    query_params={"namespace": "bar"},
+                ),
+            ]
+        )
+
+        with patch.object(vector_store_driver, "query", wraps=vector_store_driver.query) as query:
+            context = stage.run(RagContext(query="test"))
+
+        query.assert_called_once_with("test", namespace="foo")
+        assert [a.value for a in context.text_chunks] == ["foo", "bar"]
+
+    def test_run_batches_modules_sharing_a_driver(self, vector_store_driver, mocker):
+        stage = RetrievalRagStage(
+            retrieval_modules=[
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver,
+                    query_params={"namespace": "bar", "count": 1},
+                    process_query_output=lambda es: [TextArtifact(f"{e.to_artifact().value}-1") for e in es],
+                ),
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver, query_params={"namespace": "foo"}
+                ),
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver,
+                    query_params={"namespace": "bar", "count": 2},
+                    process_query_output=lambda es: [TextArtifact(f"{e.to_artifact().value}-2") for e in es],
+                ),
+            ]
+        )
+        embedding_driver = vector_store_driver.embedding_driver
+        embed_string = mocker.patch.object(embedding_driver, "embed_string", wraps=embedding_driver.embed_string)
+        query_vector = mocker.patch.object(vector_store_driver, "query_vector", wraps=vector_store_driver.query_vector)
+
+        context = stage.run(RagContext(query="test"))
+
+        embed_string.assert_called_once_with("test")
+        assert sorted((call.kwargs["namespace"], call.kwargs["count"]) for call in query_vector.call_args_list) == [
+            ("bar", 2),
+            ("foo", None),
+        ]
+        assert [a.value for a in context.text_chunks] == ["bar-1", "foo", "bar-2"]
+
+    def test_run_doesnt_batch_modules_overriding_run(self, vector_store_driver):
+        class CustomRetrievalRagModule(VectorStoreRetrievalRagModule):
+            def run(self, context: RagContext) -> list[TextArtifact]:
+                return [TextArtifact("custom")]
+
+        stage = RetrievalRagStage(
+            retrieval_modules=[
+                CustomRetrievalRagModule(vector_store_driver=vector_store_driver),
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver, query_params={"namespace": "foo"}
+                ),
+            ]
+        )
+
+        context = stage.run(RagContext(query="test"))
+
+        assert [a.value for a in context.text_chunks] == ["custom", "foo"]
+
+    def test_run_doesnt_batch_drivers_overriding_query(self, vector_store_driver):
+        class TextSearchVectorStoreDriver(LocalVectorStoreDriver):
+            def query(self, query: str, *, count=None, namespace=None, **kwargs):
+                return self.load_entries(namespace=namespace)[:count]
+
+        driver = TextSearchVectorStoreDriver(
+            embedding_driver=DummyEmbeddingDriver(), entries=vector_store_driver.entries
+        )
+        stage = RetrievalRagStage(
+            retrieval_modules=[
+                VectorStoreRetrievalRagModule(vector_store_driver=driver, query_params={"namespace": "foo"}),
+                VectorStoreRetrievalRagModule(vector_store_driver=driver, query_params={"namespace": "bar"}),
+            ]
+        )
+
+        context = stage.run(RagContext(query="test"))
+
+        assert [a.value for a in context.text_chunks] == ["foo", "bar"]
+
+    def test_run_batches_with_query_cache(self, vector_store_driver, mocker):
+        vector_store_driver.query_cache_size = 10
+        stage = RetrievalRagStage(
+            retrieval_modules=[
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver, query_params={"namespace": "foo", "count": 1}
+                ),
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver, query_params={"namespace": "foo", "count": 2}
+                ),
+                VectorStoreRetrievalRagModule(
+                    vector_store_driver=vector_store_driver, query_params={"namespace": "bar"}
+                ),
+            ]
+        )
+        query = mocker.patch.object(vector_store_driver, "query", wraps=vector_store_driver.query)
+        query_vector = mocker.patch.object(vector_store_driver, "query_vector", wraps=vector_store_driver.query_vector)
+
+        first_context = stage.run(RagContext(query="test"))
+        second_context = stage.run(RagContext(query="test"))
+
+        assert query.call_count == 4
+        assert query_vector.call_count == 2
+        assert [a.value for a in first_context.text_chunks] == ["foo", "bar"]
+        assert [a.value for a in second_context.text_chunks] == ["foo", "bar"]
@@ -55,3 +55,30 @@ class TestAnthropicTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    @pytest.mark.parametrize(
+        ("model", "characters_per_token"),
+        [("claude-2.1", 3.8), ("claude-instant-1.2", 3.8), ("claude-3-opus", 3.5), ("claude-sonnet-4", 3.5)],
+    )
+    def test_local_tokenizer_calibration(self, model, characters_per_token):
+        tokenizer = AnthropicTokenizer(model=model)
+
+        assert tokenizer.local_tokenizer.characters_per_token == characters_per_token
+        assert tokenizer.local_tokenizer.safety_margin == AnthropicTokenizer.DEFAULT_SAFETY_MARGIN
+
+    def test_token_count_local(self, mock_client):
+        tokenizer = AnthropicTokenizer(model="claude-3-haiku", count_mode="local")
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 5
+        assert tokenizer.count_tokens([{"role": "user", "content": "foo bar huzzah"}]) == 5
+        assert tokenizer.count_tokens([{"role": "user", "content": [{"type": "text", "text": "foo"}]}]) == 1
+        assert tokenizer.count_input_tokens_left("foo bar huzzah") == 199995
+        mock_client.assert_not_called()
+
+    def test_token_count_mode_override(self, mock_client):
+        tokenizer = AnthropicTokenizer(model="claude-3-haiku")
+
+        assert tokenizer.count_tokens("foo bar huzzah foo bar huzzah", count_mode="local") == 10
+        mock_client.assert_not_called()
+        assert tokenizer.count_tokens("foo bar huzzah foo bar huzzah") == 5
+        mock_client.assert_called_once()
@@ -1,4 +1,5 @@
 import pytest
+import tiktoken
 
 from griptape.tokenizers import OpenAiTokenizer
 
@@ -105,3 +106,76 @@ class TestOpenAiTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    @pytest.fixture()
+    def byte_encoding(self, mocker):
+        encoding = tiktoken.Encoding(
+            name="bytes", pat_str=r"\S+|\s+", mergeable_ranks={bytes([i]): i for i in range(256)}, special_tokens={}
+        )
+        OpenAiTokenizer._model_encodings.clear()
+
+        yield mocker.patch("tiktoken.encoding_for_model", return_value=encoding)
+
+        OpenAiTokenizer._model_encodings.clear()
+
+    def test_encoding_is_cached_per_model(self, byte_encoding):
+        first = OpenAiTokenizer(model="gpt-4o")
+        second = OpenAiTokenizer(model="gpt-4o")
+
+        assert first.encoding is second.encoding
+        assert first.count_tokens("foo") == 3
+        assert second.count_tokens("bar") == 3
+        byte_encoding.assert_called_once_with("gpt-4o")
+
+    def test_encoding_for_unknown_model_is_cached(self, byte_encoding, mocker):
+        byte_encoding.side_effect = KeyError("not-a-real-model")
+        get_encoding = mocker.patch("tiktoken.get_encoding")
+
+        tokenizer = OpenAiTokenizer(model="not-a-real-model")
+
+        assert tokenizer.encoding is get_encoding.return_value
+        assert tokenizer.encoding is get_encoding.return_value
+        byte_encoding.assert_called_once_with("not-a-real-model")
+        get_encoding.assert_called_with(OpenAiTokenizer.DEFAULT_ENCODING)
+
+    def test_count_tokens_with_cache(self, byte_encoding):
+        tokenizer = OpenAiTokenizer(model="gpt-4o", token_count_cache_size=2)
+
+        assert tokenizer.count_tokens("foo") == 3
+        assert tokenizer.count_tokens("foo") == 3
+        assert tokenizer.count_tokens("foobar") == 6
+        assert tokenizer.count_tokens("foo bar") == 7
+        assert list(tokenizer._token_count_cache.values()) == [6, 7]
+
+        tokenizer.clear_token_count_cache()
+
+        assert len(tokenizer._token_count_cache) == 0
+
+    def test_count_tokens_with_cache_skips_encoding(self, byte_encoding, mocker):
+        tokenizer = OpenAiTokenizer(model="gpt-4o", token_count_cache_size=10)
+        encode = mocker.spy(byte_encoding.return_value, "encode")
+
+        tokenizer.count_tokens("foo")
+        tokenizer.count_tokens("foo")
+
+        assert encode.call_count == 1
+
+    def test_count_tokens_batch(self, byte_encoding):
+        tokenizer = OpenAiTokenizer(model="gpt-4o")
+
+        assert tokenizer.count_tokens_batch(["foo", "foo bar", ""]) == [3, 7, 0]
+
+    def test_count_tokens_batch_with_cache(self, byte_encoding, mocker):
+        tokenizer = OpenAiTokenizer(model="gpt-4o", token_count_cache_size=10)
+        tokenizer.count_tokens("foo")
+        encode_batch = mocker.spy(byte_encoding.return_value, "encode_batch")
+
+        assert tokenizer.count_tokens_batch(["foo", "foo bar", "foo bar"]) == [3, 7, 7]
+        encode_batch.assert_called_once_with(["foo bar"], allowed_special=set())
+        assert tokenizer.count_tokens_batch(["foo bar"]) == [7]
+        assert encode_batch.call_count == 1
+
+    def test_token_offsets(self, byte_encoding):
+        tokenizer = OpenAiTokenizer(model="gpt-4o")
+
+        assert tokenizer.token_offsets("foo bar") == [0, 1, 2, 3, 4, 5, 6]
@@ -16,3 +16,15 @@ class TestSimpleTokenizer:
 
     def test_output_tokens_left(self, tokenizer):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == 4093
+
+    def test_token_count_with_fractional_characters_per_token(self):
+        tokenizer = SimpleTokenizer(characters_per_token=3.5)
+
+        assert tokenizer.count_tokens("foo bar") == 2
+        assert tokenizer.count_tokens("foo bar huzzah") == 4
+
+    def test_token_count_with_safety_margin(self):
+        tokenizer = SimpleTokenizer(characters_per_token=4, safety_margin=0.5)
+
+        assert tokenizer.count_tokens("foo bar") == 3
+        assert tokenizer.count_tokens("") == 0